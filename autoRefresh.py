@@ -0,0 +1,122 @@
+# autoRefresh.py
+"""
+Takip edilen şehirleri belirli aralıklarla yeniden çektiren zamanlayıcı. Her şehrin zamanlayıcısı
+ayrıdır ve jitter'lıdır; veri değişmedikçe aralık uzar, pencere gizliyken yenileme yapılmaz.
+"""
+
+import random
+
+from konumBazli import normalize_city_key
+from config import AUTO_REFRESH_INTERVAL, AUTO_REFRESH_JITTER, AUTO_REFRESH_MAX_INTERVAL
+
+# Pencere yeniden göründüğünde birikmiş yenilemeler bu süreye (ms) yayılır
+RESUME_SPREAD_MS = 5000
+
+
+class _Tracked:
+    __slots__ = ("city", "interval", "after_id", "due")
+
+    def __init__(self, city, interval):
+        self.city = city
+        self.interval = interval
+        self.after_id = None
+        self.due = False
+
+
+class AutoRefresher:
+    """
+    Zamanı gelen şehir için `refresh(city)` çağırır; `refresh` yalnızca isteği başlatmalı, beklememelidir.
+    Zamanlama `schedule(delay_ms, fn) -> id` ve `cancel(id)` ile yapılır (Tk'da master.after ve
+    master.after_cancel); böylece tüm çağrılar arayüz thread'inde kalır.
+
+    Sonuç geldiğinde report(city, changed) çağrılmalıdır: veri değiştiyse aralık `interval`'a döner,
+    değişmediyse ya da çekim başarısızsa ikiye katlanır (en fazla `max_interval`). Sonuç hiç gelmezse
+    (istek iptal edildiyse) şehir mevcut aralıkla yenilenmeye devam eder.
+    """
+    def __init__(self, schedule, cancel, refresh, interval=AUTO_REFRESH_INTERVAL, jitter=AUTO_REFRESH_JITTER,
+                 max_interval=AUTO_REFRESH_MAX_INTERVAL, rng=None):
+        self._schedule = schedule
+        self._cancel = cancel
+        self._refresh = refresh
+        self.interval = interval
+        self.jitter = jitter
+        self.max_interval = max(max_interval, interval)
+        self.paused = False
+        self._tracked = {}  # normalize_city_key -> _Tracked
+        self._rng = rng or random.Random()
+
+    @property
+    def enabled(self):
+        return self.interval > 0
+
+    def tracked(self):
+        return [entry.city for entry in self._tracked.values()]
+
+    def _delay_ms(self, interval):
+        spread = interval * self.jitter
+        return int(self._rng.uniform(interval - spread, interval + spread) * 1000)
+
+    def _arm(self, key, delay_ms):
+        entry = self._tracked[key]
+        if entry.after_id is not None:
+            self._cancel(entry.after_id)
+        entry.after_id = self._schedule(delay_ms, lambda: self._fire(key))
+
+    def _fire(self, key):
+        entry = self._tracked.get(key)
+        if entry is None:
+            return
+        entry.after_id = None
+        if self.paused:
+            # Gizliyken çekim yapılmaz; pencere göründüğünde resume() yeniler
+            entry.due = True
+            return
+        entry.due = False
+        # Sonraki yenileme şimdiden kurulur; report() gelirse yeni aralıkla yeniden kurulur
+        self._arm(key, self._delay_ms(entry.interval))
+        self._refresh(entry.city)
+
+    def track(self, city):
+        """Şehri takibe alır; ilk yenileme bir aralık sonradır (şehir az önce çekilmiş sayılır)."""
+        if not self.enabled:
+            return
+        key = normalize_city_key(city)
+        if key in self._tracked:
+            self._tracked[key].city = city
+            return
+        self._tracked[key] = _Tracked(city, self.interval)
+        self._arm(key, self._delay_ms(self.interval))
+
+    def untrack(self, city):
+        entry = self._tracked.pop(normalize_city_key(city), None)
+        if entry is not None and entry.after_id is not None:
+            self._cancel(entry.after_id)
+
+    def is_tracked(self, city):
+        return normalize_city_key(city) in self._tracked
+
+    def report(self, city, changed):
+        entry = self._tracked.get(normalize_city_key(city))
+        if entry is None:
+            return
+        interval = self.interval if changed else min(entry.interval * 2, self.max_interval)
+        if interval != entry.interval:
+            entry.interval = interval
+            if entry.after_id is not None:
+                self._arm(normalize_city_key(city), self._delay_ms(interval))
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        if not self.paused:
+            return
+        self.paused = False
+        for key, entry in self._tracked.items():
+            if entry.due:
+                entry.due = False
+                self._arm(key, int(self._rng.uniform(0, RESUME_SPREAD_MS)))
+
+    def stop(self):
+        for city in self.tracked():
+            self.untrack(city)
@@ -0,0 +1,192 @@
+# batchCli.py
+"""
+Ekransız toplu yenileme aracı. Şehir adlarını bir dosyadan ya da stdin'den okur, sınırlı
+eşzamanlılıkla çeker ve her sonucu tamamlandıkça bir JSON satırı (JSON Lines) olarak yazar.
+
+    python batchCli.py sehirler.txt -o sonuclar.jsonl --checkpoint sonuclar.done
+    cat sehirler.txt | python batchCli.py - --concurrency 32 > sonuclar.jsonl
+
+Girdi dosyasında her satır bir şehir adıdır; boş satırlar ve # ile başlayanlar atlanır,
+aynı şehrin tekrarları (büyük/küçük harf ve aksan farkı gözetmeksizin) bir kez çekilir.
+"40.1826, 29.0665" biçimindeki satırlar geocoding yapılmadan koordinat olarak çekilir.
+
+--checkpoint verildiğinde başarıyla yazılan her şehir bu dosyaya eklenir. Yarıda kesilen bir
+çalıştırma aynı komutla yeniden başlatıldığında bu şehirler atlanır ve çıktı dosyasına eklemeye
+devam edilir. Başarısız şehirler işaretlenmez; sonraki çalıştırmada yeniden denenir. Çekim başarısız
+olduğunda arayüzün kayıtlı verisine düşülmez; şehir hata olarak yazılır.
+
+Çalıştırma sonunda verim ve gecikme özeti stderr'e yazılır. --metrics ile uç nokta başına istek
+süreleri, yeniden denemeler ve önbellek sayaçları da dosyaya yazılır (.prom uzantısında Prometheus metni).
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from konumBazli import AsyncWeatherAPI, normalize_city_key
+import metrics
+from config import API_UNITS, API_LANG, ASYNC_MAX_CONCURRENCY
+
+# Yarıda kesilen çalıştırmanın çıkış kodu (SIGINT geleneği)
+EXIT_INTERRUPTED = 130
+
+
+def read_city_names(lines, skip_keys=()):
+    """Satırlardan şehir adlarını tembel olarak üretir; boş, yorum, tekrar ve `skip_keys` içindekileri atlar."""
+    seen = set(skip_keys)
+    for line in lines:
+        name = line.strip()
+        if not name or name.startswith("#"):
+            continue
+        key = normalize_city_key(name)
+        if key in seen:
+            continue
+        seen.add(key)
+        yield name
+
+
+def load_checkpoint(path):
+    """Checkpoint dosyasındaki (tamamlanmış) şehir anahtarlarını döndürür; dosya yoksa boş küme."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return {line.rstrip("\n") for line in f if line.strip()}
+    except FileNotFoundError:
+        return set()
+
+
+def result_record(result, full=False):
+    """WeatherResult'ı çıktıya yazılacak sözlüğe çevirir. `full` ise /onecall yanıtının tamamı eklenir."""
+    record = {
+        "city": result.requested_city,
+        "name": result.display_name,
+        "ok": result.ok,
+        "elapsed_ms": round(result.elapsed * 1000, 1),
+        "fetched_at": int(time.time()),
+    }
+    if not result.ok:
+        record["error"] = result.error
+        return record
+    if result.is_snapshot:
+        # Veri bu çalıştırmada çekilmedi; ne zaman kaydedildiği ayrıca yazılır
+        record["stored_at"] = int(result.stored_at)
+    if full:
+        record["weather"] = result.weather
+        return record
+    current = result.weather["current"]
+    weather = (current.get("weather") or [{}])[0]
+    record["current"] = {
+        "dt": current.get("dt"),
+        "temp": current.get("temp"),
+        "feels_like": current.get("feels_like"),
+        "humidity": current.get("humidity"),
+        "pressure": current.get("pressure"),
+        "wind_speed": current.get("wind_speed"),
+        "description": weather.get("description"),
+        "icon": weather.get("icon"),
+    }
+    record["timezone_offset"] = result.weather.get("timezone_offset")
+    return record
+
+
+class RunStats:
+    """Toplu çalıştırmanın sayaçları ve gecikmeleri."""
+    def __init__(self, skipped=0):
+        self.started = time.perf_counter()
+        self.ok = 0
+        self.failed = 0
+        self.skipped = skipped
+        self.latencies = []
+
+    def add(self, result):
+        if result.ok:
+            self.ok += 1
+        else:
+            self.failed += 1
+        self.latencies.append(result.elapsed)
+
+    def _percentile(self, values, p):
+        return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+    def summary(self, interrupted=False):
+        elapsed = time.perf_counter() - self.started
+        done = self.ok + self.failed
+        lines = [
+            f"{'Yarıda kesildi' if interrupted else 'Tamamlandı'}: {done} şehir {elapsed:.2f} s içinde "
+            f"({done / elapsed if elapsed else 0:.1f} şehir/s), başarılı {self.ok}, hatalı {self.failed}, "
+            f"checkpoint'ten atlanan {self.skipped}"
+        ]
+        if self.latencies:
+            values = sorted(self.latencies)
+            p50, p90, p99 = (self._percentile(values, p) * 1000 for p in (50, 90, 99))
+            lines.append(f"Gecikme (ms): p50 {p50:.1f}, p90 {p90:.1f}, p99 {p99:.1f}, max {values[-1] * 1000:.1f}")
+        return "\n".join(lines)
+
+
+async def run(names, output, checkpoint=None, concurrency=ASYNC_MAX_CONCURRENCY, full=False, stats=None, **api_kwargs):
+    """
+    `names` içindeki şehirleri çeker ve her sonucu `output`a bir JSON satırı olarak yazar.
+    Satır diske yazıldıktan sonra şehir `checkpoint`a eklenir; kesintide en fazla birkaç
+    şehir iki kez yazılabilir ama hiçbiri kaybolmaz.
+    """
+    stats = stats if stats is not None else RunStats()
+    async with AsyncWeatherAPI(max_concurrency=concurrency, **api_kwargs) as client:
+        async for result in client.get_weather_for_cities(names):
+            output.write(json.dumps(result_record(result, full), ensure_ascii=False, separators=(",", ":")) + "\n")
+            output.flush()
+            # Kayıtlı (eski) veriyle dönen şehir tamamlanmış sayılmaz; sonraki çalıştırmada yeniden çekilir
+            if checkpoint is not None and result.ok and not result.is_snapshot:
+                checkpoint.write(normalize_city_key(result.requested_city) + "\n")
+                checkpoint.flush()
+            stats.add(result)
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", nargs="?", default="-", help="Şehir listesi dosyası; '-' ya da verilmezse stdin")
+    parser.add_argument("-o", "--output", help="JSON Lines çıktı dosyası (eklenir); verilmezse stdout")
+    parser.add_argument("--checkpoint", help="Tamamlanan şehirlerin kaydedildiği dosya; yeniden başlatmada bunlar atlanır")
+    parser.add_argument("--concurrency", type=int, default=ASYNC_MAX_CONCURRENCY, help="Aynı anda yapılacak en fazla istek")
+    parser.add_argument("--units", default=API_UNITS, choices=["metric", "imperial", "standard"], help="Çıktı birimleri")
+    parser.add_argument("--lang", default=API_LANG, help="Hava durumu açıklamalarının dili")
+    parser.add_argument("--full", action="store_true", help="Yalnızca güncel durumu değil, /onecall yanıtının tamamını yaz")
+    parser.add_argument("--metrics", help="Çalıştırma sonunda ölçümlerin yazılacağı dosya (JSON ya da .prom)")
+    args = parser.parse_args(argv)
+    if args.metrics:
+        metrics.enable()
+
+    done_keys = load_checkpoint(args.checkpoint) if args.checkpoint else set()
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    output = sys.stdout if args.output is None else open(args.output, "a", encoding="utf-8")
+    checkpoint = open(args.checkpoint, "a", encoding="utf-8") if args.checkpoint else None
+
+    # Atlanan şehirler girdi tüketilirken sayılır; girdi belleğe alınmaz
+    stats = RunStats()
+
+    def names():
+        for name in read_city_names(source):
+            if normalize_city_key(name) in done_keys:
+                stats.skipped += 1
+            else:
+                yield name
+
+    interrupted = False
+    try:
+        asyncio.run(run(names(), output, checkpoint, args.concurrency, args.full, stats,
+                        units=args.units, lang=args.lang))
+    except KeyboardInterrupt:
+        interrupted = True
+    finally:
+        for f in (source, output, checkpoint):
+            if f is not None and f not in (sys.stdin, sys.stdout):
+                f.close()
+    print(stats.summary(interrupted), file=sys.stderr)
+    if args.metrics:
+        metrics.REGISTRY.dump(args.metrics)
+    return EXIT_INTERRUPTED if interrupted else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
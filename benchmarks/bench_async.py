@@ -0,0 +1,59 @@
+# benchmarks/bench_async.py
+"""
+Çok şehirli çekimde AsyncWeatherAPI'nin farklı eşzamanlılık seviyelerindeki verimini
+(şehir/saniye) senkron WeatherAPI ile karşılaştırır. Her senaryo soğuk geocoding önbelleğiyle başlar;
+taklit sunucu istemciyle GIL paylaşmasın diye ayrı süreçte çalışır.
+
+    python benchmarks/bench_async.py --cities 200 --latency 0.02 --levels 1 4 16 64
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from konumBazli import WeatherAPI, AsyncWeatherAPI, GeocodeCache
+from weatherCache import SnapshotStore
+from mockServer import MockServerProcess
+
+
+def _city_names(count):
+    return [f"Test Şehri {i}" for i in range(count)]
+
+
+def bench_sync(server, names):
+    with WeatherAPI(api_key="bench", base_url=server.base_url, geocoding_url=server.geocoding_url, geocode_cache=GeocodeCache(), snapshot_store=SnapshotStore(":memory:")) as api:
+        start = time.perf_counter()
+        failed = sum(1 for name in names if not api.fetch_result(name).ok)
+        return time.perf_counter() - start, failed
+
+
+async def bench_async(server, names, concurrency):
+    client = AsyncWeatherAPI(max_concurrency=concurrency, api_key="bench", base_url=server.base_url,
+                             geocoding_url=server.geocoding_url, geocode_cache=GeocodeCache(), snapshot_store=SnapshotStore(":memory:"))
+    async with client:
+        start = time.perf_counter()
+        failed = 0
+        async for result in client.get_weather_for_cities(names):
+            failed += not result.ok
+        return time.perf_counter() - start, failed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cities", type=int, default=200, help="Çekilecek şehir sayısı")
+    parser.add_argument("--latency", type=float, default=0.02, help="Taklit sunucunun yanıt gecikmesi (saniye)")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 4, 16, 64], help="Denenecek eşzamanlılık seviyeleri")
+    args = parser.parse_args()
+
+    names = _city_names(args.cities)
+    with MockServerProcess(latency=args.latency, synthetic_cities=True) as server:
+        print(f"{args.cities} şehir (şehir başına 2 istek), sunucu gecikmesi {args.latency * 1000:.0f} ms")
+        elapsed, failed = bench_sync(server, names)
+        print(f"{'WeatherAPI (seri)':<28} {elapsed:7.2f} s  {args.cities / elapsed:8.1f} şehir/s  hata {failed}")
+        for level in args.levels:
+            elapsed, failed = asyncio.run(bench_async(server, names, level))
+            print(f"{f'AsyncWeatherAPI x{level}':<28} {elapsed:7.2f} s  {args.cities / elapsed:8.1f} şehir/s  hata {failed}")
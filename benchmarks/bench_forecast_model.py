@@ -0,0 +1,85 @@
+# benchmarks/bench_forecast_model.py
+"""
+Ham /onecall JSON sözlükleri ile sütun tabanlı forecastModel.Forecast'ı karşılaştırır:
+ayrıştırma süresi, şehir başına bellekte kalan boyut ve "önümüzdeki 24 saatin min/max/ortalaması"
+gibi bir toplamın süresi.
+
+    python benchmarks/bench_forecast_model.py --cities 500
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from forecastModel import Forecast
+from mockServer import make_onecall_payload, synthetic_location
+
+
+def _payloads(count):
+    now = int(time.time())
+    payloads = []
+    for i in range(count):
+        _, _, lat, lon = synthetic_location(f"sehir-{i}")
+        payloads.append(json.dumps(make_onecall_payload(lat, lon, "metric", "tr", now)).encode())
+    return payloads
+
+
+def _retained_bytes(build):
+    """`build()` sonucu canlı tutulurken ayrılmış kalan bellek (bayt)."""
+    gc.collect()
+    tracemalloc.start()
+    objects = build()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return retained
+
+
+def _dict_stats(payload, hours):
+    temps = [hour["temp"] for hour in payload["hourly"][:hours]]
+    return min(temps), max(temps), sum(temps) / len(temps)
+
+
+def _timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cities", type=int, default=500, help="Bellekte tutulan şehir sayısı")
+    parser.add_argument("--repeat", type=int, default=3, help="Zaman ölçümlerinin tekrar sayısı")
+    args = parser.parse_args()
+
+    raw = _payloads(args.cities)
+
+    dict_parse = _timed(lambda: [json.loads(body) for body in raw], args.repeat)
+    model_parse = _timed(lambda: [Forecast.from_json(json.loads(body)) for body in raw], args.repeat)
+
+    dict_bytes = _retained_bytes(lambda: [json.loads(body) for body in raw])
+    model_bytes = _retained_bytes(lambda: [Forecast.from_json(json.loads(body)) for body in raw])
+
+    dicts = [json.loads(body) for body in raw]
+    models = [Forecast.from_json(payload) for payload in dicts]
+    dict_aggregate = _timed(lambda: [_dict_stats(payload, 24) for payload in dicts], args.repeat)
+    model_aggregate = _timed(lambda: [forecast.temp_stats(24) for forecast in models], args.repeat)
+    dict_convert = _timed(lambda: [[hour["temp"] * 1.8 + 32 for hour in payload["hourly"]] for payload in dicts], args.repeat)
+    model_convert = _timed(lambda: [forecast.converted("imperial") for forecast in models], args.repeat)
+
+    n = args.cities
+    print(f"{n} şehir, şehir başına {len(dicts[0]['hourly'])} saatlik + {len(dicts[0]['daily'])} günlük kayıt")
+    print(f"{'':28}{'JSON sözlük':>14}{'Forecast':>14}")
+    print(f"{'Ayrıştırma (ms/şehir)':28}{dict_parse * 1000 / n:14.3f}{model_parse * 1000 / n:14.3f}")
+    print(f"{'Bellek (KiB/şehir)':28}{dict_bytes / 1024 / n:14.1f}{model_bytes / 1024 / n:14.1f}")
+    print(f"{'24 saat min/max/ort (µs)':28}{dict_aggregate * 1e6 / n:14.2f}{model_aggregate * 1e6 / n:14.2f}")
+    print(f"{'°F dönüşümü (µs/şehir)':28}{dict_convert * 1e6 / n:14.2f}{model_convert * 1e6 / n:14.2f}")
+    print(f"Forecast dizileri: {models[0].nbytes} bayt/şehir; bellek oranı {dict_bytes / model_bytes:.1f}x")
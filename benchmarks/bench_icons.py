@@ -0,0 +1,87 @@
+# benchmarks/bench_icons.py
+"""
+Bir arama sonrası çizilen ikonların (1 ana ikon + 24 saatlik + 7 günlük kart) hazırlanma süresini
+eski yol (her kart için Image.open + LANCZOS resize + PhotoImage) ile IconCache arasında karşılaştırır.
+
+    python benchmarks/bench_icons.py --refreshes 20
+
+Ekran (DISPLAY) yoksa PhotoImage adımı atlanır ve yalnızca PIL çözme/boyutlandırma ölçülür.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import tkinter as tk
+
+from PIL import Image, ImageTk
+
+from iconCache import IconCache
+
+
+def _refresh_requests(codes, rng):
+    """Bir yenilemede istenen (ikon kodu, boyut) listesi."""
+    return [(rng.choice(codes), 100)] + [(rng.choice(codes), 50) for _ in range(24 + 7)]
+
+
+def old_path(icons_dir, requests, with_photo):
+    for icon_code, size in requests:
+        img = Image.open(os.path.join(icons_dir, f"{icon_code}@2x.png"))
+        img = img.resize((size, size), Image.Resampling.LANCZOS)
+        if with_photo:
+            ImageTk.PhotoImage(img)
+
+
+def cached_path(cache, requests, with_photo):
+    for icon_code, size in requests:
+        if with_photo:
+            cache.get(icon_code, size)
+        else:
+            cache._resized_image(icon_code, size)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--refreshes", type=int, default=20, help="Ölçülecek yenileme sayısı")
+    args = parser.parse_args()
+
+    try:
+        root = tk.Tk()
+        root.withdraw()
+        with_photo = True
+    except tk.TclError:
+        root = None
+        with_photo = False
+        print("Ekran bulunamadı: PhotoImage oluşturma ölçüme dahil edilmiyor.")
+
+    icons_dir = os.path.join(ROOT, "assets")
+    cache = IconCache(icons_dir)
+    codes = cache.available_codes()
+    rng = random.Random(42)
+    batches = [_refresh_requests(codes, rng) for _ in range(args.refreshes)]
+
+    start = time.perf_counter()
+    for batch in batches:
+        old_path(icons_dir, batch, with_photo)
+    old_ms = (time.perf_counter() - start) * 1000 / args.refreshes
+
+    start = time.perf_counter()
+    cache.warm()
+    warm_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for batch in batches:
+        cached_path(cache, batch, with_photo)
+    cached_ms = (time.perf_counter() - start) * 1000 / args.refreshes
+
+    print(f"{len(codes)} farklı ikon, yenileme başına {len(batches[0])} ikon, {args.refreshes} yenileme")
+    print(f"Eski yol (her kartta çöz + boyutlandır): {old_ms:8.2f} ms / yenileme")
+    print(f"IconCache (tek seferlik ısınma {warm_ms:.1f} ms, arka planda): {cached_ms:8.3f} ms / yenileme")
+    print(f"Hızlanma: {old_ms / cached_ms:.0f}x")
+    if root is not None:
+        root.destroy()
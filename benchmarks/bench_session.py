@@ -0,0 +1,68 @@
+# benchmarks/bench_session.py
+"""
+Bağlantı yeniden kullanımının istek başına gecikmeye etkisini ölçer.
+Her istekte yeni bağlantı açan `requests.get` ile WeatherAPI'nin havuzlu oturumu,
+yerel taklit sunucuya karşı karşılaştırılır.
+
+    python benchmarks/bench_session.py --requests 300 --connect-latency 0.02
+
+--connect-latency, loopback'te neredeyse sıfır olan TCP+TLS el sıkışma maliyetini taklit eder.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+
+from konumBazli import WeatherAPI, GeocodeCache
+from weatherCache import SnapshotStore
+from mockServer import MockOpenWeatherServer
+
+
+def _summary(label, samples, connections):
+    samples_ms = sorted(s * 1000 for s in samples)
+    p95 = samples_ms[int(len(samples_ms) * 0.95) - 1]
+    print(f"{label:<36} ort {statistics.mean(samples_ms):7.3f} ms | p50 {statistics.median(samples_ms):7.3f} ms | "
+          f"p95 {p95:7.3f} ms | TCP bağlantısı {connections}")
+
+
+def bench_without_reuse(server, count):
+    url = f"{server.geocoding_url}/direct"
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        # Eski davranış: modül düzeyi requests.get, her çağrıda yeni bağlantı
+        requests.get(url, params={"q": "Bursa", "limit": 1, "appid": "bench"}).json()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def bench_with_reuse(server, count):
+    api = WeatherAPI(api_key="bench", base_url=server.base_url, geocoding_url=server.geocoding_url, geocode_cache=GeocodeCache(), snapshot_store=SnapshotStore(":memory:"))
+    url = f"{server.geocoding_url}/direct"
+    samples = []
+    with api:
+        for _ in range(count):
+            start = time.perf_counter()
+            api._fetch_data_with_retry(url, {"q": "Bursa", "limit": 1})
+            samples.append(time.perf_counter() - start)
+    return samples
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=300, help="Her senaryodaki istek sayısı")
+    parser.add_argument("--connect-latency", type=float, default=0.02, help="Yeni bağlantı başına eklenen gecikme (saniye)")
+    args = parser.parse_args()
+
+    with MockOpenWeatherServer(connect_latency=args.connect_latency) as server:
+        print(f"{args.requests} geocoding isteği, taklit sunucu: {server.url}, bağlantı gecikmesi {args.connect_latency * 1000:.0f} ms")
+        for label, bench in (("requests.get (yeniden kullanım yok)", bench_without_reuse), ("WeatherAPI.session (havuzlu)", bench_with_reuse)):
+            server.reset_stats()
+            samples = bench(server, args.requests)
+            _summary(label, samples, server.connections)
@@ -0,0 +1,140 @@
+# benchmarks/bench_startup.py
+"""
+Arayüzün açılış süresini ölçer: süreç başlangıcından pencerenin ilk çizimine ve ilk verinin
+ekrana gelmesine kadar geçen süre. Her çalıştırma yeni bir Python sürecidir; veriler ayrı bir
+süreçteki taklit sunucudan gelir (OPENWEATHER_*_URL ortam değişkenleriyle).
+
+    python benchmarks/bench_startup.py --runs 5 --latency 0.05
+
+Senaryolar:
+    cold      kayıtlı sonuç yok; ilk veri ağdan çekilir (ilk kurulum)
+    snapshot  önceki çalıştırmanın kaydı var; ilk veri yerel kayıttan gelir
+
+Süreçler geçici bir çalışma dizininde çalışır, config'teki cache/ dosyalarına dokunulmaz.
+Ekran yoksa ölçüm atlanır.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mockServer import MockServerProcess
+
+# Ölçülen süreçte çalışan betik. Zaman damgaları time.time() ile alınır; ana süreç başlangıcı aynı saatle ölçer.
+_CHILD = r"""
+import json, sys, time
+sys.path.insert(0, sys.argv[1])
+marks = {}
+
+import tkinter as tk
+import mainSection
+marks["import"] = time.time()
+
+try:
+    root = tk.Tk()
+except tk.TclError:
+    print(json.dumps({"error": "ekran bulunamadı"}))
+    sys.exit(0)
+
+def mark_first_frame():
+    root.update_idletasks()
+    marks.setdefault("first_frame", time.time())
+
+def on_map(event):
+    if event.widget is root and "first_frame" not in marks:
+        root.after_idle(mark_first_frame)
+
+# Uygulamanın kendi <Map> işleyicisinden önce bağlanır; ilk çizim ilk veri yüklemesinden önce işaretlenir
+root.bind("<Map>", on_map, add="+")
+app = mainSection.WeatherApp(root)
+render = app._render_weather
+
+def render_and_mark(result):
+    render(result)
+    if "first_data" not in marks:
+        root.update_idletasks()
+        marks["first_data"] = time.time()
+        marks["snapshot"] = result.is_snapshot
+        root.after_idle(root.quit)
+
+app._render_weather = render_and_mark
+root.after(int(float(sys.argv[2]) * 1000), root.quit)
+root.mainloop()
+app.stop_threads = True
+app.refresher.stop()
+app.scheduler.shutdown()
+root.destroy()
+print(json.dumps(marks))
+"""
+
+
+def _run_once(workdir, env, timeout):
+    started = time.time()
+    process = subprocess.run([sys.executable, "-c", _CHILD, ROOT, str(timeout)], cwd=workdir, env=env,
+                             capture_output=True, text=True, encoding="utf-8", timeout=timeout + 30)
+    lines = process.stdout.strip().splitlines()
+    if process.returncode != 0 or not lines:
+        raise RuntimeError(f"Ölçülen süreç başarısız oldu (çıkış kodu {process.returncode}):\n{process.stderr}")
+    marks = json.loads(lines[-1])
+    if "error" in marks:
+        return marks
+    return {key: (value - started) * 1000 if isinstance(value, float) else value for key, value in marks.items()}
+
+
+def _workdir(parent, name):
+    # İkonlar göreli assets/ yolundan okunur
+    path = os.path.join(parent, name)
+    os.makedirs(path)
+    os.symlink(os.path.join(ROOT, "assets"), os.path.join(path, "assets"))
+    return path
+
+
+def bench_startup(args):
+    results = {}
+    with MockServerProcess(latency=args.latency) as server, tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, OPENWEATHER_BASE_URL=server.base_url, OPENWEATHER_GEOCODING_URL=server.geocoding_url)
+        env.pop("HAVA_DEBUG", None)
+
+        snapshot_dir = _workdir(tmp, "snapshot")
+        # Kayıt oluşturan ısınma çalıştırması ölçüme katılmaz
+        warmup = _run_once(snapshot_dir, env, args.timeout)
+        if "error" in warmup:
+            print(f"Açılış süresi: {warmup['error']}, atlanıyor.")
+            return None
+
+        for scenario in ("cold", "snapshot"):
+            runs = []
+            for i in range(args.runs):
+                workdir = snapshot_dir if scenario == "snapshot" else _workdir(tmp, f"cold-{i}")
+                runs.append(_run_once(workdir, env, args.timeout))
+            results[scenario] = runs
+
+    print(f"Açılış süresi, süreç başlangıcından itibaren ({args.runs} çalıştırma, sunucu gecikmesi "
+          f"{args.latency * 1000:.0f} ms, medyan / en iyi, ms)")
+    for scenario, runs in results.items():
+        row = []
+        for key, label in (("import", "içe aktarma"), ("first_frame", "ilk çizim"), ("first_data", "ilk veri")):
+            values = [run[key] for run in runs if key in run]
+            row.append(f"{label} {statistics.median(values):7.1f} / {min(values):7.1f}" if values else f"{label} ---")
+        print(f"  {scenario:<9} " + "  ".join(row))
+        missing = sum(1 for run in runs if "first_data" not in run)
+        if missing:
+            print(f"  {'':<9} {missing} çalıştırmada {args.timeout:.0f} s içinde veri gelmedi")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Senaryo başına çalıştırma sayısı")
+    parser.add_argument("--latency", type=float, default=0.05, help="Taklit sunucunun yanıt gecikmesi (saniye)")
+    parser.add_argument("--timeout", type=float, default=20.0, help="Bir çalıştırmada ilk veri için en fazla bekleme (saniye)")
+    args = parser.parse_args()
+    bench_startup(args)
@@ -0,0 +1,343 @@
+# benchmarks/bench_suite.py
+"""
+Yerel taklit sunucu üzerinde uçtan uca performans ölçümleri. Gerileme olduğunda sayılarda görünsün diye
+her bölüm sabit tohumlu, tekrarlanabilir senaryolar kullanır.
+
+    python benchmarks/bench_suite.py                    # bütün bölümler
+    python benchmarks/bench_suite.py --only latency faults --json sonuc.json
+
+Bölümler:
+    latency     get_weather_by_city gecikme yüzdelikleri (soğuk ve sıcak önbellek)
+    throughput  çok şehirli verim: seri WeatherAPI ve AsyncWeatherAPI
+    faults      5xx / 429 / yavaş yanıt altında yeniden deneme davranışı ve başarı oranı
+    nearby      birbirine yakın konum kümelerinde /onecall isteği sayısı (yakın konum paylaşımı kapalı/açık)
+    render      arayüz render süreleri (ekran yoksa atlanır)
+    dashboard   şehir panosu: liste uzunluğuna göre satır widget'ı sayısı, dolma ve kaydırma süreleri (ekran yoksa atlanır)
+
+Hiçbir bölüm config'teki önbellek ve anlık görüntü dosyalarına yazmaz.
+"""
+
+import argparse
+import asyncio
+import collections
+import functools
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from konumBazli import WeatherResult, WeatherAPI, AsyncWeatherAPI, GeocodeCache
+from retryPolicy import RetryPolicy
+from weatherCache import SnapshotStore, ResponseCache, MemoryCacheBackend
+from mockServer import MockOpenWeatherServer, MockServerProcess, CITIES, make_onecall_payload
+from config import NEARBY_RADIUS_KM
+
+
+def _percentiles(values):
+    """Milisaniye cinsinden p50/p90/p99/max."""
+    values = sorted(values)
+    pick = lambda p: values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))] * 1000
+    return {"p50": pick(50), "p90": pick(90), "p99": pick(99), "max": values[-1] * 1000}
+
+
+def _format_percentiles(stats):
+    return "  ".join(f"{name} {value:7.1f}" for name, value in stats.items())
+
+
+def _api(server, **kwargs):
+    """Taklit sunucuya bağlı, kalıcı dosyalara dokunmayan bir WeatherAPI."""
+    kwargs.setdefault("geocode_cache", GeocodeCache())
+    kwargs.setdefault("snapshot_store", SnapshotStore(":memory:"))
+    kwargs.setdefault("response_cache", ResponseCache(MemoryCacheBackend()))
+    return WeatherAPI(api_key="bench", base_url=server.base_url, geocoding_url=server.geocoding_url, **kwargs)
+
+
+def _city_names(count, prefix="Test Şehri"):
+    return [f"{prefix} {i}" for i in range(count)]
+
+
+def bench_latency(args):
+    with MockServerProcess(latency=args.latency, latency_jitter=0.5, synthetic_cities=True, seed=1) as server:
+        with _api(server) as api:
+            names = _city_names(args.cities)
+            results = {}
+            for label in ("cold", "warm"):
+                timings = []
+                for name in names:
+                    start = time.perf_counter()
+                    api.get_weather_by_city(name)
+                    timings.append(time.perf_counter() - start)
+                results[label] = _percentiles(timings)
+    print(f"get_weather_by_city, {args.cities} şehir, sunucu gecikmesi {args.latency * 1000:.0f} ms ± %50 (ms)")
+    print(f"  soğuk önbellek   {_format_percentiles(results['cold'])}")
+    print(f"  sıcak önbellek   {_format_percentiles(results['warm'])}")
+    return results
+
+
+async def _async_run(server, names, concurrency):
+    client = AsyncWeatherAPI(max_concurrency=concurrency, api=_api(server, pool_size=concurrency))
+    async with client:
+        start = time.perf_counter()
+        failed = 0
+        async for result in client.get_weather_for_cities(names):
+            failed += not result.ok
+        return time.perf_counter() - start, failed
+
+
+def bench_throughput(args):
+    names = _city_names(args.cities)
+    results = {}
+    with MockServerProcess(latency=args.latency, synthetic_cities=True) as server:
+        with _api(server) as api:
+            start = time.perf_counter()
+            failed = sum(1 for name in names if not api.fetch_result(name).ok)
+            elapsed = time.perf_counter() - start
+        results["serial"] = {"cities_per_s": len(names) / elapsed, "failed": failed}
+        for level in args.levels:
+            elapsed, failed = asyncio.run(_async_run(server, names, level))
+            results[f"async_x{level}"] = {"cities_per_s": len(names) / elapsed, "failed": failed}
+    print(f"Çok şehirli verim, {args.cities} şehir, sunucu gecikmesi {args.latency * 1000:.0f} ms")
+    for label, row in results.items():
+        print(f"  {label:<12} {row['cities_per_s']:8.1f} şehir/s  hata {row['failed']}")
+    return results
+
+
+def bench_faults(args):
+    """
+    Aynı hata profiliyle yeniden denemesiz ve varsayılan politikalı istemciyi karşılaştırır. Bekleme süreleri
+    ölçüm kısa sürsün diye küçültülmüştür; 429 yanıtlarının Retry-After'ına yine de uyulur.
+    """
+    profile = dict(error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate, retry_after=1,
+                   slow_rate=args.slow_rate, slow_latency=1.5)
+    policies = {
+        "yeniden deneme yok": RetryPolicy(max_attempts=1),
+        "RetryPolicy": RetryPolicy(base_delay=0.05, max_delay=0.5, deadline=10),
+    }
+    names = _city_names(args.fault_cities, prefix="Hatalı Şehir")
+    results = {}
+    print(f"Hata altında yeniden deneme, {len(names)} şehir, 5xx %{args.error_rate * 100:.0f}, "
+          f"429 %{args.rate_limit_rate * 100:.0f}, yavaş %{args.slow_rate * 100:.0f} (1 s okuma zaman aşımı)")
+    for label, policy in policies.items():
+        with MockOpenWeatherServer(latency=args.latency, synthetic_cities=True, seed=7, **profile) as server:
+            with _api(server, retry_policy=policy, timeout=(1.0, 1.0)) as api:
+                timings, ok = [], 0
+                for name in names:
+                    result = api.fetch_result(name)
+                    timings.append(result.elapsed)
+                    ok += result.ok
+                breakers_open = sum(1 for breaker in api._breakers.values() if breaker.state != "closed")
+            row = {
+                "success_rate": ok / len(names),
+                "requests_per_city": server.requests / len(names),
+                "faults": dict(server.faults),
+                "latency_ms": _percentiles(timings),
+                "breakers_open": breakers_open,
+            }
+        results[label] = row
+        print(f"  {label:<20} başarı %{row['success_rate'] * 100:5.1f}  istek/şehir {row['requests_per_city']:4.2f}  "
+              f"enjekte {row['faults']}  açık devre {breakers_open}")
+        print(f"  {'':<20} {_format_percentiles(row['latency_ms'])}")
+    return results
+
+
+def bench_nearby(args):
+    """
+    Her kümede merkezin ±0.02° (~2 km) çevresinde koordinatlar ("enlem, boylam" girişi) çekilir. Kapalıyken
+    her konum kendi /onecall isteğini yapar; açıkken NEARBY_RADIUS_KM içindeki taze yanıt paylaşılır.
+    """
+    rng = random.Random(5)
+    points = []
+    for _ in range(args.nearby_clusters):
+        lat, lon = rng.uniform(-55, 60), rng.uniform(-179, 179)
+        for _ in range(args.nearby_points):
+            points.append(f"{lat + rng.uniform(-0.02, 0.02):.4f}, {lon + rng.uniform(-0.02, 0.02):.4f}")
+    results = {}
+    print(f"Yakın konumlar, {args.nearby_clusters} küme x {args.nearby_points} konum, sunucu gecikmesi {args.latency * 1000:.0f} ms")
+    with MockServerProcess(latency=args.latency, synthetic_cities=True) as server:
+        for label, radius in (("kapalı", 0), (f"{NEARBY_RADIUS_KM:g} km", NEARBY_RADIUS_KM)):
+            with _api(server, nearby_radius_km=radius) as api:
+                start = time.perf_counter()
+                failed = sum(1 for point in points if not api.fetch_result(point).ok)
+                elapsed = time.perf_counter() - start
+                stats = api.response_cache.stats()
+            row = {
+                "onecall_requests": stats["misses"] - stats["nearby_hits"],
+                "nearby_hits": stats["nearby_hits"],
+                "seconds": elapsed,
+                "failed": failed,
+            }
+            results[label] = row
+            print(f"  {label:<8} /onecall {row['onecall_requests']:4d}  paylaşılan {row['nearby_hits']:4d}  "
+                  f"süre {elapsed:6.2f} s  hata {failed}")
+    return results
+
+
+def bench_render(args):
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        print("Arayüz render: ekran bulunamadı, atlanıyor.")
+        return None
+    root.withdraw()
+
+    import mainSection
+
+    os.chdir(ROOT)  # ikonlar göreli assets/ yolundan okunur
+    results = {}
+    with MockOpenWeatherServer(latency=0.0) as server:
+        # Sonuçlar arayüz thread'i kaydedilmeden önce çekilir (HAVA_DEBUG=1 ile ana thread'den ağ çağrısı yasaktır)
+        with _api(server) as api:
+            fetched = []
+            for city in list(CITIES)[:6]:
+                result = api.fetch_result(city)
+                fetched.append(mainSection.WeatherApp._parse_forecast(result))
+        mainSection.WeatherAPI = functools.partial(_api, server)
+        # WeatherApp anlık görüntü deposunu kendisi verir; config'teki dosya yerine bellek içi depo kullanılır
+        mainSection.create_snapshot_store = lambda: SnapshotStore(":memory:")
+        app = mainSection.WeatherApp(root)
+        app.icons.warm()
+        # Günlük sekme ilk seçilişinde kurulur; ölçüme dahil olması için baştan açılır
+        app.forecast_notebook.select(app.daily_frame)
+        app._on_tab_changed()
+
+        def measure(label, render, repeat):
+            timings = []
+            for i in range(repeat):
+                start = time.perf_counter()
+                render(i)
+                root.update_idletasks()
+                timings.append(time.perf_counter() - start)
+            results[label] = _percentiles(timings)
+
+        measure("first", lambda i: app._render_weather(fetched[0]), 1)
+        measure("same_data", lambda i: app._render_weather(fetched[0]), args.renders)
+        measure("new_city", lambda i: app._render_weather(fetched[i % len(fetched)]), args.renders)
+
+        app._last_result = fetched[0]
+
+        def toggle(i):
+            app.temp_unit.set("imperial" if i % 2 == 0 else "metric")
+            app._on_unit_change()
+        measure("unit_toggle", toggle, args.renders)
+
+        app.stop_threads = True
+        app.refresher.stop()
+        app.scheduler.shutdown()
+    root.destroy()
+
+    print(f"Arayüz render süreleri ({args.renders} tekrar, update_idletasks dahil, ms)")
+    for label, stats in results.items():
+        print(f"  {label:<12} {_format_percentiles(stats)}")
+    return results
+
+
+def _count_widgets(widget):
+    return sum(1 + _count_widgets(child) for child in widget.winfo_children())
+
+
+def bench_dashboard(args):
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        print("Şehir panosu: ekran bulunamadı, atlanıyor.")
+        return None
+    root.geometry("1000x400")
+
+    from dashboard import CityDashboard
+    from iconCache import IconCache
+
+    os.chdir(ROOT)  # ikonlar göreli assets/ yolundan okunur
+    icons = IconCache(sizes=(25,))
+    icons.warm()
+    rng = random.Random(7)
+    results = {}
+    for count in args.dashboard_sizes:
+        cities = _city_names(count)
+        # Ağ ölçülmez: sonuçlar worker'da taklit sunucunun yanıt üreticisiyle hazırlanır
+        payloads = {city: make_onecall_payload(rng.uniform(36, 42), rng.uniform(26, 45)) for city in cities}
+        fetch = lambda city, cancel, allow_stale=True: WeatherResult(city, city, payloads[city], None)
+        posted = collections.deque()
+        frame = tk.Frame(root)
+        frame.pack(fill="both", expand=True)
+        root.update()
+
+        start = time.perf_counter()
+        board = CityDashboard(frame, fetch, lambda handler, result: posted.append((handler, result)), icons, 25,
+                              lambda: "metric", lambda city: None, cities=cities, cities_file=None)
+        root.update()
+        delivered = 0
+        while delivered < count:
+            # Sonuçlar arayüzdeki gibi ana thread'de teker teker uygulanır
+            while posted:
+                handler, result = posted.popleft()
+                handler(result)
+                delivered += 1
+            root.update()
+        fill = time.perf_counter() - start
+
+        steps = []
+        for i in range(args.dashboard_scrolls):
+            step_start = time.perf_counter()
+            board.canvas.yview_moveto(i / max(1, args.dashboard_scrolls - 1))
+            root.update_idletasks()
+            steps.append(time.perf_counter() - step_start)
+
+        results[count] = {
+            "rows": board.row_count,
+            "widgets": _count_widgets(frame),
+            "fill_ms": fill * 1000,
+            "scroll": _percentiles(steps),
+        }
+        board.close()
+        frame.destroy()
+    root.destroy()
+
+    print(f"Şehir panosu (kaydırma: {args.dashboard_scrolls} adım, update_idletasks dahil, ms)")
+    for count, stats in results.items():
+        print(f"  {count:>5} şehir  satır {stats['rows']:3d}  widget {stats['widgets']:4d}  "
+              f"dolma {stats['fill_ms']:8.1f}  kaydırma {_format_percentiles(stats['scroll'])}")
+    return results
+
+
+SECTIONS = {
+    "latency": bench_latency,
+    "throughput": bench_throughput,
+    "faults": bench_faults,
+    "nearby": bench_nearby,
+    "render": bench_render,
+    "dashboard": bench_dashboard,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", nargs="+", choices=list(SECTIONS), help="Yalnızca bu bölümleri çalıştır")
+    parser.add_argument("--cities", type=int, default=200, help="Gecikme ve verim bölümlerindeki şehir sayısı")
+    parser.add_argument("--latency", type=float, default=0.02, help="Taklit sunucunun yanıt gecikmesi (saniye)")
+    parser.add_argument("--levels", type=int, nargs="+", default=[4, 16], help="AsyncWeatherAPI eşzamanlılık seviyeleri")
+    parser.add_argument("--fault-cities", type=int, default=60, help="Hata bölümündeki şehir sayısı")
+    parser.add_argument("--error-rate", type=float, default=0.15, help="5xx olasılığı")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.03, help="429 olasılığı")
+    parser.add_argument("--slow-rate", type=float, default=0.05, help="Yavaş yanıt olasılığı")
+    parser.add_argument("--nearby-clusters", type=int, default=20, help="Yakın konum bölümündeki küme sayısı")
+    parser.add_argument("--nearby-points", type=int, default=10, help="Küme başına konum sayısı")
+    parser.add_argument("--renders", type=int, default=50, help="Render bölümündeki tekrar sayısı")
+    parser.add_argument("--dashboard-sizes", type=int, nargs="+", default=[20, 200, 2000], help="Pano bölümündeki şehir sayıları")
+    parser.add_argument("--dashboard-scrolls", type=int, default=100, help="Pano bölümünde listenin baştan sona kaç adımda kaydırılacağı")
+    parser.add_argument("--json", help="Sonuçların yazılacağı JSON dosyası (karşılaştırma için)")
+    args = parser.parse_args()
+
+    report = {}
+    for name in args.only or SECTIONS:
+        report[name] = SECTIONS[name](args)
+        print()
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"Sonuçlar yazıldı: {args.json}")
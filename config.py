@@ -1,8 +1,10 @@
+import os
 
-OPENWEATHER_API_KEY = "cbbb232f9bbf34f3793f9afabc282232"
+# Anahtar ve adresler ortam değişkenleriyle değiştirilebilir (ör. yerel taklit sunucu: python mockServer.py)
+OPENWEATHER_API_KEY = os.environ.get("OPENWEATHER_API_KEY", "cbbb232f9bbf34f3793f9afabc282232")
 
-OPENWEATHER_BASE_URL = "https://api.openweathermap.org/data/2.5"
-OPENWEATHER_GEOCODING_URL = "http://api.openweathermap.org/geo/1.0" 
+OPENWEATHER_BASE_URL = os.environ.get("OPENWEATHER_BASE_URL", "https://api.openweathermap.org/data/2.5")
+OPENWEATHER_GEOCODING_URL = os.environ.get("OPENWEATHER_GEOCODING_URL", "http://api.openweathermap.org/geo/1.0")
 
 WEATHER_ICONS_DIR = "assets/"
 
@@ -11,3 +13,103 @@ DEFAULT_CITY = "Bursa"
 API_LANG = "tr"
 
 API_UNITS = "metric" 
+
+# Veriler her zaman bu birimde çekilip önbelleğe alınır; diğer birimler yerel olarak türetilir
+CANONICAL_UNITS = "metric"
+
+
+# Geocoding önbelleği: şehir koordinatları neredeyse hiç değişmediği için uzun süre saklanır
+GEOCODE_CACHE_FILE = "cache/geocode.json"
+
+GEOCODE_CACHE_SIZE = 512
+
+GEOCODE_CACHE_TTL = 30 * 24 * 60 * 60
+
+
+# HTTP bağlantı havuzu: host başına açık tutulacak keep-alive bağlantı sayısı
+HTTP_POOL_SIZE = 10
+
+# Saniye cinsinden bağlantı kurma ve yanıt okuma zaman aşımları
+HTTP_CONNECT_TIMEOUT = 3.05
+
+HTTP_READ_TIMEOUT = 10
+
+# Yeniden deneme politikası: deneme sayısı, tam jitter'lı geri çekilmenin taban/tavan süreleri ve
+# bir isteğin tüm denemeleri için toplam süre sınırı (saniye)
+RETRY_MAX_ATTEMPTS = 5
+
+RETRY_BASE_DELAY = 1
+
+RETRY_MAX_DELAY = 8
+
+RETRY_DEADLINE = 20
+
+# Devre kesici: art arda bu kadar geçici hatadan sonra uç nokta CIRCUIT_RESET_TIMEOUT saniye denenmez
+CIRCUIT_FAILURE_THRESHOLD = 5
+
+CIRCUIT_RESET_TIMEOUT = 30
+
+# Arayüzün arka plan isteklerini çalıştıran worker thread sayısı
+REQUEST_WORKERS = 4
+
+# AsyncWeatherAPI'nin aynı anda yapabileceği en fazla istek sayısı
+ASYNC_MAX_CONCURRENCY = 16
+
+
+# Pano sekmesinde izlenen şehirlerin listesi bu dosyada saklanır; dosya yoksa varsayılan liste gösterilir
+DASHBOARD_CITIES_FILE = "cache/dashboard.json"
+
+DASHBOARD_DEFAULT_CITIES = ["Bursa", "Ankara", "İstanbul", "İzmir", "Antalya", "Erzurum", "Trabzon"]
+
+# Pano şehirlerini eşzamanlı çeken worker thread sayısı (ana aramadan bağımsız)
+DASHBOARD_WORKERS = 8
+
+
+# Otomatik yenileme: görüntülenen şehir bu aralıkla (saniye) yeniden çekilir; 0 kapatır.
+# Yenilemelerin önbellekten değil sunucudan gelmesi için WEATHER_CACHE_TTL'den (jitter dahil) uzun olmalıdır
+AUTO_REFRESH_INTERVAL = 15 * 60
+
+# Yenileme zamanlarına eklenen rastgele sapma (aralığın oranı); şehirlerin yenilemeleri aynı ana denk gelmez
+AUTO_REFRESH_JITTER = 0.1
+
+# Veri değişmedikçe (aynı current.dt) yenileme aralığı ikiye katlanır; en fazla bu değere kadar
+AUTO_REFRESH_MAX_INTERVAL = 60 * 60
+
+
+# Her şehrin son başarılı sonucunun saklandığı dosya (açılışta ve ağ yokken gösterilir); None kapatır
+SNAPSHOT_DB = "cache/snapshots.sqlite3"
+
+# Anlık görüntülerin sıkıştırılmış toplam boyut sınırı (bayt); aşılınca en eskiler silinir
+SNAPSHOT_MAX_BYTES = 4 * 1024 * 1024
+
+# Komut satırı denemesinin (python konumBazli.py) kendi anlık görüntü dosyası; arayüzün açılış kaydına karışmaz
+DEMO_SNAPSHOT_DB = "cache/demo_snapshots.sqlite3"
+
+
+# /onecall yanıt önbelleği: TTL içinde taze sayılır, sonraki WEATHER_CACHE_STALE_TTL saniye boyunca
+# bayat kayıt hemen gösterilip arka planda yenilenir
+WEATHER_CACHE_TTL = 10 * 60
+
+WEATHER_CACHE_STALE_TTL = 60 * 60
+
+WEATHER_CACHE_SIZE = 256
+
+# Önbellekte yanıtı olmayan bir konum, bu yarıçap (km) içindeki en yakın taze yanıtı yeni /onecall
+# isteği yapmadan kullanır (ör. aynı şehrin ilçeleri); 0 kapatır
+NEARBY_RADIUS_KM = 5.0
+
+# Birden çok süreç aynı makinede önbelleği paylaşsın isteniyorsa SQLite dosya yolu (ör. "cache/weather.sqlite3")
+WEATHER_CACHE_DB = None
+
+
+# 1 ise arayüz (Tk) thread'inden yapılan bloklayan ağ çağrıları hata fırlatır
+DEBUG_BLOCKING_IO = os.environ.get("HAVA_DEBUG") == "1"
+
+# 1 ise tahmin şeritlerinin render süreleri konsola yazılır
+DEBUG_RENDER_TIMING = os.environ.get("HAVA_DEBUG") == "1"
+
+# 1 ise metrics modülü ölçüm toplar (istek süreleri, yeniden denemeler, önbellek, render süreleri)
+METRICS_ENABLED = os.environ.get("HAVA_METRICS") == "1"
+
+# 0'dan farklıysa ve ölçümler açıksa arayüz ölçümleri bu porttan HTTP ile sunar (/metrics, /metrics.json)
+METRICS_PORT = int(os.environ.get("HAVA_METRICS_PORT", "0"))
@@ -0,0 +1,382 @@
+# dashboard.py
+"""
+İzlenen şehirlerin tek satırlık özetlerini alt alta gösteren pano. Şehirler ayrı bir worker havuzunda
+eşzamanlı çekilir; her satır verisi geldikçe dolar.
+
+Liste sanal kaydırmalıdır: Canvas'ın kaydırma alanı bütün listeyi kapsar, ama yalnızca görünen satırlar
+kadar satır widget'ı oluşturulur. Kaydırıldıkça aynı widget'lar yeni konumlarına taşınıp o konumdaki
+şehirle doldurulur; bellek ve yeniden çizim maliyeti liste uzadıkça artmaz.
+"""
+
+import functools
+import json
+import time
+import tkinter as tk
+from collections import namedtuple
+
+from konumBazli import normalize_city_key, unit_conversion, format_age, write_json_atomic, UNIT_SUFFIXES
+from requestScheduler import RequestScheduler
+from autoRefresh import AutoRefresher
+from config import CANONICAL_UNITS, DASHBOARD_CITIES_FILE, DASHBOARD_DEFAULT_CITIES, DASHBOARD_WORKERS
+
+# Satırın piksel yüksekliği; sanal kaydırmada satır konumları bundan hesaplanır
+ROW_HEIGHT = 32
+
+# Fare tekerleği: Windows/macOS <MouseWheel> (delta), X11 Button-4/5 üretir
+WHEEL_EVENTS = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+
+# Bir satırda gösterilecek değerler
+RowState = namedtuple("RowState", ["title", "icon_code", "temp", "description", "details", "status"])
+
+
+class CitySummary(namedtuple("CitySummary", ["city", "title", "temp", "wind_speed", "humidity", "icon_code",
+                                             "description", "dt", "stored_at", "error"])):
+    """
+    Panoda bir şehir için saklanan tek kayıt; CANONICAL_UNITS birimindedir. /onecall yanıtının tamamı
+    tutulmaz, yalnızca satırın gösterdiği alanlar worker thread'inde ayıklanır.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_result(cls, result):
+        if not result.ok:
+            return cls(result.requested_city, result.display_name, None, None, None, None, None, None, None,
+                       result.error or "Bulunamadı")
+        current = result.weather["current"]
+        weather = (current.get("weather") or [{}])[0]
+        return cls(result.requested_city, result.display_name, current["temp"], current["wind_speed"],
+                   current.get("humidity"), weather.get("icon"), weather.get("description") or "", current.get("dt"),
+                   result.stored_at, None)
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def load_watched_cities(path):
+    """Kayıtlı şehir listesini okur; dosya yoksa ya da okunamazsa varsayılan liste döner."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            cities = json.load(f)
+    except FileNotFoundError:
+        return list(DASHBOARD_DEFAULT_CITIES)
+    except (OSError, ValueError) as e:
+        print(f"Uyarı: Pano şehir listesi okunamadı ({e}), varsayılan liste kullanılıyor.")
+        return list(DASHBOARD_DEFAULT_CITIES)
+    return [city for city in cities if isinstance(city, str) and city.strip()]
+
+
+def save_watched_cities(path, cities):
+    try:
+        write_json_atomic(path, cities)
+    except OSError as e:
+        print(f"Uyarı: Pano şehir listesi diske yazılamadı: {e}")
+
+
+class DashboardRow:
+    """
+    Havuzdaki tek satır. Canvas üzerinde bir pencere öğesidir; show() ile listedeki bir konuma taşınır
+    ve o konumdaki şehrin durumuyla doldurulur. Yalnızca önceki durumdan farklı olan widget'lara dokunulur.
+    """
+    def __init__(self, canvas, icons, icon_size, on_select, on_remove, on_wheel):
+        self.canvas = canvas
+        self.icons = icons
+        self.icon_size = icon_size
+        self.index = None
+        self.state = None
+        self.width = None
+        self.frame = tk.Frame(canvas, bd=1, relief="groove")
+        self.title_label = tk.Label(self.frame, width=22, anchor="w", font=("Helvetica", 11, "bold"))
+        self.title_label.grid(row=0, column=0, padx=5)
+        # Label'ın width/height'ı görüntü yokken karakter cinsindendir; ikon sütununun genişliği piksel olarak
+        # sütuna verilir, böylece yüklenen ve hatalı satırlar ikonlu satırlarla aynı hizada kalır
+        self.icon_label = tk.Label(self.frame, bd=0, padx=0, pady=0)
+        self.icon_label.grid(row=0, column=1)
+        self.frame.grid_columnconfigure(1, minsize=icon_size)
+        self.temp_label = tk.Label(self.frame, width=9, anchor="e", font=("Helvetica", 11, "bold"))
+        self.temp_label.grid(row=0, column=2, padx=5)
+        self.description_label = tk.Label(self.frame, width=20, anchor="w")
+        self.description_label.grid(row=0, column=3, padx=5)
+        self.details_label = tk.Label(self.frame, width=24, anchor="w", font=("Helvetica", 9))
+        self.details_label.grid(row=0, column=4, padx=5)
+        self.status_label = tk.Label(self.frame, anchor="w", fg="gray", font=("Helvetica", 9))
+        self.status_label.grid(row=0, column=5, padx=5, sticky="w")
+        self.frame.grid_columnconfigure(5, weight=1)
+        remove_button = tk.Button(self.frame, text="✕", relief="flat", command=lambda: on_remove(self.index))
+        remove_button.grid(row=0, column=6, padx=5)
+        labels = (self.frame, self.title_label, self.icon_label, self.temp_label, self.description_label,
+                  self.details_label, self.status_label)
+        for widget in labels:
+            widget.bind("<Button-1>", lambda e: on_select(self.index))
+        # Satırlar Canvas'ı kapladığı için tekerlek olayları imlecin altındaki satır widget'ına gelir
+        for widget in labels + (remove_button,):
+            for sequence in WHEEL_EVENTS:
+                widget.bind(sequence, on_wheel)
+        self.window = canvas.create_window(0, 0, window=self.frame, anchor="nw", height=ROW_HEIGHT, state="hidden")
+
+    def show(self, index, state, width):
+        """Satırı `index` konumuna taşır ve `state` ile günceller. Değişiklik yapıldıysa True döndürür."""
+        changed = False
+        if index != self.index:
+            self.canvas.coords(self.window, 0, index * ROW_HEIGHT)
+            self.canvas.itemconfigure(self.window, state="normal")
+            self.index = index
+            changed = True
+        # Canvas yeniden boyutlanınca yerindeki satırlar da genişler
+        if width != self.width:
+            self.canvas.itemconfigure(self.window, width=width)
+            self.width = width
+            changed = True
+        previous = self.state
+        for field, label in (("title", self.title_label), ("temp", self.temp_label),
+                             ("description", self.description_label), ("details", self.details_label),
+                             ("status", self.status_label)):
+            value = getattr(state, field)
+            if previous is None or getattr(previous, field) != value:
+                label.config(text=value)
+                changed = True
+        if previous is None or previous.icon_code != state.icon_code:
+            self.icon_label.config(image=self.icons.get(state.icon_code, self.icon_size) or "")
+            changed = True
+        self.state = state
+        return changed
+
+    def hide(self):
+        if self.index is not None:
+            self.canvas.itemconfigure(self.window, state="hidden")
+            self.index = None
+
+
+class CityDashboard:
+    """
+    `parent` içinde şehir ekleme çubuğu ve sanal kaydırmalı satır listesi kurar.
+
+    - fetch(city, cancel, allow_stale=...) worker thread'inde CANONICAL_UNITS birimli bir WeatherResult döndürür
+      (WeatherAPI.fetch_result; arayüz anlık görüntü kaydetmeyen bir çağrı verir)
+    - post(handler, summary), handler(summary)'nin arayüz thread'inde çağrılmasını sağlar (WeatherApp'in sonuç kuyruğu)
+    - units() seçili birimi, on_select(city) ise satıra tıklanan şehri alır
+
+    Şehirler ekran dışındayken de çekilir; her biri için yalnızca küçük bir CitySummary saklanır,
+    görünür olmayan satırlar için widget yoktur.
+    Her şehir AutoRefresher ile ayrı ayrı yenilenir.
+    """
+    def __init__(self, parent, fetch, post, icons, icon_size, units, on_select, cities=None,
+                 cities_file=DASHBOARD_CITIES_FILE, workers=DASHBOARD_WORKERS):
+        self.parent = parent
+        self._fetch = fetch
+        self._post = post
+        self.icons = icons
+        self.icon_size = icon_size
+        self._units = units
+        self._on_select = on_select
+        self.cities_file = cities_file
+        if cities is None:
+            cities = load_watched_cities(cities_file) if cities_file else list(DASHBOARD_DEFAULT_CITIES)
+        self.cities = []
+        self._keys = set()
+        self._summaries = {}  # normalize_city_key -> CitySummary
+        self._rows = []     # görünür satırlar için widget havuzu
+        self.last_render_ms = 0.0
+        self.last_changed = 0
+        self.scheduler = RequestScheduler(max_workers=workers)
+        self.refresher = AutoRefresher(parent.after, parent.after_cancel, self._refresh_city)
+        self._create_widgets()
+        for city in cities:
+            self._add(city)
+        self._update_scrollregion()
+
+    def _create_widgets(self):
+        bar = tk.Frame(self.parent)
+        bar.pack(side="top", fill="x", pady=2)
+        self.city_entry = tk.Entry(bar, width=30)
+        self.city_entry.pack(side="left", padx=5)
+        self.city_entry.bind("<Return>", self._on_add_click)
+        tk.Button(bar, text="Ekle", command=self._on_add_click).pack(side="left", padx=2)
+        tk.Button(bar, text="Tümünü Yenile", command=self.refresh_all).pack(side="left", padx=2)
+        self.count_label = tk.Label(bar, fg="gray")
+        self.count_label.pack(side="right", padx=5)
+
+        self.canvas = tk.Canvas(self.parent, highlightthickness=0, yscrollincrement=ROW_HEIGHT)
+        self.scrollbar = tk.Scrollbar(self.parent, orient="vertical", command=self.canvas.yview)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+        # Görünüm her değiştiğinde (kaydırma, boyut, liste uzunluğu) Tk yscrollcommand'ı çağırır; satırlar orada yerleştirilir
+        self.canvas.configure(yscrollcommand=self._on_view_change)
+        self.canvas.bind("<Configure>", lambda e: self._layout())
+        for sequence in WHEEL_EVENTS:
+            self.canvas.bind(sequence, self._on_mouse_wheel)
+
+    @property
+    def row_count(self):
+        """Oluşturulmuş satır widget'ı sayısı; listenin uzunluğuna değil görünen alanın yüksekliğine bağlıdır."""
+        return len(self._rows)
+
+    def _on_mouse_wheel(self, event):
+        up = event.num == 4 if event.num in (4, 5) else event.delta > 0
+        self.canvas.yview_scroll(-1 if up else 1, "units")
+
+    def _on_view_change(self, first, last):
+        self.scrollbar.set(first, last)
+        self._layout()
+
+    def _update_scrollregion(self):
+        self.canvas.configure(scrollregion=(0, 0, 0, len(self.cities) * ROW_HEIGHT))
+        self._update_count()
+
+    def _update_count(self):
+        # Sonuçlar yalnızca listedeki şehirler için tutulur; sayım liste uzunluğundan bağımsızdır
+        self.count_label.config(text=f"{len(self.cities)} şehir, {len(self._summaries)} yüklendi")
+
+    def _layout(self):
+        """
+        Görünen aralıktaki şehirleri havuzdaki satırlara yerleştirir. Satır i % havuz_boyu konumunu gösterir;
+        bir satır kaydırmada yalnızca görünüme yeni giren konumun satırı yeniden doldurulur.
+        """
+        start = time.perf_counter()
+        height, width = self.canvas.winfo_height(), self.canvas.winfo_width()
+        if height <= 1:
+            # Henüz çizilmemiş Canvas'ın gerçek boyutu yoktur; istenen boyut kullanılır, <Configure> gelince düzeltilir
+            height, width = self.canvas.winfo_reqheight(), self.canvas.winfo_reqwidth()
+        pool_size = min(height // ROW_HEIGHT + 2, len(self.cities))
+        while len(self._rows) < pool_size:
+            self._rows.append(DashboardRow(self.canvas, self.icons, self.icon_size, self._select_index, self._remove_index,
+                                           self._on_mouse_wheel))
+
+        first = max(0, int(self.canvas.canvasy(0)) // ROW_HEIGHT)
+        visible = range(first, min(first + pool_size, len(self.cities)))
+        shown = set()
+        changed = 0
+        for index in visible:
+            row = self._rows[index % pool_size]
+            changed += row.show(index, self._row_state(self.cities[index]), width)
+            shown.add(id(row))
+        for row in self._rows:
+            if id(row) not in shown:
+                row.hide()
+        self.last_changed = changed
+        self.last_render_ms = (time.perf_counter() - start) * 1000
+
+    def _row_state(self, city):
+        summary = self._summaries.get(normalize_city_key(city))
+        if summary is None:
+            return RowState(city, None, "--", "", "", "Yükleniyor...")
+        if not summary.ok:
+            return RowState(city, None, "--", "", "", summary.error)
+        units = self._units()
+        temp_suffix, wind_suffix = UNIT_SUFFIXES[units]
+        temp_factor, temp_offset = unit_conversion("temp", CANONICAL_UNITS, units)
+        speed_factor, speed_offset = unit_conversion("speed", CANONICAL_UNITS, units)
+        humidity = summary.humidity if summary.humidity is not None else "--"
+        status = f"kayıtlı veri, {format_age(time.time() - summary.stored_at)}" if summary.stored_at is not None else ""
+        return RowState(
+            title=summary.title,
+            icon_code=summary.icon_code,
+            temp=f"{summary.temp * temp_factor + temp_offset:.1f}{temp_suffix}",
+            description=summary.description.capitalize(),
+            details=f"Nem: {humidity}%  Rüzgar: {summary.wind_speed * speed_factor + speed_offset:.1f} {wind_suffix}",
+            status=status
+        )
+
+    def rerender(self):
+        """Birim değişikliği gibi durumlarda görünen satırları yeniden çizer; ağ isteği yapılmaz."""
+        self._layout()
+
+    def _request(self, city, allow_stale=True):
+        self.scheduler.submit(
+            normalize_city_key(city),
+            functools.partial(self._fetch_summary, city, allow_stale=allow_stale),
+            self._deliver,
+            supersede=False
+        )
+
+    def _fetch_summary(self, city, cancel, allow_stale=True):
+        # Worker thread'inde çalışır; yanıtın tamamı burada bırakılır, arayüze yalnızca özet gider
+        return CitySummary.from_result(self._fetch(city, cancel, allow_stale=allow_stale))
+
+    # Zamanlayıcı aynı callback'i aynı işe iki kez bağlamaz; bağlı metot eşit sayıldığı için sabit kalır
+    def _deliver(self, summary):
+        self._post(self._on_result, summary)
+
+    def _on_result(self, summary):
+        """Arayüz thread'inde çalışır. Listeden çıkarılmış şehirlerin sonuçları atılır."""
+        key = normalize_city_key(summary.city)
+        if key not in self._keys:
+            return
+        previous = self._summaries.get(key)
+        if previous is not None and previous.ok and not summary.ok:
+            # Yenileme başarısızsa eldeki veri korunur
+            self.refresher.report(summary.city, changed=False)
+            return
+        self._summaries[key] = summary
+        # Hatalı şehirler de takibe alınır ve değişmemiş sayılır; böylece yeniden denemeler kendiliğinden seyrelir
+        changed = summary.ok and (previous is None or not previous.ok or previous.dt != summary.dt)
+        self.refresher.track(summary.city)
+        self.refresher.report(summary.city, changed)
+        self._update_count()
+        self._layout()
+
+    def _refresh_city(self, city):
+        self._request(city, allow_stale=False)
+
+    def refresh_all(self):
+        for city in self.cities:
+            self._refresh_city(city)
+
+    def _add(self, city):
+        key = normalize_city_key(city)
+        if key in self._keys:
+            return False
+        self._keys.add(key)
+        self.cities.append(city)
+        self._request(city)
+        return True
+
+    def add_city(self, city):
+        """Şehri listenin sonuna ekler ve çeker; zaten listedeyse False döndürür."""
+        city = city.strip()
+        if not city or not self._add(city):
+            return False
+        self._save()
+        self._update_scrollregion()
+        # Yeni şehrin görünmesi için liste sonuna kaydırılır
+        self.canvas.yview_moveto(1.0)
+        self._layout()
+        return True
+
+    def remove_city(self, city):
+        key = normalize_city_key(city)
+        if key not in self._keys:
+            return
+        self._keys.discard(key)
+        self.cities = [other for other in self.cities if normalize_city_key(other) != key]
+        self._summaries.pop(key, None)
+        self.refresher.untrack(city)
+        self._save()
+        self._update_scrollregion()
+        self._layout()
+
+    def _save(self):
+        if self.cities_file:
+            save_watched_cities(self.cities_file, self.cities)
+
+    def _on_add_click(self, event=None):
+        if self.add_city(self.city_entry.get()):
+            self.city_entry.delete(0, tk.END)
+
+    def _select_index(self, index):
+        if index is not None and index < len(self.cities):
+            self._on_select(self.cities[index])
+
+    def _remove_index(self, index):
+        if index is not None and index < len(self.cities):
+            self.remove_city(self.cities[index])
+
+    def pause(self):
+        self.refresher.pause()
+
+    def resume(self):
+        self.refresher.resume()
+
+    def close(self):
+        self.refresher.stop()
+        self.scheduler.shutdown()
@@ -0,0 +1,99 @@
+# forecastCards.py
+"""
+Saatlik ve günlük tahmin şeritleri için yeniden kullanılan kart widget'ları.
+Kartlar bir kez oluşturulur; yenilemede yalnızca değişen metin/ikonlar yeniden yapılandırılır.
+"""
+
+import time
+import tkinter as tk
+from collections import namedtuple
+
+# Bir kartta gösterilecek değerler. `lines`, başlık ve ikonun altındaki metin satırlarıdır.
+CardState = namedtuple("CardState", ["title", "icon_code", "lines", "description"])
+
+
+class ForecastCard:
+    """Başlık, ikon, sabit sayıda metin satırı ve açıklamadan oluşan tek bir tahmin kartı."""
+    def __init__(self, parent, column, line_count):
+        self.column = column
+        self.frame = tk.Frame(parent, bd=1, relief="solid", padx=5, pady=5)
+        self.title_label = tk.Label(self.frame, font=("Helvetica", 10, "bold"))
+        self.title_label.pack()
+        self.icon_label = tk.Label(self.frame)
+        self.icon_label.pack()
+        self.line_labels = []
+        for _ in range(line_count):
+            label = tk.Label(self.frame, font=("Helvetica", 10))
+            label.pack()
+            self.line_labels.append(label)
+        self.description_label = tk.Label(self.frame, font=("Helvetica", 9), wraplength=80)
+        self.description_label.pack()
+        self.state = None
+        self.visible = False
+
+    def render(self, state, icons, icon_size):
+        """
+        Kartı `state` ile günceller; yalnızca önceki durumdan farklı olan widget'lara dokunur.
+        Kartta bir değişiklik yapıldıysa True döndürür.
+        """
+        previous = self.state
+        changed = False
+        if previous is None or previous.title != state.title:
+            self.title_label.config(text=state.title)
+            changed = True
+        if previous is None or previous.icon_code != state.icon_code:
+            photo = icons.get(state.icon_code, icon_size)
+            self.icon_label.config(image=photo or "", text="" if photo else "İkon Yok")
+            changed = True
+        for i, (label, text) in enumerate(zip(self.line_labels, state.lines)):
+            if previous is None or previous.lines[i] != text:
+                label.config(text=text)
+                changed = True
+        if previous is None or previous.description != state.description:
+            self.description_label.config(text=state.description)
+            changed = True
+        if not self.visible:
+            self.frame.grid(row=0, column=self.column, padx=5, pady=5)
+            self.visible = True
+            changed = True
+        self.state = state
+        return changed
+
+    def hide(self):
+        # grid_remove, widget'ları ve son durumlarını korur; tekrar gösterim ucuzdur
+        if self.visible:
+            self.frame.grid_remove()
+            self.visible = False
+
+
+class ForecastStrip:
+    """
+    Canvas içindeki yatay kaydırmalı bir şeritte önceden oluşturulmuş `capacity` kartlık havuz.
+    update() her yenilemenin süresini ve kaç kartın değiştiğini last_render_ms/last_changed'e yazar.
+    """
+    def __init__(self, inner_frame, canvas, capacity, line_count, icons, icon_size):
+        self.canvas = canvas
+        self.icons = icons
+        self.icon_size = icon_size
+        self.cards = [ForecastCard(inner_frame, column, line_count) for column in range(capacity)]
+        self.last_render_ms = 0.0
+        self.last_changed = 0
+        # Kaydırma alanı, her yenilemede update_idletasks() ile zorlamak yerine iç çerçeve boyut değiştirdiğinde güncellenir
+        inner_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+
+    def update(self, states):
+        start = time.perf_counter()
+        changed = 0
+        for card, state in zip(self.cards, states):
+            changed += card.render(state, self.icons, self.icon_size)
+        for card in self.cards[len(states):]:
+            if card.visible:
+                card.hide()
+                changed += 1
+        self.last_changed = changed
+        self.last_render_ms = (time.perf_counter() - start) * 1000
+        return changed
+
+    def clear(self):
+        for card in self.cards:
+            card.hide()
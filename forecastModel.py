@@ -0,0 +1,236 @@
+# forecastModel.py
+"""
+/onecall yanıtının sıkıştırılmış, sütun tabanlı gösterimi. Saatlik ve günlük tahminler
+iç içe sözlük listeleri yerine NumPy dizileri olarak tutulur; bu hem şehir başına belleği
+azaltır hem de "önümüzdeki N saatin min/max/ortalaması" gibi toplamları vektörel yapar.
+"""
+
+import json
+
+import numpy as np
+
+from konumBazli import unit_conversion
+from config import CANONICAL_UNITS
+
+# İkon kodu küçük bir tamsayıda tutulur: alt 7 bit durum numarası (01, 02, ... 50), üst bit gece
+_NIGHT_BIT = 0x80
+
+
+def encode_icon(icon_code):
+    """'10n' -> 0x8a. Boş ya da geçersiz kod 0 olur."""
+    if not icon_code:
+        return 0
+    try:
+        value = int(icon_code[:2])
+    except ValueError:
+        return 0
+    return value | (_NIGHT_BIT if icon_code.endswith("n") else 0)
+
+
+def decode_icon(value):
+    """0x8a -> '10n'. 0 için None döndürür."""
+    value = int(value)
+    if not value:
+        return None
+    return f"{value & ~_NIGHT_BIT:02d}{'n' if value & _NIGHT_BIT else 'd'}"
+
+
+def _weather(record):
+    weather = record.get("weather") or [{}]
+    return weather[0]
+
+
+class _Descriptions:
+    """Açıklama metinlerini bir kez saklayıp her kayıt için küçük bir indeks tutar."""
+    def __init__(self):
+        self.texts = []
+        self._index = {}
+
+    def index(self, text):
+        i = self._index.get(text)
+        if i is None:
+            i = self._index[text] = len(self.texts)
+            self.texts.append(text)
+        return i
+
+
+class CurrentConditions:
+    """Güncel hava durumu kaydı."""
+    # JSON'daki aynı adlı anahtarlardan doğrudan kopyalanan alanlar; ikon ve açıklama "weather" listesinden okunur
+    JSON_FIELDS = ("dt", "temp", "feels_like", "pressure", "humidity", "dew_point", "uvi", "clouds",
+                   "visibility", "wind_speed", "wind_deg", "wind_gust", "sunrise", "sunset")
+    __slots__ = JSON_FIELDS + ("icon_code", "description")
+
+    TEMP_FIELDS = ("temp", "feels_like", "dew_point")
+    SPEED_FIELDS = ("wind_speed", "wind_gust")
+
+    @classmethod
+    def from_json(cls, data):
+        current = cls()
+        for name in cls.JSON_FIELDS:
+            setattr(current, name, data.get(name))
+        weather = _weather(data)
+        current.icon_code = weather.get("icon")
+        current.description = weather.get("description", "")
+        return current
+
+    def converted(self, temp_factors, speed_factors):
+        copy = CurrentConditions()
+        for name in self.__slots__:
+            setattr(copy, name, getattr(self, name))
+        for names, (factor, offset) in ((self.TEMP_FIELDS, temp_factors), (self.SPEED_FIELDS, speed_factors)):
+            for name in names:
+                value = getattr(self, name)
+                if value is not None:
+                    setattr(copy, name, round(value * factor + offset, 2))
+        return copy
+
+
+class _Columns:
+    """
+    Aynı uzunlukta NumPy dizilerinden oluşan tahmin tablosu. Alt sınıflar COLUMNS ile
+    (sütun adı, dtype, kayıttan değer okuyan fonksiyon) üçlülerini tanımlar.
+    """
+    __slots__ = ("columns", "descriptions")
+
+    COLUMNS = ()
+    TEMP_COLUMNS = ()
+    SPEED_COLUMNS = ()
+
+    def __init__(self, columns, descriptions):
+        self.columns = columns
+        self.descriptions = descriptions
+
+    @classmethod
+    def from_json(cls, records):
+        count = len(records)
+        descriptions = _Descriptions()
+        columns = {}
+        for name, dtype, getter in cls.COLUMNS:
+            if name == "description":
+                columns[name] = np.fromiter((descriptions.index(getter(r)) for r in records), dtype=dtype, count=count)
+            else:
+                columns[name] = np.fromiter((getter(r) for r in records), dtype=dtype, count=count)
+        return cls(columns, tuple(descriptions.texts))
+
+    def __len__(self):
+        return len(self.columns["dt"])
+
+    def __getattr__(self, name):
+        try:
+            return self.columns[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def icon_code(self, i):
+        return decode_icon(self.columns["icon"][i])
+
+    def description(self, i):
+        return self.descriptions[self.columns["description"][i]]
+
+    def converted(self, temp_factors, speed_factors):
+        columns = dict(self.columns)
+        for names, (factor, offset) in ((self.TEMP_COLUMNS, temp_factors), (self.SPEED_COLUMNS, speed_factors)):
+            for name in names:
+                columns[name] = np.round(self.columns[name] * factor + offset, 2)
+        return type(self)(columns, self.descriptions)
+
+    def stats(self, column, count=None):
+        """İlk `count` kayıt (verilmezse hepsi) için `column` sütununun (min, max, ortalama) değerleri."""
+        values = self.columns[column][:count]
+        if not len(values):
+            return None
+        return float(values.min()), float(values.max()), float(values.mean())
+
+    @property
+    def nbytes(self):
+        return sum(column.nbytes for column in self.columns.values())
+
+
+class HourlyForecast(_Columns):
+    """Saatlik tahmin sütunları: dt, temp, feels_like, humidity, pressure, wind_speed, pop, uvi, icon, description."""
+    __slots__ = ()
+
+    COLUMNS = (
+        ("dt", np.int64, lambda r: r["dt"]),
+        ("temp", np.float64, lambda r: r["temp"]),
+        ("feels_like", np.float64, lambda r: r.get("feels_like", np.nan)),
+        ("humidity", np.uint8, lambda r: r.get("humidity", 0)),
+        ("pressure", np.uint16, lambda r: r.get("pressure", 0)),
+        ("wind_speed", np.float64, lambda r: r.get("wind_speed", np.nan)),
+        ("pop", np.float32, lambda r: r.get("pop", 0.0)),
+        ("uvi", np.float32, lambda r: r.get("uvi", 0.0)),
+        ("icon", np.uint8, lambda r: encode_icon(_weather(r).get("icon"))),
+        ("description", np.uint16, lambda r: _weather(r).get("description", "")),
+    )
+    TEMP_COLUMNS = ("temp", "feels_like")
+    SPEED_COLUMNS = ("wind_speed",)
+
+
+class DailyForecast(_Columns):
+    """Günlük tahmin sütunları: dt, temp_min, temp_max, temp_day, temp_night, humidity, wind_speed, pop, uvi, icon, description."""
+    __slots__ = ()
+
+    COLUMNS = (
+        ("dt", np.int64, lambda r: r["dt"]),
+        ("temp_min", np.float64, lambda r: r["temp"]["min"]),
+        ("temp_max", np.float64, lambda r: r["temp"]["max"]),
+        ("temp_day", np.float64, lambda r: r["temp"].get("day", np.nan)),
+        ("temp_night", np.float64, lambda r: r["temp"].get("night", np.nan)),
+        ("humidity", np.uint8, lambda r: r.get("humidity", 0)),
+        ("wind_speed", np.float64, lambda r: r.get("wind_speed", np.nan)),
+        ("pop", np.float32, lambda r: r.get("pop", 0.0)),
+        ("uvi", np.float32, lambda r: r.get("uvi", 0.0)),
+        ("icon", np.uint8, lambda r: encode_icon(_weather(r).get("icon"))),
+        ("description", np.uint16, lambda r: _weather(r).get("description", "")),
+    )
+    TEMP_COLUMNS = ("temp_min", "temp_max", "temp_day", "temp_night")
+    SPEED_COLUMNS = ("wind_speed",)
+
+
+class Forecast:
+    """
+    Ayrıştırılmış /onecall yanıtı: `current` (CurrentConditions), `hourly` (HourlyForecast)
+    ve `daily` (DailyForecast). Değerler `units` birimindedir.
+    """
+    __slots__ = ("lat", "lon", "timezone_offset", "units", "current", "hourly", "daily")
+
+    @classmethod
+    def from_json(cls, payload, units=CANONICAL_UNITS):
+        """/onecall yanıtından (sözlük, str ya da bytes) Forecast oluşturur."""
+        if isinstance(payload, (str, bytes, bytearray)):
+            payload = json.loads(payload)
+        forecast = cls()
+        forecast.lat = payload.get("lat")
+        forecast.lon = payload.get("lon")
+        forecast.timezone_offset = payload.get("timezone_offset", 0)
+        forecast.units = units
+        forecast.current = CurrentConditions.from_json(payload.get("current", {}))
+        forecast.hourly = HourlyForecast.from_json(payload.get("hourly", []))
+        forecast.daily = DailyForecast.from_json(payload.get("daily", []))
+        return forecast
+
+    def converted(self, units):
+        """Aynı tahminin `units` birimindeki kopyasını döndürür; diziler tek işlemde dönüştürülür."""
+        if units == self.units:
+            return self
+        temp_factors = unit_conversion("temp", self.units, units)
+        speed_factors = unit_conversion("speed", self.units, units)
+        forecast = Forecast()
+        forecast.lat = self.lat
+        forecast.lon = self.lon
+        forecast.timezone_offset = self.timezone_offset
+        forecast.units = units
+        forecast.current = self.current.converted(temp_factors, speed_factors)
+        forecast.hourly = self.hourly.converted(temp_factors, speed_factors)
+        forecast.daily = self.daily.converted(temp_factors, speed_factors)
+        return forecast
+
+    def temp_stats(self, hours=24):
+        """Önümüzdeki `hours` saatin sıcaklığı için (min, max, ortalama)."""
+        return self.hourly.stats("temp", hours)
+
+    @property
+    def nbytes(self):
+        """Dizilerin kapladığı bellek (bayt); Python nesne başlıkları dahil değildir."""
+        return self.hourly.nbytes + self.daily.nbytes
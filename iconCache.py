@@ -0,0 +1,107 @@
+# iconCache.py
+"""
+Hava durumu ikonları için önbellek. assets/ altındaki her *@2x.png bir kez çözülür,
+istenen her boyut için bir kez yeniden boyutlandırılır ve hazır PhotoImage olarak saklanır.
+PIL ilk ikon çözülürken yüklenir; modülü içe aktarmak pencerenin açılışını geciktirmez.
+"""
+
+import glob
+import os
+import threading
+
+from config import WEATHER_ICONS_DIR
+import metrics
+
+ICON_SUFFIX = "@2x.png"
+
+
+class IconCache:
+    """
+    PNG çözme ve LANCZOS yeniden boyutlandırma yalnızca PIL kullandığı için warm_async() ile
+    arka plan thread'inde yapılabilir. PhotoImage nesneleri Tk gerektirdiğinden ana thread'de,
+    get() ile ilk istendiklerinde oluşturulur ve sonra yeniden kullanılır.
+    """
+    def __init__(self, icons_dir=WEATHER_ICONS_DIR, sizes=(100, 50)):
+        self.icons_dir = icons_dir
+        self.sizes = tuple(sizes)
+        self._sources = {}  # ikon kodu -> çözülmüş RGBA görüntü
+        self._resized = {}  # (ikon kodu, boyut) -> yeniden boyutlandırılmış görüntü
+        self._photos = {}   # (ikon kodu, boyut) -> ImageTk.PhotoImage
+        self._missing = set()  # dosyası olmayan ikon kodları; uyarı bir kez basılır
+        self._lock = threading.Lock()
+
+    def _path(self, icon_code):
+        return os.path.join(self.icons_dir, f"{icon_code}{ICON_SUFFIX}")
+
+    def available_codes(self):
+        pattern = os.path.join(self.icons_dir, f"*{ICON_SUFFIX}")
+        return sorted(os.path.basename(path)[:-len(ICON_SUFFIX)] for path in glob.glob(pattern))
+
+    def _resolve(self, icon_code):
+        """
+        Dosyası olan ikon kodunu döndürür. assets/ yalnızca gündüz ikonlarını içerdiği için
+        gece ikonları (ör. 01n) gündüz karşılığına (01d) düşer. Hiçbiri yoksa None.
+        """
+        if os.path.exists(self._path(icon_code)):
+            return icon_code
+        day_code = f"{icon_code[:-1]}d"
+        if icon_code.endswith("n") and os.path.exists(self._path(day_code)):
+            return day_code
+        return None
+
+    def _resized_image(self, icon_code, size):
+        from PIL import Image
+
+        key = (icon_code, size)
+        with self._lock:
+            image = self._resized.get(key)
+            if image is None:
+                source = self._sources.get(icon_code)
+                if source is None:
+                    with Image.open(self._path(icon_code)) as f:
+                        source = f.convert("RGBA")
+                    self._sources[icon_code] = source
+                image = source.resize((size, size), Image.Resampling.LANCZOS)
+                self._resized[key] = image
+            return image
+
+    def warm(self):
+        """Bütün ikonları tüm boyutlarda çözer ve boyutlandırır. Tk'ya dokunmaz, her thread'de çağrılabilir."""
+        for icon_code in self.available_codes():
+            for size in self.sizes:
+                try:
+                    self._resized_image(icon_code, size)
+                except OSError as e:
+                    print(f"İkon yüklenirken hata: {e}")
+
+    def warm_async(self):
+        thread = threading.Thread(target=self.warm, daemon=True)
+        thread.start()
+        return thread
+
+    def get(self, icon_code, size):
+        """
+        İkonun `size` x `size` PhotoImage'ını döndürür; ikon bulunamazsa None. Ana (Tk) thread'de çağrılmalıdır.
+        """
+        if not icon_code or icon_code in self._missing:
+            return None
+        photo = self._photos.get((icon_code, size))
+        if photo is not None:
+            metrics.inc("icon_cache_lookups_total", result="hit")
+            return photo
+        metrics.inc("icon_cache_lookups_total", result="miss")
+
+        resolved = self._resolve(icon_code)
+        if resolved is None:
+            self._missing.add(icon_code)
+            print(f"Uyarı: İkon dosyası bulunamadı: {self._path(icon_code)}")
+            return None
+        from PIL import ImageTk
+
+        try:
+            photo = ImageTk.PhotoImage(self._resized_image(resolved, size))
+        except OSError as e:
+            print(f"İkon yüklenirken hata: {e}")
+            return None
+        self._photos[(icon_code, size)] = photo
+        return photo
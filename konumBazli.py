@@ -1,112 +1,917 @@
-import requests
 import json
+import os
+import re
+import threading
 import time 
+import unicodedata
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from config import OPENWEATHER_API_KEY, OPENWEATHER_BASE_URL, OPENWEATHER_GEOCODING_URL, API_LANG, API_UNITS
+from config import GEOCODE_CACHE_FILE, GEOCODE_CACHE_SIZE, GEOCODE_CACHE_TTL
+from config import DEBUG_BLOCKING_IO
+from config import HTTP_POOL_SIZE, HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT
+from config import ASYNC_MAX_CONCURRENCY
+from config import NEARBY_RADIUS_KM
+from config import CANONICAL_UNITS
+from config import DEMO_SNAPSHOT_DB
+from retryPolicy import RetryPolicy, CircuitBreaker
+import metrics
+
+# Türkçe karakterleri ASCII karşılıklarına indirger (ı/İ ayrıca normalize_city_key içinde ele alınır)
+_TR_ASCII = str.maketrans("çğıöşüâîû", "cgiosuaiu")
+
+
+def normalize_city_key(city_name):
+    """
+    Şehir adını önbellek anahtarına çevirir. Büyük/küçük harf, fazladan boşluk ve
+    Türkçe karakter farkları ('İSTANBUL', 'istanbul', 'Istanbul') aynı anahtara iner.
+    """
+    text = " ".join(city_name.split())
+    # str.lower() Türkçe I/İ harflerini doğru küçültmez, önce elle çeviriyoruz
+    text = text.replace("I", "ı").replace("İ", "i").lower()
+    text = unicodedata.normalize("NFKD", text.translate(_TR_ASCII))
+    return "".join(ch for ch in text if not unicodedata.combining(ch))
+
+
+class Location(namedtuple("Location", ["lat", "lon", "name", "country"])):
+    """
+    Geocoding sonucu. Tuple olduğu için `lat, lon, name, country = ...` şeklinde açılabilir.
+    """
+    __slots__ = ()
+
+    def display_name(self, fallback=None):
+        """Arayüzde gösterilecek 'Ad, Ülke' metnini döndürür."""
+        name = self.name or fallback
+        if name and self.country:
+            return f"{name}, {self.country}"
+        return name
+
+
+_NO_LOCATION = Location(None, None, None, None)
+
+
+class WeatherResult(namedtuple("WeatherResult", ["requested_city", "display_name", "weather", "error", "elapsed", "forecast", "stored_at"],
+                               defaults=(0.0, None, None))):
+    """
+    Bir şehir isteğinin tamamen çözümlenmiş sonucu. Worker thread'de üretilir,
+    arayüz thread'inde yalnızca okunur (render edilir); oluşturulduktan sonra değiştirilmez.
+    `elapsed`, sonucun üretilmesinin kaç saniye sürdüğünü gösterir. `forecast`, isteyen
+    çağıranların (ör. arayüz) worker thread'de doldurduğu ayrıştırılmış forecastModel.Forecast'tır;
+    sonucu uzun süre tutan çağıranlar ayrıştırdıktan sonra ham `weather` sözlüğünü bırakabilir.
+    Veri ağdan değil yerel anlık görüntüden (SnapshotStore) geldiyse `stored_at` kaydedildiği zamandır.
+    """
+    __slots__ = ()
+
+    @property
+    def ok(self):
+        return self.weather is not None or self.forecast is not None
+
+    @property
+    def is_snapshot(self):
+        return self.stored_at is not None
+
+
+def format_age(seconds):
+    """Geçen süreyi '5 dakika önce' gibi okunur bir metne çevirir."""
+    seconds = max(0, int(seconds))
+    for unit, name in ((86400, "gün"), (3600, "saat"), (60, "dakika")):
+        if seconds >= unit:
+            return f"{seconds // unit} {name} önce"
+    return "az önce"
+
+
+# "40.18, 29.06" ya da "40.18 29.06" (enlem, boylam; ondalık ayırıcı nokta)
+_COORDINATES_RE = re.compile(r"^\s*([-+]?\d+(?:\.\d+)?)\s*[,; ]\s*([-+]?\d+(?:\.\d+)?)\s*$")
+
+
+def parse_coordinates(text):
+    """
+    "enlem, boylam" biçimindeki metni (lat, lon) ikilisine çevirir. Metin koordinat değilse ya da
+    değerler geçerli aralıkta değilse None döndürür; böylece arama kutusundaki metin şehir adı sayılır.
+    """
+    match = _COORDINATES_RE.match(text)
+    if match is None:
+        return None
+    lat, lon = float(match.group(1)), float(match.group(2))
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        return None
+    return lat, lon
+
+
+# Birim sistemi -> (sıcaklık, rüzgar hızı) gösterim ekleri
+UNIT_SUFFIXES = {
+    "metric": ("°C", "m/s"),
+    "imperial": ("°F", "mph"),
+    "standard": ("K", "m/s"),
+}
+
+# Birim sistemi -> °C ve m/s'ye göre (çarpan, sabit) doğrusal dönüşüm
+_TEMP_SCALES = {"metric": (1.0, 0.0), "imperial": (9 / 5, 32.0), "standard": (1.0, 273.15)}
+_SPEED_SCALES = {"metric": (1.0, 0.0), "imperial": (2.2369362920544, 0.0), "standard": (1.0, 0.0)}
+
+_TEMP_FIELDS = ("temp", "feels_like", "dew_point")
+_SPEED_FIELDS = ("wind_speed", "wind_gust")
+
+
+def unit_conversion(kind, from_units, to_units):
+    """
+    `kind` ("temp" ya da "speed") için `from_units` -> `to_units` dönüşümünün (çarpan, sabit)
+    katsayılarını döndürür: yeni_değer = değer * çarpan + sabit. Sayılara da dizilere de uygulanabilir.
+    """
+    scales = _TEMP_SCALES if kind == "temp" else _SPEED_SCALES
+    from_scale, from_offset = scales[from_units]
+    to_scale, to_offset = scales[to_units]
+    factor = to_scale / from_scale
+    return factor, to_offset - from_offset * factor
+
+
+def _linear_converter(kind, from_units, to_units):
+    factor, offset = unit_conversion(kind, from_units, to_units)
+    return lambda value: round(value * factor + offset, 2)
+
+
+def _convert_column(records, field, convert):
+    """
+    Kayıt listesinde tek bir alanı sütun olarak dönüştürür. Günlük tahmindeki
+    temp/feels_like gibi iç içe sözlükler alt alan bazında dönüştürülür.
+    """
+    rows = [record for record in records if field in record]
+    if not rows:
+        return
+    first = rows[0][field]
+    if isinstance(first, dict):
+        nested = [dict(record[field]) for record in rows]
+        for record, values in zip(rows, nested):
+            record[field] = values
+        for sub_field in first:
+            _convert_column(nested, sub_field, convert)
+    else:
+        for record, value in zip(rows, map(convert, [record[field] for record in rows])):
+            record[field] = value
+
+
+def _convert_records(records, convert_temp, convert_speed):
+    records = [dict(record) for record in records]
+    for field in _TEMP_FIELDS:
+        _convert_column(records, field, convert_temp)
+    for field in _SPEED_FIELDS:
+        _convert_column(records, field, convert_speed)
+    return records
+
+
+def convert_units(weather_data, units, from_units=CANONICAL_UNITS):
+    """
+    `from_units` biriminde çekilmiş /onecall yanıtının `units` birimindeki görünümünü döndürür.
+    Ağ isteği yapılmaz ve verilen sözlük değiştirilmez; current, hourly ve daily dizileri
+    alan alan tek geçişte dönüştürülür.
+    """
+    if weather_data is None or units == from_units:
+        return weather_data
+    convert_temp = _linear_converter("temp", from_units, units)
+    convert_speed = _linear_converter("speed", from_units, units)
+
+    converted = dict(weather_data)
+    if "current" in weather_data:
+        converted["current"] = _convert_records([weather_data["current"]], convert_temp, convert_speed)[0]
+    for section in ("hourly", "daily"):
+        if section in weather_data:
+            converted[section] = _convert_records(weather_data[section], convert_temp, convert_speed)
+    return converted
+
+
+class RequestCancelled(Exception):
+    """CancelToken ile iptal edilen bir istek tarafından fırlatılır."""
+
+
+class CancelToken:
+    """
+    Bir isteğin iptal edildiğini worker thread'e bildirir. Yeniden deneme beklemeleri
+    token.wait() ile yapıldığı için iptal, bekleyen geri çekilmeyi hemen sonlandırır.
+    """
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def wait(self, timeout):
+        """`timeout` saniye bekler; bu sürede iptal edilirse True döndürür."""
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise RequestCancelled()
+
+
+class UIThreadBlockingError(AssertionError):
+    """Debug modunda, arayüz thread'inden bloklayan bir ağ çağrısı yapıldığında fırlatılır."""
+
+
+# set_ui_thread() ile işaretlenen arayüz (Tk ana) thread'i
+_ui_thread = None
+
+
+def set_ui_thread(thread=None):
+    """
+    Verilen thread'i (varsayılan: çağıran thread) arayüz thread'i olarak işaretler.
+    DEBUG_BLOCKING_IO açıksa bu thread'den yapılan ağ istekleri UIThreadBlockingError fırlatır.
+    """
+    global _ui_thread
+    _ui_thread = thread or threading.current_thread()
+
+
+def _assert_not_ui_thread(what):
+    if DEBUG_BLOCKING_IO and _ui_thread is not None and threading.current_thread() is _ui_thread:
+        raise UIThreadBlockingError(f"Bloklayan çağrı arayüz thread'inde yapıldı: {what}. Ağ istekleri worker thread'de yapılmalı.")
+
+
+def write_json_atomic(path, data, **dump_kwargs):
+    """
+    `data`yı JSON olarak `path`e yazar; önce geçici dosyaya yazılıp yerine taşındığı için yarım yazılmış
+    dosya kalmaz. Klasör yoksa oluşturulur. Hata durumunda OSError fırlatır.
+    """
+    tmp_path = f"{path}.tmp"
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, **dump_kwargs)
+    os.replace(tmp_path, path)
+
+
+class GeocodeCache:
+    """
+    Şehir adı -> koordinat eşlemesi için TTL'li LRU önbellek.
+    `path` verilirse kayıtlar diske kompakt JSON olarak yazılır; uygulama yeniden
+    başlatıldığında önbellek sıcak başlar.
+    """
+    def __init__(self, path=None, maxsize=GEOCODE_CACHE_SIZE, ttl=GEOCODE_CACHE_TTL):
+        self.path = path
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # anahtar -> (lat, lon, name, country, stored_at)
+        self._lock = threading.Lock()
+        if self.path:
+            self._load()
+
+    def get(self, city_name):
+        key = normalize_city_key(city_name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry[4] > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return Location(*entry[:4])
+
+    def put(self, city_name, location):
+        key = normalize_city_key(city_name)
+        with self._lock:
+            self._entries[key] = (location.lat, location.lon, location.name, location.country, int(time.time()))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            if self.path:
+                self._save()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                rows = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"Uyarı: Geocoding önbelleği okunamadı ({e}), boş önbellekle devam ediliyor.")
+            return
+        now = time.time()
+        # Dosyadaki sıra LRU sırasıdır (en eski başta)
+        for key, lat, lon, name, country, stored_at in rows[-self.maxsize:]:
+            if now - stored_at <= self.ttl:
+                self._entries[key] = (lat, lon, name, country, stored_at)
+
+    def _save(self):
+        # Kilit altında çağrılır
+        rows = [[key, *entry] for key, entry in self._entries.items()]
+        try:
+            write_json_atomic(self.path, rows, separators=(",", ":"))
+        except OSError as e:
+            print(f"Uyarı: Geocoding önbelleği diske yazılamadı: {e}")
+
+
+def _endpoint_name(url):
+    """Ölçüm etiketi olarak uç nokta adı: .../geo/1.0/direct -> 'direct', .../onecall -> 'onecall'."""
+    return url.rsplit("/", 1)[-1]
+
+
+def create_session(pool_size=HTTP_POOL_SIZE):
+    """
+    Keep-alive bağlantıları host başına `pool_size` adede kadar yeniden kullanan bir requests.Session oluşturur.
+    Yeniden deneme mantığı WeatherAPI'de olduğu için adaptörün kendi yeniden denemesi kapalıdır.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
 
 class WeatherAPI:
-    def __init__(self, api_key=OPENWEATHER_API_KEY, base_url=OPENWEATHER_BASE_URL, geocoding_url=OPENWEATHER_GEOCODING_URL, lang=API_LANG, units=API_UNITS):
+    def __init__(self, api_key=OPENWEATHER_API_KEY, base_url=OPENWEATHER_BASE_URL, geocoding_url=OPENWEATHER_GEOCODING_URL, lang=API_LANG, units=API_UNITS, geocode_cache=None,
+                 session=None, pool_size=HTTP_POOL_SIZE, timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT), response_cache=None,
+                 retry_policy=None, snapshot_store=None, nearby_radius_km=NEARBY_RADIUS_KM):
         self.api_key = api_key
         self.base_url = base_url
         self.geocoding_url = geocoding_url
         self.lang = lang
         self.units = units
+        self.geocode_cache = geocode_cache if geocode_cache is not None else GeocodeCache(GEOCODE_CACHE_FILE)
+        # (bağlantı, okuma) zaman aşımı; takılan bir soket worker thread'i sonsuza kadar bekletmez
+        self.timeout = timeout
+        # Oturum (ve requests'in kendisi) ilk istekte oluşturulur; arayüz açılışını geciktirmez
+        self._session = session
+        self._pool_size = pool_size
+        self._session_lock = threading.Lock()
+        # weatherCache, Location ve normalize_city_key için bu modülü içe aktardığı için burada yüklenir
+        from weatherCache import NearbyIndex, create_response_cache
+
+        self.response_cache = response_cache if response_cache is not None else create_response_cache()
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        # Bu istemcinin önbelleğe yazdığı konumlar; yakındaki bir konum onların taze yanıtını kullanabilir
+        self.nearby_radius_km = nearby_radius_km
+        self.nearby_index = NearbyIndex(cell_km=nearby_radius_km)
+        # Her şehrin son başarılı sonucu; yalnızca verilirse tutulur (arayüz create_snapshot_store() verir).
+        # Ekransız araçlar arayüzün kayıt dosyasına yazmaz
+        self.snapshot_store = snapshot_store
+        self._breakers = {}  # uç nokta URL'si -> CircuitBreaker
+        self._breakers_lock = threading.Lock()
+
+    @property
+    def session(self):
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = create_session(self._pool_size)
+        return self._session
+
+    def close(self):
+        """Havuzdaki açık bağlantıları kapatır."""
+        if self._session is not None:
+            self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _breaker(self, url):
+        with self._breakers_lock:
+            breaker = self._breakers.get(url)
+            if breaker is None:
+                breaker = self._breakers[url] = CircuitBreaker()
+            return breaker
+
+    def _retry_delay(self, breaker, error, attempt, started, endpoint=None):
+        """
+        Başarısız denemeyi devre kesiciye işler ve yeniden deneme politikasına göre beklenecek süreyi
+        döndürür; tekrar denenmeyecekse None.
+        """
+        response = getattr(error, "response", None)
+        metrics.inc("http_errors_total", endpoint=endpoint,
+                    error=response.status_code if response is not None else type(error).__name__)
+        if self.retry_policy.is_retryable(error):
+            breaker.record_failure()
+        else:
+            # 4xx gibi yanıtlar sunucunun ayakta olduğunu gösterir
+            breaker.record_success()
+        delay = self.retry_policy.next_delay(attempt, error, time.monotonic() - started)
+        if delay is None:
+            metrics.inc("http_failures_total", endpoint=endpoint)
+            print(f"Hava durumu isteği başarısız oldu, tekrar denenmeyecek: {error}")
+        else:
+            metrics.inc("http_retries_total", endpoint=endpoint)
+            metrics.observe("http_retry_wait_seconds", delay, endpoint=endpoint)
+            print(f"Hava durumu isteği başarısız oldu ({error}). {delay:.1f} saniye sonra tekrar deniyorum...")
+        return delay
+
+    def _attempt_timeout(self, url, started):
+        """Sıradaki denemenin zaman aşımı; toplam süre dolduysa None (başarısızlık işlenir)."""
+        timeout = self.retry_policy.attempt_timeout(self.timeout, time.monotonic() - started)
+        if timeout is None:
+            metrics.inc("http_failures_total", endpoint=_endpoint_name(url))
+            print(f"Hava durumu isteği için ayrılan süre doldu, tekrar denenmeyecek: {url}")
+        return timeout
 
-    def _fetch_data_with_retry(self, url, params=None, max_retries=5, initial_delay=1):
+    def _fetch_data_with_retry(self, url, params=None, cancel=None):
         """
-        Bir URL'den veriyi başarısızlık durumunda üstel geri çekilme ile çeker.
+        Bir URL'den veriyi retry_policy'ye göre yeniden deneyerek çeker; başarısız olursa None döndürür.
+        Uç noktanın devresi açıksa istek hiç denenmeden None döner.
+        `cancel` (CancelToken) verilirse iptal edildiğinde bekleme kesilir ve RequestCancelled fırlatılır.
         """
-        if params is None:
-            params = {}
+        import requests
+
+        _assert_not_ui_thread(url)
+        # Çağıranın sözlüğünü değiştirmemek için kopyası üzerinde çalışılır
+        params = dict(params or {})
         params['appid'] = self.api_key
+        breaker = self._breaker(url)
+        started = time.monotonic()
         
-        for i in range(max_retries):
+        attempt = 0
+        while True:
+            if cancel is not None:
+                cancel.raise_if_cancelled()
+            if not breaker.allow():
+                metrics.inc("circuit_rejected_total", endpoint=_endpoint_name(url))
+                print(f"Hava durumu servisine ulaşılamıyor (devre açık), istek denenmedi: {url}")
+                return None
+            timeout = self._attempt_timeout(url, started)
+            if timeout is None:
+                return None
             try:
-                response = requests.get(url, params=params)
-                response.raise_for_status() 
-                return response.json()
+                data = self._request_json(url, params, timeout)
             except requests.exceptions.RequestException as e:
-                if i < max_retries - 1:
-                    delay = initial_delay * (2 ** i)
-                    print(f"Hava durumu isteği başarısız oldu ({e}). {delay} saniye sonra tekrar deniyorum...")
-                    time.sleep(delay)
-                else:
-                    print(f"Maksimum deneme sayısı aşıldı. Hava durumu isteği başarısız oldu: {e}")
+                delay = self._retry_delay(breaker, e, attempt, started, _endpoint_name(url))
+                if delay is None:
                     return None
+                if cancel is None:
+                    time.sleep(delay)
+                elif cancel.wait(delay):
+                    raise RequestCancelled()
+                attempt += 1
+            else:
+                breaker.record_success()
+                return data
 
-    def get_coordinates(self, city_name):
+    def _request_json(self, url, params, timeout=None):
         """
-        Şehir adından enlem ve boylam koordinatlarını alır.
+        Havuzlu oturum üzerinden tek bir GET isteği yapar. HTTP hatalarında requests istisnası fırlatır.
+        Ağ süresi ve JSON çözme süresi ayrı ölçülür. `timeout` verilmezse self.timeout kullanılır.
         """
+        endpoint = _endpoint_name(url)
+        with metrics.timer("http_request_seconds", endpoint=endpoint):
+            response = self.session.get(url, params=params, timeout=timeout or self.timeout)
+        response.raise_for_status() 
+        with metrics.timer("json_decode_seconds", endpoint=endpoint):
+            return response.json()
+
+    def _geocoding_request(self, city_name):
         url = f"{self.geocoding_url}/direct"
         params = {
             "q": city_name,
             "limit": 1 
         }
-        data = self._fetch_data_with_retry(url, params)
-        
-        if data and len(data) > 0:
-            return data[0]['lat'], data[0]['lon'], data[0].get('name'), data[0].get('country')
-        return None, None, None, None
+        return url, params
 
-    def get_weather_data(self, lat, lon):
+    def _reverse_geocoding_request(self, lat, lon):
+        url = f"{self.geocoding_url}/reverse"
+        params = {
+            "lat": lat,
+            "lon": lon,
+            "limit": 1
+        }
+        return url, params
+
+    @staticmethod
+    def _reverse_cache_key(lat, lon):
+        # ~100 m; şehir adlarıyla karışmaması için önekli
+        return f"@{lat:.3f},{lon:.3f}"
+
+    def _store_reverse_location(self, lat, lon, data):
         """
-        Verilen enlem ve boylam için güncel hava durumu ve tahmini (saatlik/günlük) verilerini çeker.
+        Ters geocoding yanıtını istenen koordinatlarla bir Location'a çevirir. Yakında yerleşim yoksa
+        (boş yanıt) adsız konum önbelleğe yazılır; istek başarısızsa (None) yazılmaz, sonra yeniden denenir.
         """
+        if data is None:
+            return Location(lat, lon, None, None)
+        place = data[0] if data else {}
+        location = Location(lat, lon, place.get("name"), place.get("country"))
+        self.geocode_cache.put(self._reverse_cache_key(lat, lon), location)
+        return location
+
+    def _store_location(self, city_name, data):
+        """Geocoding yanıtını Location'a çevirir ve önbelleğe yazar."""
+        if data and len(data) > 0:
+            location = Location(data[0]['lat'], data[0]['lon'], data[0].get('name'), data[0].get('country'))
+            self.geocode_cache.put(city_name, location)
+            return location
+        return _NO_LOCATION
+
+    def _weather_request(self, lat, lon):
         url = f"{self.base_url}/onecall"
         params = {
             "lat": lat,
             "lon": lon,
             "exclude": "minutely,alerts", 
-            "units": self.units,         
+            "units": CANONICAL_UNITS,    
             "lang": self.lang           
         }
-        data = self._fetch_data_with_retry(url, params)
-        return data
+        return url, params
+
+    def get_coordinates(self, city_name, cancel=None):
+        """
+        Şehir adından enlem ve boylam koordinatlarını alır.
+        Sonuçlar önbellekten gelir; yalnızca önbellekte olmayan şehirler için istek atılır.
+        """
+        cached = self.geocode_cache.get(city_name)
+        metrics.inc("geocode_cache_lookups_total", result="hit" if cached is not None else "miss")
+        if cached is not None:
+            return cached
+
+        data = self._fetch_data_with_retry(*self._geocoding_request(city_name), cancel=cancel)
+        return self._store_location(city_name, data)
+
+    def get_weather_data(self, lat, lon, cancel=None, allow_stale=True):
+        """
+        Verilen enlem ve boylam için güncel hava durumu ve tahmini (saatlik/günlük) verilerini çeker.
+        Yanıtlar response_cache'te tutulur; bayat kayıt hemen döner ve arka planda yenilenir.
+        allow_stale=False ise (ör. otomatik yenileme) bayat kayıt yerine yeni veri beklenir.
+        Veri her zaman CANONICAL_UNITS ile çekilip önbelleğe alınır, self.units'e yerel olarak dönüştürülür.
+        """
+        url, params = self._weather_request(lat, lon)
+        key = self.response_cache.make_key(lat, lon, CANONICAL_UNITS, self.lang)
+
+        def fetch(cancel=cancel):
+            payload = self._fetch_data_with_retry(url, params, cancel=cancel)
+            if payload is not None:
+                self.nearby_index.add(lat, lon, key)
+            return payload
+
+        # Arka plan yenilemesi isteği başlatan aramadan bağımsızdır, iptal jetonunu almaz
+        payload = self.response_cache.get_or_fetch(
+            key,
+            fetch,
+            refresh=lambda: fetch(cancel=None),
+            allow_stale=allow_stale,
+            nearby=lambda: self._nearby_keys(lat, lon, key)
+        )
+        return convert_units(payload, self.units)
+
+    def _nearby_keys(self, lat, lon, key):
+        """`nearby_radius_km` içindeki diğer önbelleğe alınmış konumların anahtarları, yakından uzağa."""
+        if self.nearby_radius_km <= 0:
+            return []
+        return [other for _, other in self.nearby_index.nearby(lat, lon, self.nearby_radius_km) if other != key]
+
+    def get_location_for_coordinates(self, lat, lon, cancel=None):
+        """
+        Koordinatlara en yakın yerleşimin adını ters geocoding ile bulur (önbellekli). Ad bulunamazsa
+        ya da istek başarısız olursa adı boş bir Location döner; hava durumu çekimini engellemez.
+        """
+        cached = self.geocode_cache.get(self._reverse_cache_key(lat, lon))
+        metrics.inc("geocode_cache_lookups_total", result="hit" if cached is not None else "miss")
+        if cached is not None:
+            return cached._replace(lat=lat, lon=lon)
+
+        data = self._fetch_data_with_retry(*self._reverse_geocoding_request(lat, lon), cancel=cancel)
+        return self._store_reverse_location(lat, lon, data)
 
-    def get_weather_by_city(self, city_name):
+    def get_weather_by_coordinates(self, lat, lon, cancel=None, allow_stale=True):
+        """
+        "Konumum" girişi: get_coordinates'i atlayıp doğrudan koordinatlar için veri çeker.
+        get_weather_by_city ile aynı (weather_data, location, error_message) üçlüsünü döndürür;
+        location'ın adı ters geocoding'den gelir.
+        """
+        location = self.get_location_for_coordinates(lat, lon, cancel=cancel)
+        weather_data = self.get_weather_data(lat, lon, cancel=cancel, allow_stale=allow_stale)
+        if weather_data is None:
+            return None, location, "Hava durumu verileri çekilemedi."
+        return weather_data, location, None
+
+    def get_weather_by_city(self, city_name, cancel=None, allow_stale=True):
         """
         Şehir adına göre tüm hava durumu verilerini (koordinatlar, güncel, saatlik, günlük) alır.
+        (weather_data, location, error_message) döndürür; location çözümlenen ad ve ülkeyi içerir,
+        böylece çağıranın şehri tekrar geocode etmesine gerek kalmaz.
+        "40.18, 29.06" gibi koordinat metinleri get_weather_by_coordinates'e yönlendirilir.
         """
-        lat, lon, name, country = self.get_coordinates(city_name)
-        if lat is None or lon is None:
-            return None, "Geçersiz şehir adı veya koordinatlar bulunamadı."
+        coordinates = parse_coordinates(city_name)
+        if coordinates is not None:
+            return self.get_weather_by_coordinates(*coordinates, cancel=cancel, allow_stale=allow_stale)
+
+        location = self.get_coordinates(city_name, cancel=cancel)
+        if location.lat is None or location.lon is None:
+            return None, None, "Geçersiz şehir adı veya koordinatlar bulunamadı."
         
-        weather_data = self.get_weather_data(lat, lon)
+        weather_data = self.get_weather_data(location.lat, location.lon, cancel=cancel, allow_stale=allow_stale)
         if weather_data is None:
-            return None, "Hava durumu verileri çekilemedi."
+            return None, location, "Hava durumu verileri çekilemedi."
         
-        return weather_data, None 
+        return weather_data, location, None 
+
+    def fetch_result(self, city_name, cancel=None, allow_stale=True, save_snapshot=True, fallback_to_snapshot=False):
+        """
+        get_weather_by_city() sonucunu arayüzün doğrudan render edebileceği
+        değişmez bir WeatherResult nesnesine paketler. Worker thread'de çağrılmalıdır.
+        Anlık görüntü deposu varsa başarılı sonuç `save_snapshot` ile saklanır. Çekim başarısız olursa
+        yalnızca `fallback_to_snapshot` istenmişse şehrin anlık görüntüsü döner (stored_at dolu olarak);
+        aksi halde hata döner, eski veri güncelmiş gibi verilmez.
+        İstek bu arada iptal edildiyse (ör. yeni bir arama onu geçersiz kıldıysa) anlık görüntü yazılmadan
+        RequestCancelled fırlatılır; açılışta kullanıcının görmediği bir şehir açılmaz.
+        """
+        start = time.perf_counter()
+        weather_data, location, error_message = self.get_weather_by_city(city_name, cancel=cancel, allow_stale=allow_stale)
+        if cancel is not None:
+            cancel.raise_if_cancelled()
+        return self._finish_result(city_name, weather_data, location, error_message, start, save_snapshot, fallback_to_snapshot)
+
+    def _finish_result(self, city_name, weather_data, location, error_message, start, save_snapshot=True,
+                       fallback_to_snapshot=False):
+        metrics.observe("weather_result_seconds", time.perf_counter() - start, ok=weather_data is not None)
+        stored_at = None
+        if self.snapshot_store is not None:
+            if weather_data is not None:
+                if save_snapshot:
+                    self.snapshot_store.save(city_name, location, self.units, weather_data)
+            elif fallback_to_snapshot:
+                snapshot = self.snapshot_store.load(city_name)
+                if snapshot is not None:
+                    metrics.inc("snapshot_fallbacks_total")
+                    print(f"Hava durumu çekilemedi, '{city_name}' için {format_age(snapshot.age)} kaydedilmiş veri kullanılıyor.")
+                    weather_data = convert_units(snapshot.weather, self.units, from_units=snapshot.units)
+                    location, error_message, stored_at = snapshot.location, None, snapshot.stored_at
+        display_name = location.display_name(city_name) if location else city_name
+        return WeatherResult(city_name, display_name, weather_data, error_message, time.perf_counter() - start,
+                             stored_at=stored_at)
+
+    def latest_snapshot_result(self):
+        """
+        En son kaydedilen anlık görüntüyü WeatherResult olarak döndürür (açılışta ağ beklemeden
+        göstermek için); yoksa None. Yerel bir SQLite okumasıdır, ağ çağrısı yapmaz.
+        """
+        snapshot = self.snapshot_store.latest() if self.snapshot_store is not None else None
+        if snapshot is None:
+            return None
+        return WeatherResult(snapshot.city, snapshot.location.display_name(snapshot.city),
+                             convert_units(snapshot.weather, self.units, from_units=snapshot.units), None,
+                             stored_at=snapshot.stored_at)
+
+
+class AsyncWeatherAPI:
+    """
+    WeatherAPI'nin asyncio karşılığı; aynı metotları `await` edilebilir olarak sunar.
+
+    HTTP istekleri paylaşılan, havuzlu requests.Session üzerinden bu nesneye ait bir thread
+    havuzunda yapılır; geocoding önbelleği dosyası ve (WEATHER_CACHE_DB verilmişse) SQLite önbelleği
+    ayrı, tek thread'li bir havuzda okunup yazılır. Böylece event loop hiç bloklanmaz ve yerel I/O
+    süren HTTP isteklerinin arkasında beklemez. Aynı anda yapılan istek sayısı
+    `max_concurrency` ile sınırlıdır; yeniden denemeler arasında asyncio.sleep ile beklenir.
+    asyncio yalnızca bu sınıf kullanıldığında yüklenir; arayüz açılışı onu beklemez.
+    """
+    def __init__(self, max_concurrency=ASYNC_MAX_CONCURRENCY, api=None, **api_kwargs):
+        import asyncio
+
+        self.max_concurrency = max_concurrency
+        # Geocoding önbelleği, oturum ve ayarlar senkron istemciyle paylaşılır
+        self.api = api if api is not None else WeatherAPI(pool_size=max_concurrency, **api_kwargs)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="weather-async")
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="weather-async-io")
+        self._background_tasks = set()
+
+    async def close(self):
+        self._executor.shutdown(wait=False)
+        self._io_executor.shutdown(wait=True)
+        self.api.close()
+
+    async def _local_io(self, fn, *args):
+        """Önbellek dosyalarına dokunan senkron `fn`'i event loop dışında çalıştırır."""
+        import asyncio
+
+        return await asyncio.get_running_loop().run_in_executor(self._io_executor, fn, *args)
+
+    async def _cache_call(self, fn, *args):
+        from weatherCache import MemoryCacheBackend
+
+        # Bellek içi yanıt önbelleği bloklamaz, doğrudan çağrılır; SQLite önbelleği dosyaya dokunur
+        if isinstance(self.api.response_cache.backend, MemoryCacheBackend):
+            return fn(*args)
+        return await self._local_io(fn, *args)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _fetch_data_with_retry(self, url, params=None):
+        """
+        WeatherAPI._fetch_data_with_retry ile aynı politika ve devre kesiciler; geri çekilme süresince semafor bırakılır.
+        """
+        import asyncio
+        import requests
+
+        params = dict(params or {})
+        params['appid'] = self.api.api_key
+        loop = asyncio.get_running_loop()
+        breaker = self.api._breaker(url)
+        started = time.monotonic()
+
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                metrics.inc("circuit_rejected_total", endpoint=_endpoint_name(url))
+                print(f"Hava durumu servisine ulaşılamıyor (devre açık), istek denenmedi: {url}")
+                return None
+            try:
+                async with self._semaphore:
+                    # Semafor beklemesi de toplam süreye dahildir
+                    timeout = self.api._attempt_timeout(url, started)
+                    if timeout is None:
+                        return None
+                    data = await loop.run_in_executor(self._executor, self.api._request_json, url, params, timeout)
+            except requests.exceptions.RequestException as e:
+                delay = self.api._retry_delay(breaker, e, attempt, started, _endpoint_name(url))
+                if delay is None:
+                    return None
+                await asyncio.sleep(delay)
+                attempt += 1
+            else:
+                breaker.record_success()
+                return data
+
+    async def get_coordinates(self, city_name):
+        cached = self.api.geocode_cache.get(city_name)
+        metrics.inc("geocode_cache_lookups_total", result="hit" if cached is not None else "miss")
+        if cached is not None:
+            return cached
+
+        data = await self._fetch_data_with_retry(*self.api._geocoding_request(city_name))
+        # GeocodeCache.put önbellek dosyasını yeniden yazar
+        return await self._local_io(self.api._store_location, city_name, data)
+
+    async def get_weather_data(self, lat, lon):
+        import asyncio
+
+        url, params = self.api._weather_request(lat, lon)
+        cache = self.api.response_cache
+        key = self.api.response_cache.make_key(lat, lon, CANONICAL_UNITS, self.api.lang)
+        payload, is_stale = await self._cache_call(cache.lookup, key)
+        if payload is not None:
+            if is_stale and cache.begin_refresh(key):
+                # Görev referansı tutulmazsa event loop onu tamamlanmadan çöpe atabilir
+                task = asyncio.create_task(self._refresh(key, lat, lon, url, params))
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+            return convert_units(payload, self.api.units)
+
+        payload = await self._cache_call(cache.lookup_nearest, self.api._nearby_keys(lat, lon, key))
+        if payload is not None:
+            return convert_units(payload, self.api.units)
+
+        payload = await self._fetch_data_with_retry(url, params)
+        if payload is not None:
+            await self._cache_call(cache.store, key, payload)
+            self.api.nearby_index.add(lat, lon, key)
+        return convert_units(payload, self.api.units)
+
+    async def _refresh(self, key, lat, lon, url, params):
+        payload = None
+        try:
+            payload = await self._fetch_data_with_retry(url, params)
+            if payload is not None:
+                self.api.nearby_index.add(lat, lon, key)
+        finally:
+            await self._cache_call(self.api.response_cache.end_refresh, key, payload)
+
+    async def get_location_for_coordinates(self, lat, lon):
+        cached = self.api.geocode_cache.get(self.api._reverse_cache_key(lat, lon))
+        metrics.inc("geocode_cache_lookups_total", result="hit" if cached is not None else "miss")
+        if cached is not None:
+            return cached._replace(lat=lat, lon=lon)
+
+        data = await self._fetch_data_with_retry(*self.api._reverse_geocoding_request(lat, lon))
+        return await self._local_io(self.api._store_reverse_location, lat, lon, data)
+
+    async def get_weather_by_coordinates(self, lat, lon):
+        location = await self.get_location_for_coordinates(lat, lon)
+        weather_data = await self.get_weather_data(lat, lon)
+        if weather_data is None:
+            return None, location, "Hava durumu verileri çekilemedi."
+        return weather_data, location, None
+
+    async def get_weather_by_city(self, city_name):
+        coordinates = parse_coordinates(city_name)
+        if coordinates is not None:
+            return await self.get_weather_by_coordinates(*coordinates)
+
+        location = await self.get_coordinates(city_name)
+        if location.lat is None or location.lon is None:
+            return None, None, "Geçersiz şehir adı veya koordinatlar bulunamadı."
+
+        weather_data = await self.get_weather_data(location.lat, location.lon)
+        if weather_data is None:
+            return None, location, "Hava durumu verileri çekilemedi."
+
+        return weather_data, location, None
+
+    async def fetch_result(self, city_name):
+        start = time.perf_counter()
+        weather_data, location, error_message = await self.get_weather_by_city(city_name)
+        # Anlık görüntü okuma/yazma SQLite'a dokunduğu için event loop dışında yapılır
+        return await self._local_io(self.api._finish_result, city_name, weather_data, location, error_message, start)
+
+    async def get_weather_for_cities(self, city_names):
+        """
+        Şehirleri eşzamanlı çeker ve WeatherResult'ları tamamlandıkça (giriş sırasından bağımsız) üretir.
+        `city_names` herhangi bir iterable olabilir; tamamı belleğe alınmadan tüketilir.
+
+            async for result in client.get_weather_for_cities(["Bursa", "Ankara"]):
+                ...
+        """
+        import asyncio
+
+        names = iter(city_names)
+        results = asyncio.Queue()
+        done = object()
+
+        async def worker():
+            try:
+                for name in names:
+                    await results.put(await self.fetch_result(name))
+            finally:
+                results.put_nowait(done)
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.max_concurrency)]
+        remaining = len(workers)
+        try:
+            while remaining:
+                item = await results.get()
+                if item is done:
+                    remaining -= 1
+                else:
+                    yield item
+            # Beklenmeyen bir hatayla duran worker varsa istisnayı burada yükselt
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
 
 if __name__ == "__main__":
-    api = WeatherAPI()
+    from weatherCache import SnapshotStore
+
+    # Ağ yokken son başarılı sonuç gösterilir; kayıtlar arayüzünkünden ayrı bir dosyada tutulur
+    api = WeatherAPI(snapshot_store=SnapshotStore(DEMO_SNAPSHOT_DB))
     
     test_city = "Ankara"
     print(f"'{test_city}' için hava durumu verileri çekiliyor...")
-    weather_data, error_message = api.get_weather_by_city(test_city)
+    result = api.fetch_result(test_city, fallback_to_snapshot=True)
+    weather_data, error_message = result.weather, result.error
 
     if weather_data:
+        temp_suffix, wind_suffix = UNIT_SUFFIXES[api.units]
+        print(f"\nKonum: {result.display_name}")
+        if result.is_snapshot:
+            print(f"(Çevrimdışı: {format_age(time.time() - result.stored_at)} kaydedilmiş veri)")
         print("\n--- Güncel Hava Durumu ---")
         current = weather_data['current']
-        print(f"Sıcaklık: {current['temp']}°C (Hissedilen: {current['feels_like']}°C)")
+        print(f"Sıcaklık: {current['temp']}{temp_suffix} (Hissedilen: {current['feels_like']}{temp_suffix})")
         print(f"Durum: {current['weather'][0]['description'].capitalize()}")
         print(f"Nem: {current['humidity']}%")
-        print(f"Rüzgar Hızı: {current['wind_speed']} m/s")
+        print(f"Rüzgar Hızı: {current['wind_speed']} {wind_suffix}")
         print(f"Basınç: {current['pressure']} hPa")
         print(f"UV İndeksi: {current['uvi']}")
 
         print("\n--- Saatlik Tahmin (İlk 3 saat) ---")
         for i, hourly in enumerate(weather_data['hourly'][:3]):
-            print(f"Saat: {time.strftime('%H:%M', time.gmtime(hourly['dt'] + weather_data['timezone_offset']))}, Sıcaklık: {hourly['temp']}°C, Durum: {hourly['weather'][0]['description'].capitalize()}")
+            print(f"Saat: {time.strftime('%H:%M', time.gmtime(hourly['dt'] + weather_data['timezone_offset']))}, Sıcaklık: {hourly['temp']}{temp_suffix}, Durum: {hourly['weather'][0]['description'].capitalize()}")
 
         print("\n--- Günlük Tahmin (İlk 3 gün) ---")
         for i, daily in enumerate(weather_data['daily'][:3]):
-            print(f"Gün: {time.strftime('%Y-%m-%d', time.gmtime(daily['dt'] + weather_data['timezone_offset']))}, Min: {daily['temp']['min']}°C, Max: {daily['temp']['max']}°C, Durum: {daily['weather'][0]['description'].capitalize()}")
+            print(f"Gün: {time.strftime('%Y-%m-%d', time.gmtime(daily['dt'] + weather_data['timezone_offset']))}, Min: {daily['temp']['min']}{temp_suffix}, Max: {daily['temp']['max']}{temp_suffix}, Durum: {daily['weather'][0]['description'].capitalize()}")
+
+        # Sütun tabanlı model ile toplamlar tek NumPy işlemidir
+        from forecastModel import Forecast
+        low, high, mean = Forecast.from_json(weather_data, units=api.units).temp_stats(24)
+        print(f"\nÖnümüzdeki 24 saat: Min {low:.1f}{temp_suffix}, Max {high:.1f}{temp_suffix}, Ortalama {mean:.1f}{temp_suffix}")
+
+        # Birim değişikliği ağ isteği gerektirmez: aynı veri yerel olarak dönüştürülür
+        other_units = "imperial" if api.units != "imperial" else "metric"
+        other = convert_units(weather_data, other_units, from_units=api.units)
+        other_temp_suffix, other_wind_suffix = UNIT_SUFFIXES[other_units]
+        print(f"\n--- Aynı veri, {other_units} birimlerinde (ağ isteği yok) ---")
+        print(f"Sıcaklık: {other['current']['temp']}{other_temp_suffix} (Hissedilen: {other['current']['feels_like']}{other_temp_suffix})")
+        print(f"Rüzgar Hızı: {other['current']['wind_speed']} {other_wind_suffix}")
+        print(f"Yarın Min/Max: {other['daily'][1]['temp']['min']}{other_temp_suffix} / {other['daily'][1]['temp']['max']}{other_temp_suffix}")
     else:
         print(f"Hata: {error_message}")
 
     test_city_invalid = "GeçersizŞehirAdıBurada"
     print(f"\n'{test_city_invalid}' için hava durumu verileri çekiliyor...")
-    weather_data, error_message = api.get_weather_by_city(test_city_invalid)
+    weather_data, location, error_message = api.get_weather_by_city(test_city_invalid)
     if weather_data:
         print("Hata: Geçersiz şehir adı için veri geldi (bu olmamalıydı).")
     else:
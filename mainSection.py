@@ -2,15 +2,35 @@
 
 import tkinter as tk
 from tkinter import messagebox, ttk
-from PIL import Image, ImageTk 
-import os
-import threading 
+import functools
+import queue
 import time
 import datetime
-import pytz 
+import traceback
 
-from konumBazli import WeatherAPI
-from config import WEATHER_ICONS_DIR, DEFAULT_CITY, API_UNITS
+from konumBazli import WeatherAPI, set_ui_thread, normalize_city_key, format_age
+from weatherCache import create_snapshot_store
+from requestScheduler import RequestScheduler
+from autoRefresh import AutoRefresher
+from iconCache import IconCache
+from forecastCards import CardState, ForecastStrip
+from dashboard import CityDashboard
+from config import WEATHER_ICONS_DIR, DEFAULT_CITY, API_UNITS, CANONICAL_UNITS, DEBUG_RENDER_TIMING
+from config import METRICS_ENABLED, METRICS_PORT
+import metrics
+
+# Worker sonuç kuyruğunun ana thread'de kontrol edilme aralığı
+RESULT_POLL_INTERVAL_MS = 50
+
+# Ana ikon, tahmin kartı ve pano satırı ikonlarının piksel boyutları
+MAIN_ICON_SIZE = 100
+FORECAST_ICON_SIZE = 50
+DASHBOARD_ICON_SIZE = 25
+
+
+def _fixed_timezone(timezone_offset):
+    # OpenWeather şehrin UTC farkını saniye olarak verir; sabit farklı bir tzinfo yeterlidir
+    return datetime.timezone(datetime.timedelta(seconds=timezone_offset))
 
 class WeatherApp:
     def __init__(self, master):
@@ -19,7 +39,12 @@ class WeatherApp:
         master.geometry("1000x750") 
         master.resizable(False, False) 
 
-        self.api = WeatherAPI() 
+        # Veriler her zaman kanonik birimde çekilir; °C/°F görünümü render sırasında yerel olarak türetilir
+        # Son sonuçlar açılışta ve ağ yokken gösterilmek üzere saklanır
+        self.api = WeatherAPI(units=CANONICAL_UNITS, snapshot_store=create_snapshot_store())
+        self._last_result = None
+        # İkonlar pencere çizildikten sonra arka planda çözülüp boyutlandırılır; her yenilemede tekrar okunmaz
+        self.icons = IconCache(WEATHER_ICONS_DIR, sizes=(MAIN_ICON_SIZE, FORECAST_ICON_SIZE, DASHBOARD_ICON_SIZE))
         self.current_city = tk.StringVar(value=DEFAULT_CITY)
         self.temp_unit = tk.StringVar(value=API_UNITS) 
 
@@ -27,14 +52,31 @@ class WeatherApp:
         self.master.protocol("WM_DELETE_WINDOW", self.on_closing)
         self.stop_threads = False # Thread'lerin durması için bayrak
 
+        # Worker thread'ler sonuçları bu kuyruğa koyar; ana thread _poll_results ile okuyup render eder.
+        # Tk nesnelerine yalnızca ana thread dokunur.
+        set_ui_thread()
+        self._results = queue.Queue()
+        self.scheduler = RequestScheduler()
+        self._poll_after_id = None
+        # Görüntülenen şehir arka planda periyodik olarak yenilenir; pencere simge durumundayken duraklar
+        self.refresher = AutoRefresher(self.master.after, self.master.after_cancel, self._refresh_city)
+        self.master.bind("<Unmap>", self._on_visibility_change, add="+")
+        self.master.bind("<Map>", self._on_visibility_change, add="+")
+        # Önbellek isabet oranları ölçümler dışa aktarılırken okunur
+        metrics.REGISTRY.register_collector("response_cache", self.api.response_cache.stats)
+        self._metrics_server = metrics.serve(METRICS_PORT) if METRICS_ENABLED and METRICS_PORT else None
+
+        # İlk veri (kayıtlı sonuç ya da ağdan çekim) pencere ilk kez çizildikten sonra yüklenir
+        self._startup_pending = True
+
         self._create_widgets() 
-        self.fetch_weather_for_city(DEFAULT_CITY) 
+        self._poll_results()
 
     def _create_widgets(self):
         search_frame = tk.Frame(self.master, padx=10, pady=10)
         search_frame.pack(pady=10, fill="x")
 
-        tk.Label(search_frame, text="Şehir Adı:").pack(side="left", padx=5)
+        tk.Label(search_frame, text="Şehir Adı ya da Enlem, Boylam:").pack(side="left", padx=5)
         self.city_entry = tk.Entry(search_frame, textvariable=self.current_city, width=40)
         self.city_entry.pack(side="left", padx=5, fill="x", expand=True)
         self.city_entry.bind("<Return>", self.on_search_button_click) 
@@ -97,9 +139,32 @@ class WeatherApp:
         self.hourly_canvas.bind('<Configure>', lambda e: self.hourly_canvas.configure(scrollregion = self.hourly_canvas.bbox("all")))
         self.hourly_inner_frame = tk.Frame(self.hourly_canvas)
         self.hourly_canvas.create_window((0,0), window=self.hourly_inner_frame, anchor="nw")
+        self.hourly_strip = ForecastStrip(self.hourly_inner_frame, self.hourly_canvas, capacity=24, line_count=1,
+                                          icons=self.icons, icon_size=FORECAST_ICON_SIZE)
 
+        # Günlük sekmenin içeriği sekme ilk seçildiğinde kurulur; o zamana kadar gelen kartlar bekletilir
         self.daily_frame = tk.Frame(self.forecast_notebook)
         self.forecast_notebook.add(self.daily_frame, text="Günlük Tahmin")
+        self.daily_strip = None
+        self._pending_daily_cards = []
+        # Şehir panosu da ilk seçildiğinde kurulur; şehirleri o zaman çekilmeye başlar
+        self.dashboard_frame = tk.Frame(self.forecast_notebook)
+        self.forecast_notebook.add(self.dashboard_frame, text="Şehirler")
+        self.dashboard = None
+        self.forecast_notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, event=None):
+        current = self.forecast_notebook.index("current")
+        if self.daily_strip is None and current == self.forecast_notebook.index(self.daily_frame):
+            self._create_daily_tab()
+        elif self.dashboard is None and current == self.forecast_notebook.index(self.dashboard_frame):
+            # Pano sonuçları anlık görüntü olarak saklanmaz; açılışta son görüntülenen şehir gösterilir,
+            # son yenilenen pano şehri değil. Ağ yoksa kayıtlı verisi olan şehirler yine gösterilir
+            fetch = functools.partial(self.api.fetch_result, save_snapshot=False, fallback_to_snapshot=True)
+            self.dashboard = CityDashboard(self.dashboard_frame, fetch, self._post_result, self.icons,
+                                           DASHBOARD_ICON_SIZE, self.temp_unit.get, self.fetch_weather_for_city)
+
+    def _create_daily_tab(self):
         self.daily_canvas = tk.Canvas(self.daily_frame)
         self.daily_canvas.pack(side="left", fill="both", expand=True)
         self.daily_scrollbar = tk.Scrollbar(self.daily_frame, orient="horizontal", command=self.daily_canvas.xview)
@@ -108,11 +173,46 @@ class WeatherApp:
         self.daily_canvas.bind('<Configure>', lambda e: self.daily_canvas.configure(scrollregion = self.daily_canvas.bbox("all")))
         self.daily_inner_frame = tk.Frame(self.daily_canvas)
         self.daily_canvas.create_window((0,0), window=self.daily_inner_frame, anchor="nw")
+        self.daily_strip = ForecastStrip(self.daily_inner_frame, self.daily_canvas, capacity=7, line_count=2,
+                                         icons=self.icons, icon_size=FORECAST_ICON_SIZE)
+        self.daily_strip.update(self._pending_daily_cards)
+        self._pending_daily_cards = []
 
+    def _show_startup_weather(self):
+        """
+        Pencere ilk kez çizildikten sonra bir kez çağrılır. İkon ısıtma ve ilk veri yüklemesi buradan başlar;
+        kayıtlı sonucun okunması ve çözülmesi de worker thread'inde yapılır.
+        """
+        if not self._startup_pending:
+            return
+        self._startup_pending = False
+        self.icons.warm_async()
+        self.loading_label.pack(pady=5)
+        # Açılış işi hiçbir şehrin anahtarını kullanmaz; kullanıcının ilk araması ona bağlanmaz, onu iptal eder
+        self.scheduler.submit(
+            None,
+            self._load_startup_result,
+            self._deliver_startup
+        )
+
+    def _load_startup_result(self, cancel):
+        """
+        Son kaydedilen sonuç varsa ağı beklemeden döndürülür (arayüz onu yaşıyla gösterip arka planda yeniler).
+        Hiç kayıt yoksa varsayılan şehir her zamanki gibi çekilir.
+        """
+        snapshot = self.api.latest_snapshot_result()
+        if snapshot is None:
+            return self._fetch_and_update_gui(DEFAULT_CITY, cancel)
+        return self._parse_forecast(snapshot)
 
     def _on_unit_change(self):
-        self.api.units = self.temp_unit.get() 
-        self.fetch_weather_for_city(self.current_city.get()) 
+        # Son sonuç kanonik birimde elde olduğu için birim değişikliği ağ isteği gerektirmez
+        if self.dashboard is not None:
+            self.dashboard.rerender()
+        if self._last_result is not None:
+            self._render_weather(self._last_result)
+        else:
+            self.fetch_weather_for_city(self.current_city.get()) 
 
     def on_search_button_click(self, event=None):
         city = self.city_entry.get().strip()
@@ -138,38 +238,83 @@ class WeatherApp:
         )
         self.clear_forecast_display() 
 
-        # API çağrısını ayrı bir thread'de yap
-        # Eğer thread zaten çalışıyorsa yeni bir tane başlatma
-        # Bu, daha önce olan RuntimeError'ı çözmeye yardımcı olacak bir yaklaşımdır.
-        if not hasattr(self, '_fetch_thread') or not self._fetch_thread.is_alive():
-            self._fetch_thread = threading.Thread(target=self._fetch_and_update_gui, args=(city_name,))
-            self._fetch_thread.start()
-        else:
-            # Mevcut thread bitene kadar bekle veya kullanıcıya bilgi ver
-            print("Zaten bir hava durumu isteği işleniyor. Lütfen bekleyin.")
+        # API çağrısı zamanlayıcının worker thread'lerinde yapılır. Aynı şehir için süren bir istek
+        # varsa ona bağlanılır; farklı bir şehir önceki aramaları iptal eder ve sonuçlarını atar.
+        self.scheduler.submit(
+            normalize_city_key(city_name),
+            functools.partial(self._fetch_and_update_gui, city_name),
+            self._deliver_result
+        )
 
+    def _refresh_city(self, city_name):
+        """
+        Otomatik yenileme: yükleniyor durumuna geçmeden ve süren aramaları iptal etmeden şehri yeniden çeker.
+        """
+        self.scheduler.submit(
+            normalize_city_key(city_name),
+            functools.partial(self._fetch_and_update_gui, city_name, allow_stale=False),
+            self._deliver_refresh,
+            supersede=False
+        )
 
-    def _fetch_and_update_gui(self, city_name):
+    def _fetch_and_update_gui(self, city_name, cancel, allow_stale=True):
         """
-        API'den verileri çeker ve GUI'yi günceller. Ayrı bir thread'de çalışır.
+        API'den verileri çeker ve WeatherResult döndürür. Zamanlayıcının worker thread'inde çalışır,
+        hiçbir Tk nesnesine dokunmaz; sonuç zamanlayıcı tarafından kuyruğa konur.
+        JSON yanıtı da burada sütun tabanlı Forecast'a çevrilir; ana thread yalnızca dizileri okur.
         """
-        # Thread'in GUI kapatıldığında durabilmesi için kontrol
-        if self.stop_threads:
-            return
+        result = self.api.fetch_result(city_name, cancel=cancel, allow_stale=allow_stale, fallback_to_snapshot=True)
+        if result.ok:
+            with metrics.timer("forecast_parse_seconds"):
+                result = self._parse_forecast(result)
+        return result
+
+    @staticmethod
+    def _parse_forecast(result):
+        """
+        Ham JSON'u Forecast'a çevirir ve sözlüğü sonuçtan çıkarır. Arayüz son sonucu (_last_result)
+        bir sonraki aramaya kadar tuttuğu için aynı verinin iki kopyası bellekte kalmaz.
+        """
+        from forecastModel import Forecast
+        return result._replace(forecast=Forecast.from_json(result.weather), weather=None)
 
-        weather_data, error_message = self.api.get_weather_by_city(city_name)
+    # Zamanlayıcı aynı callback'i aynı işe iki kez bağlamaz; bağlı metotlar eşit sayıldığı için bu ikisi sabit kalır
+    def _deliver_result(self, result):
+        self._results.put((self._update_gui_with_weather_data, result))
 
-        # GUI güncellemelerini ana thread'de yapmak için after metodunu kullan
-        # Eğer master yoksa (uygulama kapatıldıysa) hata vermemek için kontrol et
-        if self.master.winfo_exists():
-            self.master.after(0, self._update_gui_with_weather_data, weather_data, error_message, city_name)
-        else:
-            print("GUI penceresi kapatıldığı için güncellemeler atlandı.")
+    def _deliver_refresh(self, result):
+        self._results.put((self._apply_refresh, result))
+
+    def _deliver_startup(self, result):
+        self._results.put((self._apply_startup, result))
 
+    def _post_result(self, handler, result):
+        # Pano kendi worker'larının sonuçlarını da aynı kuyruktan ana thread'e aktarır
+        self._results.put((handler, result))
 
-    def _update_gui_with_weather_data(self, weather_data, error_message, requested_city_name):
+    def _poll_results(self):
         """
-        Çekilen hava durumu verileriyle GUI'yi günceller. Ana thread'de çalışır.
+        Worker thread'lerden gelen sonuçları ana thread'de render eder. Kendini after() ile yeniden planlar.
+        Bir sonucun işlenmesi hata verirse hata yazılır ve diğer sonuçlarla devam edilir; yoklama durmaz.
+        """
+        while True:
+            try:
+                handler, result = self._results.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                handler(result)
+            except Exception:
+                print(f"Sonuç işlenirken hata oluştu: {getattr(handler, '__name__', handler)}")
+                traceback.print_exc()
+        if not self.stop_threads:
+            self._poll_after_id = self.master.after(RESULT_POLL_INTERVAL_MS, self._poll_results)
+
+
+    def _update_gui_with_weather_data(self, result):
+        """
+        Worker thread'in ürettiği WeatherResult ile GUI'yi günceller. Ana thread'de çalışır,
+        yalnızca render eder; ağ çağrısı yapmaz.
         """
         # GUI'nin hala var olduğunu kontrol et
         if not self.master.winfo_exists():
@@ -177,40 +322,17 @@ class WeatherApp:
 
         self.loading_label.pack_forget() 
 
-        if weather_data:
-            current = weather_data['current']
-            hourly = weather_data['hourly']
-            daily = weather_data['daily']
-            timezone_offset = weather_data['timezone_offset']
-            
-            # API'den gelen veriye göre şehir adını güncelle
-            # OpenWeatherMap'in geocoding API'si `name` ve `country` döndürüyor.
-            # get_coordinates() metodu bu bilgileri döndürmeli.
-            lat, lon, geo_name, geo_country = self.api.get_coordinates(requested_city_name)
-            display_city_name = geo_name or requested_city_name
-            if geo_country:
-                 display_city_name = f"{display_city_name}, {geo_country}"
-
-            self.update_main_weather_display(
-                city=display_city_name,
-                description=current['weather'][0]['description'].capitalize(),
-                temp=current['temp'],
-                feels_like=current['feels_like'],
-                humidity=current['humidity'],
-                wind_speed=current['wind_speed'],
-                pressure=current['pressure'],
-                uvi=current['uvi'],
-                icon_code=current['weather'][0]['icon'],
-                dt_utc=current['dt'],
-                timezone_offset=timezone_offset
-            )
-            self.update_hourly_forecast(hourly, timezone_offset)
-            self.update_daily_forecast(daily, timezone_offset)
-            self.current_city.set(requested_city_name) 
+        if result.ok:
+            self._track_city(result.requested_city)
+            self._last_result = result
+            self._render_weather(result)
+            self.current_city.set(result.requested_city) 
         else:
-            messagebox.showerror("Hata", f"Hava durumu verileri çekilemedi:\n{error_message}\nLütfen API anahtarınızın doğru ve aktif olduğundan emin olun.")
+            self._track_city(None)
+            self._last_result = None
+            messagebox.showerror("Hata", f"Hava durumu verileri çekilemedi:\n{result.error}\nLütfen API anahtarınızın doğru ve aktif olduğundan emin olun.")
             self.update_main_weather_display(
-                city=f"{requested_city_name} (Bulunamadı)",
+                city=f"{result.requested_city} (Bulunamadı)",
                 description="---",
                 temp="--",
                 feels_like="--",
@@ -224,6 +346,90 @@ class WeatherApp:
             )
             self.clear_forecast_display()
 
+    def _apply_startup(self, result):
+        self._update_gui_with_weather_data(result)
+        if result.is_snapshot:
+            self._refresh_city(result.requested_city)
+
+    def _apply_refresh(self, result):
+        """
+        Otomatik yenileme sonucunu işler. Görüntülenen şehir değilse atılır; current.dt aynıysa
+        render edilmez ve yenileme aralığı uzar. Hata kutusu gösterilmez, ekrandaki veri korunur.
+        """
+        if not self.master.winfo_exists():
+            return
+        last = self._last_result
+        if last is None or normalize_city_key(last.requested_city) != normalize_city_key(result.requested_city):
+            return
+        if not result.ok:
+            print(f"Otomatik yenileme başarısız ({result.requested_city}): {result.error}")
+            self.refresher.report(result.requested_city, changed=False)
+            return
+        # Kayıtlı veriden canlı veriye geçiş, current.dt aynı olsa da yaş etiketini kaldırmak için render edilir
+        changed = result.forecast.current.dt != last.forecast.current.dt or result.is_snapshot != last.is_snapshot
+        self.refresher.report(result.requested_city, changed)
+        if changed:
+            self._last_result = result
+            self._render_weather(result)
+
+    def _track_city(self, city_name):
+        """Otomatik yenilemede yalnızca görüntülenen şehir takip edilir."""
+        for tracked in self.refresher.tracked():
+            if city_name is None or normalize_city_key(tracked) != normalize_city_key(city_name):
+                self.refresher.untrack(tracked)
+        if city_name is not None:
+            self.refresher.track(city_name)
+
+    def _on_visibility_change(self, event):
+        # Kök pencereye bağlanan olaylar alt widget'lar için de tetiklenir
+        if event.widget is not self.master:
+            return
+        if event.type == tk.EventType.Unmap:
+            self.refresher.pause()
+            if self.dashboard is not None:
+                self.dashboard.pause()
+        else:
+            self.refresher.resume()
+            if self.dashboard is not None:
+                self.dashboard.resume()
+            if self._startup_pending:
+                # Eşlemeden sonra kuyruktaki çizimler boşta işlenir; ilk veri onlardan sonra yüklenir
+                self.master.after_idle(self._show_startup_weather)
+
+    def _render_weather(self, result):
+        """
+        Başarılı bir sonucu seçili birimde (°C/°F) ekrana çizer. Birim dönüşümü yereldir.
+        """
+        start = time.perf_counter()
+        forecast = result.forecast.converted(self.temp_unit.get())
+        current = forecast.current
+        timezone_offset = forecast.timezone_offset
+
+        with metrics.timer("render_seconds", part="main"):
+            self.update_main_weather_display(
+                city=result.display_name,
+                description=current.description.capitalize(),
+                temp=current.temp,
+                feels_like=current.feels_like,
+                humidity=current.humidity,
+                wind_speed=current.wind_speed,
+                pressure=current.pressure,
+                uvi=current.uvi,
+                icon_code=current.icon_code,
+                dt_utc=current.dt,
+                timezone_offset=timezone_offset
+            )
+        if result.is_snapshot:
+            # Ağdan değil yerel kayıttan gelen veri, yaşıyla işaretlenir
+            self.time_display_label.config(
+                text=f"{self.time_display_label.cget('text')} (kayıtlı veri, {format_age(time.time() - result.stored_at)})")
+        self.update_hourly_forecast(forecast.hourly, timezone_offset)
+        self.update_daily_forecast(forecast.daily, timezone_offset)
+        elapsed = time.perf_counter() - start
+        metrics.observe("render_seconds", elapsed, part="total")
+        if DEBUG_RENDER_TIMING:
+            print(f"Toplam render: {elapsed * 1000:.2f} ms")
+
     def update_main_weather_display(self, city, description, temp, feels_like, humidity, wind_speed, pressure, uvi, icon_code, dt_utc, timezone_offset):
         temp_suffix = "°C" if self.temp_unit.get() == "metric" else "°F"
         wind_suffix = "m/s" if self.temp_unit.get() == "metric" else "mph"
@@ -238,7 +444,7 @@ class WeatherApp:
         self.uvi_label.config(text=f"UV İndeksi: {uvi}")
 
         if dt_utc is not None and timezone_offset is not None:
-            local_time = datetime.datetime.fromtimestamp(dt_utc + timezone_offset, tz=pytz.utc)
+            local_time = datetime.datetime.fromtimestamp(dt_utc, tz=_fixed_timezone(timezone_offset))
             self.time_display_label.config(text=f"Yerel Saat: {local_time.strftime('%H:%M - %Y-%m-%d')}")
         else:
             self.time_display_label.config(text="Yerel Saat: ---")
@@ -246,99 +452,76 @@ class WeatherApp:
         self._load_weather_icon(icon_code)
 
     def _load_weather_icon(self, icon_code):
-        if icon_code:
-            icon_path = os.path.join(WEATHER_ICONS_DIR, f"{icon_code}@2x.png") 
-            try:
-                img = Image.open(icon_path)
-                img = img.resize((100, 100), Image.Resampling.LANCZOS) 
-                self.weather_icon = ImageTk.PhotoImage(img) 
-                self.weather_icon_label.config(image=self.weather_icon)
-                self.weather_icon_label.image = self.weather_icon 
-            except FileNotFoundError:
-                print(f"Uyarı: İkon dosyası bulunamadı: {icon_path}")
-                self.weather_icon_label.config(image='') 
-            except Exception as e:
-                print(f"İkon yüklenirken hata: {e}")
-                self.weather_icon_label.config(image='') 
-        else:
-            self.weather_icon_label.config(image='') 
-
-    def update_hourly_forecast(self, hourly_data, timezone_offset):
-        for widget in self.hourly_inner_frame.winfo_children():
-            widget.destroy() 
-
-        for i, hour in enumerate(hourly_data[:24]): 
-            frame = tk.Frame(self.hourly_inner_frame, bd=1, relief="solid", padx=5, pady=5)
-            frame.grid(row=0, column=i, padx=5, pady=5)
-
-            hour_time = datetime.datetime.fromtimestamp(hour['dt'] + timezone_offset, tz=pytz.utc)
-            tk.Label(frame, text=hour_time.strftime("%H:%M"), font=("Helvetica", 10, "bold")).pack()
-            
-            icon_code = hour['weather'][0]['icon']
-            icon_path = os.path.join(WEATHER_ICONS_DIR, f"{icon_code}@2x.png")
-            try:
-                img = Image.open(icon_path)
-                img = img.resize((50, 50), Image.Resampling.LANCZOS)
-                photo_img = ImageTk.PhotoImage(img)
-                icon_label = tk.Label(frame, image=photo_img)
-                icon_label.image = photo_img 
-                icon_label.pack()
-            except FileNotFoundError:
-                tk.Label(frame, text="İkon Yok").pack()
-
-            temp_suffix = "°C" if self.temp_unit.get() == "metric" else "°F"
-            tk.Label(frame, text=f"{hour['temp']}{temp_suffix}", font=("Helvetica", 10)).pack()
-            tk.Label(frame, text=hour['weather'][0]['description'].capitalize(), font=("Helvetica", 9), wraplength=80).pack()
-
-        self.hourly_inner_frame.update_idletasks()
-        self.hourly_canvas.config(scrollregion=self.hourly_canvas.bbox("all"))
-
+        self.weather_icon = self.icons.get(icon_code, MAIN_ICON_SIZE)
+        self.weather_icon_label.config(image=self.weather_icon or '')
+        self.weather_icon_label.image = self.weather_icon 
 
-    def update_daily_forecast(self, daily_data, timezone_offset):
-        for widget in self.daily_inner_frame.winfo_children():
-            widget.destroy() 
-
-        for i, day in enumerate(daily_data[1:8]): 
-            frame = tk.Frame(self.daily_inner_frame, bd=1, relief="solid", padx=5, pady=5)
-            frame.grid(row=0, column=i, padx=5, pady=5)
-
-            day_time = datetime.datetime.fromtimestamp(day['dt'] + timezone_offset, tz=pytz.utc)
-            tk.Label(frame, text=day_time.strftime("%A"), font=("Helvetica", 10, "bold")).pack() 
+    def update_hourly_forecast(self, hourly, timezone_offset):
+        start = time.perf_counter()
+        temp_suffix = "°C" if self.temp_unit.get() == "metric" else "°F"
+        tz = _fixed_timezone(timezone_offset)
+        cards = []
+        for i in range(min(len(hourly), 24)):
+            hour_time = datetime.datetime.fromtimestamp(int(hourly.dt[i]), tz=tz)
+            cards.append(CardState(
+                title=hour_time.strftime("%H:%M"),
+                icon_code=hourly.icon_code(i),
+                lines=(f"{hourly.temp[i]:g}{temp_suffix}",),
+                description=hourly.description(i).capitalize()
+            ))
+        self.hourly_strip.update(cards)
+        self._log_render_timing("Saatlik", "hourly", self.hourly_strip, start)
+
+    def update_daily_forecast(self, daily, timezone_offset):
+        start = time.perf_counter()
+        temp_suffix = "°C" if self.temp_unit.get() == "metric" else "°F"
+        tz = _fixed_timezone(timezone_offset)
+        cards = []
+        for i in range(1, min(len(daily), 8)):
+            day_time = datetime.datetime.fromtimestamp(int(daily.dt[i]), tz=tz)
+            cards.append(CardState(
+                title=day_time.strftime("%A"),
+                icon_code=daily.icon_code(i),
+                lines=(f"Max: {daily.temp_max[i]:g}{temp_suffix}", f"Min: {daily.temp_min[i]:g}{temp_suffix}"),
+                description=daily.description(i).capitalize()
+            ))
+        if self.daily_strip is None:
+            # Sekme henüz açılmadı; kartlar sekme kurulurken çizilir
+            self._pending_daily_cards = cards
+            return
+        self.daily_strip.update(cards)
+        self._log_render_timing("Günlük", "daily", self.daily_strip, start)
 
-            icon_code = day['weather'][0]['icon']
-            icon_path = os.path.join(WEATHER_ICONS_DIR, f"{icon_code}@2x.png")
-            try:
-                img = Image.open(icon_path)
-                img = img.resize((50, 50), Image.Resampling.LANCZOS)
-                photo_img = ImageTk.PhotoImage(img)
-                icon_label = tk.Label(frame, image=photo_img)
-                icon_label.image = photo_img 
-                icon_label.pack()
-            except FileNotFoundError:
-                tk.Label(frame, text="İkon Yok").pack()
-            
-            temp_suffix = "°C" if self.temp_unit.get() == "metric" else "°F"
-            tk.Label(frame, text=f"Max: {day['temp']['max']}{temp_suffix}", font=("Helvetica", 10)).pack()
-            tk.Label(frame, text=f"Min: {day['temp']['min']}{temp_suffix}", font=("Helvetica", 10)).pack()
-            tk.Label(frame, text=day['weather'][0]['description'].capitalize(), font=("Helvetica", 9), wraplength=80).pack()
-        
-        self.daily_inner_frame.update_idletasks()
-        self.daily_canvas.config(scrollregion=self.daily_canvas.bbox("all"))
+    def _log_render_timing(self, name, part, strip, start):
+        # Kart durumlarının hazırlanması ve widget güncellemesi birlikte ölçülür
+        metrics.observe("render_seconds", time.perf_counter() - start, part=part)
+        metrics.inc("forecast_cards_changed_total", strip.last_changed, part=part)
+        if DEBUG_RENDER_TIMING:
+            print(f"{name} tahmin render: {strip.last_render_ms:.2f} ms, {strip.last_changed}/{len(strip.cards)} kart değişti")
 
     def clear_forecast_display(self):
-        for widget in self.hourly_inner_frame.winfo_children():
-            widget.destroy()
-        for widget in self.daily_inner_frame.winfo_children():
-            widget.destroy()
+        # Kartlar yok edilmez, yalnızca gizlenir; sonraki render aynı widget'ları yeniden kullanır
+        self.hourly_strip.clear()
+        if self.daily_strip is None:
+            self._pending_daily_cards = []
+        else:
+            self.daily_strip.clear()
 
     def on_closing(self):
         """Uygulama kapatıldığında kaynakları temizler ve thread'leri durdurur."""
         if messagebox.askokcancel("Çıkış", "Uygulamadan çıkmak istediğinizden emin misiniz?"):
             self.stop_threads = True # Thread'lerin durması için bayrağı ayarla
-            # _fetch_thread'in bitmesini beklemek isteyebilirsiniz, ancak bu GUI'yi dondurabilir.
-            # Genellikle, Tkinter'da after() ile çağrılan fonksiyonlar ana thread'de çalıştığı için
-            # GUI kapanırken thread'in çağrısının hata vermemesini sağlamak daha önemlidir.
+            self.refresher.stop()
+            if self._poll_after_id is not None:
+                self.master.after_cancel(self._poll_after_id)
+            # Süren istekler iptal edilir; yeniden deneme beklemeleri hemen biter, sonuçlar atılır.
             # self.master.destroy() çağrısı bekleyen after() çağrılarını iptal eder.
+            self.scheduler.shutdown()
+            if self.dashboard is not None:
+                self.dashboard.close()
+            self.api.close()
+            if self._metrics_server is not None:
+                self._metrics_server.shutdown()
             self.master.destroy() 
 
 
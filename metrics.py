@@ -0,0 +1,258 @@
+# metrics.py
+"""
+Uygulama içi ölçümler: sayaçlar, süre histogramları ve dışa aktarma anında okunan göstergeler.
+Kapalıyken (varsayılan) her çağrı tek bir bayrak kontrolüyle döner.
+
+    import metrics
+    metrics.inc("http_retries_total", endpoint="onecall")
+    with metrics.timer("render_seconds", part="hourly"):
+        ...
+    print(metrics.to_prometheus())
+
+HAVA_METRICS=1 ortam değişkeniyle açılır. HAVA_METRICS_PORT verilirse arayüz ölçümleri
+http://127.0.0.1:<port>/metrics (Prometheus metni) ve /metrics.json adreslerinden sunar.
+"""
+
+import json
+import threading
+import time
+
+from config import METRICS_ENABLED
+
+# Süre histogramlarının üst sınırları (saniye); Prometheus'taki gibi birikimli sayılır
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Histogram:
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self, bucket_count):
+        self.counts = [0] * (bucket_count + 1)  # son hücre: +Inf
+        self.total = 0.0
+        self.count = 0
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    __slots__ = ("registry", "name", "labels", "start")
+
+    def __init__(self, registry, name, labels):
+        self.registry = registry
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.registry.observe(self.name, time.perf_counter() - self.start, **self.labels)
+        return False
+
+
+def _label_key(labels):
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+class MetricsRegistry:
+    """
+    Thread-safe ölçüm deposu. Her (ad, etiketler) ikilisi ayrı bir seri tutar.
+
+    - inc(): sayaç artırır
+    - observe(): histograma süre (saniye) ekler; timer() bunu `with` bloğuyla yapar
+    - register_collector(name, fn): dışa aktarmada çağrılıp {gösterge: sayı} döndüren fonksiyon
+      (ör. ResponseCache.stats); aynı adla yeniden kayıt öncekinin yerine geçer
+    - add_listener(fn): her ölçümde fn(tür, ad, değer, etiketler) çağrılır ("counter" ya da "histogram")
+    """
+    def __init__(self, enabled=False, buckets=DEFAULT_BUCKETS):
+        self.enabled = enabled
+        self.buckets = tuple(buckets)
+        self._counters = {}    # (ad, etiketler) -> değer
+        self._histograms = {}  # (ad, etiketler) -> _Histogram
+        self._collectors = {}
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    def inc(self, name, amount=1, **labels):
+        if not self.enabled:
+            return
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+        for listener in self._listeners:
+            listener("counter", name, amount, labels)
+
+    def observe(self, name, seconds, **labels):
+        if not self.enabled:
+            return
+        key = (name, _label_key(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(len(self.buckets))
+            index = len(self.buckets)
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    index = i
+                    break
+            histogram.counts[index] += 1
+            histogram.total += seconds
+            histogram.count += 1
+        for listener in self._listeners:
+            listener("histogram", name, seconds, labels)
+
+    def timer(self, name, **labels):
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name, labels)
+
+    def register_collector(self, name, fn):
+        with self._lock:
+            self._collectors[name] = fn
+
+    def add_listener(self, fn):
+        self._listeners.append(fn)
+
+    def remove_listener(self, fn):
+        if fn in self._listeners:
+            self._listeners.remove(fn)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self):
+        """Bütün serilerin JSON'a çevrilebilir kopyası."""
+        with self._lock:
+            counters = [{"name": name, "labels": dict(labels), "value": value}
+                        for (name, labels), value in sorted(self._counters.items())]
+            histograms = []
+            for (name, labels), histogram in sorted(self._histograms.items()):
+                histograms.append({
+                    "name": name,
+                    "labels": dict(labels),
+                    "count": histogram.count,
+                    "sum": histogram.total,
+                    "buckets": dict(zip([str(b) for b in self.buckets] + ["+Inf"], histogram.counts)),
+                })
+            collectors = list(self._collectors.items())
+        gauges = []
+        for collector_name, fn in collectors:
+            try:
+                values = fn()
+            except Exception as e:
+                print(f"Ölçüm toplayıcısı başarısız oldu ({collector_name}): {e}")
+                continue
+            for key, value in values.items():
+                if isinstance(value, (int, float)):
+                    gauges.append({"name": f"{collector_name}_{key}", "labels": {}, "value": value})
+        return {"counters": counters, "histograms": histograms, "gauges": gauges}
+
+    def to_json(self, indent=None):
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=indent)
+
+    def to_prometheus(self):
+        """Prometheus metin biçimi (text/plain; version=0.0.4)."""
+        def fmt(labels, extra=()):
+            pairs = list(labels.items()) + list(extra)
+            if not pairs:
+                return ""
+            return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+        data = self.snapshot()
+        lines = []
+        for kind, series in (("counter", data["counters"]), ("gauge", data["gauges"])):
+            typed = set()
+            for item in series:
+                if item["name"] not in typed:
+                    lines.append(f"# TYPE {item['name']} {kind}")
+                    typed.add(item["name"])
+                lines.append(f"{item['name']}{fmt(item['labels'])} {item['value']}")
+        typed = set()
+        for item in data["histograms"]:
+            name = item["name"]
+            if name not in typed:
+                lines.append(f"# TYPE {name} histogram")
+                typed.add(name)
+            cumulative = 0
+            for bound, count in item["buckets"].items():
+                cumulative += count
+                lines.append(f"{name}_bucket{fmt(item['labels'], [('le', bound)])} {cumulative}")
+            lines.append(f"{name}_sum{fmt(item['labels'])} {item['sum']}")
+            lines.append(f"{name}_count{fmt(item['labels'])} {item['count']}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path):
+        """Ölçümleri dosyaya yazar; uzantı .prom ise Prometheus metni, değilse JSON."""
+        text = self.to_prometheus() if path.endswith(".prom") else self.to_json(indent=2)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+# Uygulama genelindeki varsayılan depo ve ona kısayollar
+REGISTRY = MetricsRegistry(enabled=METRICS_ENABLED)
+
+
+def inc(name, amount=1, **labels):
+    if REGISTRY.enabled:
+        REGISTRY.inc(name, amount, **labels)
+
+
+def observe(name, seconds, **labels):
+    if REGISTRY.enabled:
+        REGISTRY.observe(name, seconds, **labels)
+
+
+def timer(name, **labels):
+    return REGISTRY.timer(name, **labels) if REGISTRY.enabled else _NULL_TIMER
+
+
+def enable(enabled=True):
+    REGISTRY.enabled = enabled
+
+
+def serve(port, host="127.0.0.1", registry=None):
+    """
+    Ölçümleri arka plan thread'inde HTTP ile sunar; durdurmak için dönen sunucunun shutdown()'ı çağrılır.
+    http.server yalnızca burada yüklenir; ölçümler kapalıyken açılışa maliyeti olmaz.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class ExportHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            registry = self.server.registry
+            if self.path == "/metrics":
+                body, content_type = registry.to_prometheus(), "text/plain; version=0.0.4"
+            elif self.path == "/metrics.json":
+                body, content_type = registry.to_json(), "application/json"
+            else:
+                self.send_error(404)
+                return
+            data = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    httpd = ThreadingHTTPServer((host, port), ExportHandler)
+    httpd.daemon_threads = True
+    httpd.registry = registry or REGISTRY
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
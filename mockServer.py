@@ -0,0 +1,460 @@
+# mockServer.py
+"""
+OpenWeather API'sinin yerel taklidi. Benchmark'lar ve gerçek API anahtarı olmadan yapılan
+denemeler için /geo/1.0/direct, /geo/1.0/reverse ve /data/2.5/onecall uç noktalarını sunar. Gecikme, 5xx hataları,
+Retry-After'lı 429 yanıtları ve yavaş yanıtlar oranlarıyla ayarlanabilir.
+
+    python mockServer.py --port 8765 --latency 0.05 --error-rate 0.1 --rate-limit-rate 0.05
+
+Uygulamayı taklit sunucuya yöneltmek için başlangıçta yazdırılan ortam değişkenleri kullanılır:
+
+    OPENWEATHER_BASE_URL=http://127.0.0.1:8765/data/2.5 OPENWEATHER_GEOCODING_URL=http://127.0.0.1:8765/geo/1.0 python mainSection.py
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from konumBazli import normalize_city_key
+from weatherCache import haversine_km
+
+# normalize edilmiş ad -> (ad, ülke, enlem, boylam)
+CITIES = {
+    "bursa": ("Bursa", "TR", 40.1826, 29.0665),
+    "ankara": ("Ankara", "TR", 39.9334, 32.8597),
+    "istanbul": ("İstanbul", "TR", 41.0082, 28.9784),
+    "izmir": ("İzmir", "TR", 38.4237, 27.1428),
+    "antalya": ("Antalya", "TR", 36.8969, 30.7133),
+    "erzurum": ("Erzurum", "TR", 39.9043, 41.2679),
+    "trabzon": ("Trabzon", "TR", 41.0027, 39.7168),
+    "londra": ("London", "GB", 51.5073, -0.1277),
+    "london": ("London", "GB", 51.5073, -0.1277),
+    "new york": ("New York", "US", 40.7128, -74.0060),
+    # Bursa'nın ilçeleri; merkeze birkaç km uzaklıkta (yakın konum paylaşımı denemeleri için)
+    "osmangazi": ("Osmangazi", "TR", 40.1939, 29.0603),
+    "yildirim": ("Yıldırım", "TR", 40.1899, 29.0789),
+    "nilufer": ("Nilüfer", "TR", 40.2138, 28.9860),
+}
+
+# Ters geocoding bu uzaklıktan (km) yakın bir yerleşim yoksa boş liste döndürür
+REVERSE_GEOCODE_RADIUS_KM = 50
+
+# İkon kodu -> (OpenWeather durum kimliği, ana durum, Türkçe açıklama)
+CONDITIONS = {
+    "01": (800, "Clear", "açık"),
+    "02": (801, "Clouds", "az bulutlu"),
+    "03": (802, "Clouds", "parçalı bulutlu"),
+    "04": (804, "Clouds", "kapalı"),
+    "09": (521, "Rain", "sağanak yağmur"),
+    "10": (500, "Rain", "hafif yağmur"),
+    "11": (211, "Thunderstorm", "gök gürültülü fırtına"),
+    "13": (600, "Snow", "hafif kar yağışlı"),
+    "50": (741, "Fog", "sisli"),
+}
+_CONDITION_CODES = list(CONDITIONS)
+
+
+def _convert_temp(celsius, units):
+    if units == "imperial":
+        return round(celsius * 9 / 5 + 32, 2)
+    if units == "metric":
+        return round(celsius, 2)
+    return round(celsius + 273.15, 2)
+
+
+def _convert_speed(mps, units):
+    return round(mps * 2.23694, 2) if units == "imperial" else round(mps, 2)
+
+
+def _weather_entry(code, is_day):
+    condition_id, main, description = CONDITIONS[code]
+    return [{"id": condition_id, "main": main, "description": description, "icon": f"{code}{'d' if is_day else 'n'}"}]
+
+
+def synthetic_location(city_name):
+    """Listede olmayan şehirler için addan türetilen, her seferinde aynı kalan koordinatlar."""
+    seed = zlib.crc32(normalize_city_key(city_name).encode("utf-8"))
+    lat = (seed % 12000) / 100.0 - 60.0
+    lon = (seed // 12000 % 36000) / 100.0 - 180.0
+    return city_name.strip().title(), "XX", round(lat, 4), round(lon, 4)
+
+
+def make_onecall_payload(lat, lon, units="metric", lang="tr", now=None):
+    """
+    Verilen konum için /onecall biçiminde (current, hourly[48], daily[8]) gerçekçi bir yanıt üretir.
+    Aynı konum ve saat dilimi için içerik deterministiktir.
+    """
+    now = int(now if now is not None else time.time())
+    timezone_offset = int(round(lon / 15.0)) * 3600
+    rng = random.Random(zlib.crc32(f"{lat:.2f},{lon:.2f},{now // 3600}".encode()))
+    base_temp = 25.0 - abs(lat) * 0.4 + rng.uniform(-3, 3)
+
+    def hour_point(dt):
+        local_hour = ((dt + timezone_offset) % 86400) / 3600.0
+        is_day = 6 <= local_hour < 19
+        temp_c = base_temp + 6 * math.sin((local_hour - 9) / 24 * 2 * math.pi) + rng.uniform(-1, 1)
+        wind = rng.uniform(0.5, 9)
+        code = rng.choice(_CONDITION_CODES)
+        return {
+            "dt": dt,
+            "temp": _convert_temp(temp_c, units),
+            "feels_like": _convert_temp(temp_c - wind * 0.3, units),
+            "pressure": rng.randint(995, 1030),
+            "humidity": rng.randint(25, 95),
+            "dew_point": _convert_temp(temp_c - rng.uniform(2, 10), units),
+            "uvi": round(max(0.0, 8 * math.sin((local_hour - 6) / 13 * math.pi)) if is_day else 0.0, 2),
+            "clouds": rng.randint(0, 100),
+            "visibility": 10000,
+            "wind_speed": _convert_speed(wind, units),
+            "wind_deg": rng.randint(0, 359),
+            "wind_gust": _convert_speed(wind * 1.5, units),
+            "weather": _weather_entry(code, is_day),
+            "pop": round(rng.random(), 2),
+        }
+
+    current_dt = now - now % 600
+    current = hour_point(current_dt)
+    del current["pop"]
+    current["sunrise"] = current_dt - current_dt % 86400 + 6 * 3600 - timezone_offset
+    current["sunset"] = current["sunrise"] + 13 * 3600
+
+    hour_start = now - now % 3600
+    hourly = [hour_point(hour_start + i * 3600) for i in range(48)]
+
+    daily = []
+    day_start = now - now % 86400 + 12 * 3600 - timezone_offset
+    for i in range(8):
+        temps_c = [base_temp + rng.uniform(-6, 6) for _ in range(4)]
+        low, high = min(temps_c) - 2, max(temps_c) + 2
+        code = rng.choice(_CONDITION_CODES)
+        day = {
+            "dt": day_start + i * 86400,
+            "sunrise": day_start + i * 86400 - 6 * 3600,
+            "sunset": day_start + i * 86400 + 7 * 3600,
+            "temp": {
+                "day": _convert_temp(temps_c[0], units),
+                "min": _convert_temp(low, units),
+                "max": _convert_temp(high, units),
+                "night": _convert_temp(temps_c[1], units),
+                "eve": _convert_temp(temps_c[2], units),
+                "morn": _convert_temp(temps_c[3], units),
+            },
+            "feels_like": {
+                "day": _convert_temp(temps_c[0] - 1, units),
+                "night": _convert_temp(temps_c[1] - 1, units),
+                "eve": _convert_temp(temps_c[2] - 1, units),
+                "morn": _convert_temp(temps_c[3] - 1, units),
+            },
+            "pressure": rng.randint(995, 1030),
+            "humidity": rng.randint(25, 95),
+            "dew_point": _convert_temp(low - 2, units),
+            "wind_speed": _convert_speed(rng.uniform(0.5, 12), units),
+            "wind_deg": rng.randint(0, 359),
+            "wind_gust": _convert_speed(rng.uniform(5, 18), units),
+            "weather": _weather_entry(code, True),
+            "clouds": rng.randint(0, 100),
+            "pop": round(rng.random(), 2),
+            "uvi": round(rng.uniform(0, 9), 2),
+        }
+        daily.append(day)
+
+    return {
+        "lat": round(lat, 4),
+        "lon": round(lon, 4),
+        "timezone": f"Etc/GMT{-timezone_offset // 3600:+d}",
+        "timezone_offset": timezone_offset,
+        "current": current,
+        "hourly": hourly,
+        "daily": daily,
+    }
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1: istemcinin keep-alive bağlantıyı yeniden kullanabilmesi için
+    protocol_version = "HTTP/1.1"
+    # Başlık ve gövde ayrı yazıldığında Nagle + gecikmeli ACK her yanıta ~40 ms ekler
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        mock = self.server.mock
+        mock.record_connection()
+        if mock.connect_latency:
+            # Yeni bağlantının TCP+TLS el sıkışma maliyetini taklit eder
+            time.sleep(mock.connect_latency)
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        mock = self.server.mock
+        mock.record_request()
+        fault, delay = mock.plan_response()
+        if delay:
+            time.sleep(delay)
+        if fault == "error":
+            status = mock.choice((500, 502, 503))
+            self._send_json(status, {"cod": str(status), "message": "Internal error"})
+            return
+        if fault == "rate_limited":
+            self._send_json(429, {"cod": 429, "message": "Your account is temporary blocked due to exceeding of requests limitation"},
+                            headers={"Retry-After": str(mock.retry_after)})
+            return
+
+        parsed = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        if "appid" not in query:
+            self._send_json(401, {"cod": 401, "message": "Invalid API key. Please see https://openweathermap.org/faq#error401 for more info."})
+        elif parsed.path == "/geo/1.0/direct":
+            self._send_json(200, mock.geocode(query.get("q", "")))
+        elif parsed.path == "/geo/1.0/reverse":
+            try:
+                lat, lon = float(query["lat"]), float(query["lon"])
+            except (KeyError, ValueError):
+                self._send_json(400, {"cod": "400", "message": "wrong latitude"})
+                return
+            self._send_json(200, mock.reverse_geocode(lat, lon))
+        elif parsed.path == "/data/2.5/onecall":
+            try:
+                lat, lon = float(query["lat"]), float(query["lon"])
+            except (KeyError, ValueError):
+                self._send_json(400, {"cod": "400", "message": "wrong latitude"})
+                return
+            self._send_json(200, make_onecall_payload(lat, lon, query.get("units", "standard"), query.get("lang", "en")))
+        else:
+            self._send_json(404, {"cod": "404", "message": "Internal error"})
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _MockHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Zaman aşımına uğrayıp bağlantıyı kapatan istemciler (yavaş yanıt senaryosu) beklenen durumdur
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return
+        super().handle_error(request, client_address)
+
+
+class MockOpenWeatherServer:
+    """
+    Arka planda çalışan yerel OpenWeather taklidi. `with` bloğu ile başlatılıp durdurulabilir;
+    WeatherAPI'ye base_url ve geocoding_url olarak verilir.
+
+    Hata enjeksiyonu (her istek için bağımsız olasılıklar):
+    - error_rate: 500/502/503 yanıtı
+    - rate_limit_rate: `retry_after` saniyelik Retry-After başlığıyla 429 yanıtı
+    - slow_rate: yanıttan önce fazladan `slow_latency` saniye bekleme
+    `latency_jitter`, her yanıtın gecikmesini latency * (1 ± jitter) aralığında rastgele dağıtır.
+    Aynı `seed` ile hatalar aynı sırayla oluşur.
+    """
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, synthetic_cities=False, connect_latency=0.0,
+                 error_rate=0.0, rate_limit_rate=0.0, retry_after=1, slow_rate=0.0, slow_latency=2.0,
+                 latency_jitter=0.0, seed=None):
+        self.latency = latency
+        self.connect_latency = connect_latency
+        # True ise listede olmayan her ad için addan türetilmiş bir konum döndürülür
+        self.synthetic_cities = synthetic_cities
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+        self.latency_jitter = latency_jitter
+        self.connections = 0
+        self.requests = 0
+        self.faults = {"error": 0, "rate_limited": 0, "slow": 0}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = _MockHTTPServer((host, port), _MockHandler)
+        self._httpd.mock = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def base_url(self):
+        return f"{self.url}/data/2.5"
+
+    @property
+    def geocoding_url(self):
+        return f"{self.url}/geo/1.0"
+
+    def geocode(self, city_name):
+        key = normalize_city_key(city_name)
+        if key in CITIES:
+            name, country, lat, lon = CITIES[key]
+        elif self.synthetic_cities and key and "gecersiz" not in key:
+            name, country, lat, lon = synthetic_location(city_name)
+        else:
+            return []
+        return [{"name": name, "local_names": {"tr": name}, "lat": lat, "lon": lon, "country": country}]
+
+    def reverse_geocode(self, lat, lon):
+        """Listedeki en yakın yerleşim; REVERSE_GEOCODE_RADIUS_KM içinde yoksa (sentetik modda koordinattan bir ad)."""
+        nearest = min(CITIES.values(), key=lambda city: haversine_km(lat, lon, city[2], city[3]))
+        if haversine_km(lat, lon, nearest[2], nearest[3]) <= REVERSE_GEOCODE_RADIUS_KM:
+            name, country, lat, lon = nearest
+        elif self.synthetic_cities:
+            name, country = f"Konum {lat:.2f} {lon:.2f}", "XX"
+        else:
+            return []
+        return [{"name": name, "local_names": {"tr": name}, "lat": lat, "lon": lon, "country": country}]
+
+    def record_connection(self):
+        with self._lock:
+            self.connections += 1
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def choice(self, options):
+        with self._lock:
+            return self._rng.choice(options)
+
+    def plan_response(self):
+        """
+        Bir istek için (hata türü ya da None, beklenecek süre) döndürür. Hata türleri "error" ve "rate_limited"dir.
+        """
+        with self._lock:
+            delay = self.latency
+            if self.latency_jitter:
+                delay *= self._rng.uniform(1 - self.latency_jitter, 1 + self.latency_jitter)
+            if self._rng.random() < self.slow_rate:
+                self.faults["slow"] += 1
+                delay += self.slow_latency
+            roll = self._rng.random()
+            if roll < self.error_rate:
+                fault = "error"
+            elif roll < self.error_rate + self.rate_limit_rate:
+                fault = "rate_limited"
+            else:
+                fault = None
+            if fault:
+                self.faults[fault] += 1
+        return fault, delay
+
+    def reset_stats(self):
+        with self._lock:
+            self.connections = 0
+            self.requests = 0
+            self.faults = dict.fromkeys(self.faults, 0)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Sunucuyu çağıran thread'de, kesilene kadar çalıştırır."""
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+class MockServerProcess:
+    """
+    Taklit sunucuyu ayrı bir Python sürecinde çalıştırır. Aynı süreçteki sunucu, ölçülen istemciyle
+    GIL'i paylaştığı için yüksek eşzamanlılıkta verimi düşük gösterir; benchmark'lar bunu kullanır.
+    """
+    def __init__(self, latency=0.0, synthetic_cities=False, connect_latency=0.0, host="127.0.0.1",
+                 error_rate=0.0, rate_limit_rate=0.0, retry_after=1, slow_rate=0.0, slow_latency=2.0,
+                 latency_jitter=0.0, seed=None):
+        self.args = [sys.executable, os.path.abspath(__file__), "--host", host, "--port", "0",
+                     "--latency", str(latency), "--connect-latency", str(connect_latency),
+                     "--error-rate", str(error_rate), "--rate-limit-rate", str(rate_limit_rate),
+                     "--retry-after", str(retry_after), "--slow-rate", str(slow_rate),
+                     "--slow-latency", str(slow_latency), "--latency-jitter", str(latency_jitter)]
+        if seed is not None:
+            self.args += ["--seed", str(seed)]
+        if synthetic_cities:
+            self.args.append("--synthetic-cities")
+        self.url = None
+        self._process = None
+
+    @property
+    def base_url(self):
+        return f"{self.url}/data/2.5"
+
+    @property
+    def geocoding_url(self):
+        return f"{self.url}/geo/1.0"
+
+    def start(self):
+        self._process = subprocess.Popen(self.args, stdout=subprocess.PIPE, text=True, encoding="utf-8")
+        # İlk satır: "Taklit sunucu çalışıyor: http://host:port"
+        self.url = self._process.stdout.readline().rsplit(" ", 1)[-1].strip()
+        return self
+
+    def stop(self):
+        self._process.terminate()
+        self._process.wait()
+        self._process.stdout.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Yerel OpenWeather taklit sunucusu")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Her yanıttan önce beklenecek süre (saniye)")
+    parser.add_argument("--connect-latency", type=float, default=0.0, help="Her yeni bağlantıda beklenecek süre (el sıkışma taklidi)")
+    parser.add_argument("--synthetic-cities", action="store_true", help="Bilinmeyen şehir adları için de konum üret")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="Gecikmenin rastgele sapma oranı (0.5: latency * 0.5..1.5)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="5xx yanıt olasılığı")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="429 yanıt olasılığı")
+    parser.add_argument("--retry-after", type=int, default=1, help="429 yanıtlarındaki Retry-After (saniye)")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="Yavaş yanıt olasılığı")
+    parser.add_argument("--slow-latency", type=float, default=2.0, help="Yavaş yanıtlara eklenen süre (saniye)")
+    parser.add_argument("--seed", type=int, default=None, help="Hata enjeksiyonunun rastgele tohumu")
+    args = parser.parse_args()
+
+    server = MockOpenWeatherServer(args.host, args.port, args.latency, args.synthetic_cities, args.connect_latency,
+                                   error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate,
+                                   retry_after=args.retry_after, slow_rate=args.slow_rate,
+                                   slow_latency=args.slow_latency, latency_jitter=args.latency_jitter, seed=args.seed)
+    print(f"Taklit sunucu çalışıyor: {server.url}", flush=True)
+    print(f"  OPENWEATHER_BASE_URL={server.base_url}")
+    print(f"  OPENWEATHER_GEOCODING_URL={server.geocoding_url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,115 @@
+# requestScheduler.py
+"""
+Arayüzün arka plan isteklerini çalıştıran küçük zamanlayıcı. Aynı anahtarlı eşzamanlı istekleri
+tek çekimde birleştirir, yeni bir aramanın eskilerini geçersiz kılmasını ve kapanışta
+bekleyen işlerin hemen iptalini sağlar.
+"""
+
+import queue
+import threading
+import traceback
+
+from konumBazli import CancelToken, RequestCancelled
+from config import REQUEST_WORKERS
+
+
+class _Job:
+    __slots__ = ("key", "token", "callbacks")
+
+    def __init__(self, key):
+        self.key = key
+        self.token = CancelToken()
+        self.callbacks = []
+
+
+class RequestScheduler:
+    """
+    submit(key, fn, callback) ile gönderilen `fn(cancel_token)` bir worker thread'de çalışır ve
+    sonucu `callback(result)` ile, yine worker thread'de teslim edilir.
+
+    - Aynı anahtarla süren bir iş varsa yeni çekim başlatılmaz; callback o işe bağlanır.
+    - supersede=True (varsayılan) ile gönderilen iş, süren diğer işleri geçersiz kılar:
+      iptal jetonları tetiklenir (yeniden deneme beklemeleri hemen biter) ve sonuçları atılır.
+    - shutdown() bütün işleri iptal eder ve yeni iş kabul etmez.
+
+    Worker'lar gerektikçe (en fazla `max_workers`) açılan daemon thread'lerdir. ThreadPoolExecutor'ın
+    thread'leri süreç çıkışında beklenir; takılan bir HTTP isteği (bağlantı + okuma zaman aşımı) pencere
+    kapandıktan sonra süreci saniyelerce açık tutardı. Daemon worker'lar çıkışı bekletmez.
+    """
+    def __init__(self, max_workers=REQUEST_WORKERS):
+        self.max_workers = max_workers
+        self._tasks = queue.SimpleQueue()  # (job, fn); None worker'ı durdurur
+        self._workers = []
+        self._inflight = {}  # anahtar -> _Job
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(self, key, fn, callback, supersede=True):
+        with self._lock:
+            if self._closed:
+                return None
+            if supersede:
+                for other_key in [k for k in self._inflight if k != key]:
+                    self._inflight.pop(other_key).token.cancel()
+
+            job = self._inflight.get(key)
+            if job is None:
+                job = _Job(key)
+                self._inflight[key] = job
+                self._tasks.put((job, fn))
+                if len(self._workers) < self.max_workers:
+                    self._start_worker()
+            if callback not in job.callbacks:
+                job.callbacks.append(callback)
+            return job.token
+
+    def _start_worker(self):
+        thread = threading.Thread(target=self._work, name=f"weather-request-{len(self._workers)}", daemon=True)
+        self._workers.append(thread)
+        thread.start()
+
+    def _work(self):
+        while True:
+            task = self._tasks.get()
+            # Kapanıştan sonra kuyrukta kalan işler çalıştırılmaz
+            if task is None or self._closed:
+                return
+            self._run(*task)
+
+    def _run(self, job, fn):
+        result = None
+        try:
+            # Sırada beklerken geçersiz kılınan iş hiç başlatılmaz
+            job.token.raise_if_cancelled()
+            result = fn(job.token)
+        except RequestCancelled:
+            pass
+        except Exception:
+            print(f"Arka plan isteği başarısız oldu: {job.key}")
+            traceback.print_exc()
+        finally:
+            with self._lock:
+                if self._inflight.get(job.key) is job:
+                    del self._inflight[job.key]
+                # Geçersiz kılınan işlerin sonuçları teslim edilmez
+                callbacks = [] if job.token.cancelled else list(job.callbacks)
+        if result is not None:
+            for callback in callbacks:
+                callback(result)
+
+    def cancel_all(self):
+        with self._lock:
+            for job in self._inflight.values():
+                job.token.cancel()
+            self._inflight.clear()
+
+    def pending(self):
+        with self._lock:
+            return len(self._inflight)
+
+    def shutdown(self):
+        with self._lock:
+            self._closed = True
+        self.cancel_all()
+        for _ in self._workers:
+            self._tasks.put(None)
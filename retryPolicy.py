@@ -0,0 +1,130 @@
+# retryPolicy.py
+"""
+Başarısız HTTP isteklerinin yeniden deneme kararı (RetryPolicy) ve uç nokta başına devre kesici
+(CircuitBreaker). requests yalnızca hata sınıflandırılırken yüklenir.
+"""
+
+import random
+import threading
+import time
+
+from config import RETRY_MAX_ATTEMPTS, RETRY_BASE_DELAY, RETRY_MAX_DELAY, RETRY_DEADLINE
+from config import CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT
+
+
+class RetryPolicy:
+    """
+    Başarısız bir isteğin tekrar denenip denenmeyeceğine ve ne kadar bekleneceğine karar verir.
+
+    Yalnızca geçici hatalar (bağlantı hatası, zaman aşımı, 429 ve 5xx) yeniden denenir; 401 veya 404
+    gibi yanıtlar hemen başarısız olur. Bekleme süresi tam jitter'lı üstel geri çekilmedir
+    (0 ile min(max_delay, base_delay * 2**deneme) arası rastgele), böylece istemciler aynı anda
+    yeniden denemez. Sunucu Retry-After gönderdiyse ona uyulur. Toplam süre `deadline`'ı
+    aşacaksa tekrar denenmez; her denemenin zaman aşımı da kalan süreyle sınırlanır (attempt_timeout).
+    """
+    RETRYABLE_STATUS = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+    def __init__(self, max_attempts=RETRY_MAX_ATTEMPTS, base_delay=RETRY_BASE_DELAY, max_delay=RETRY_MAX_DELAY,
+                 deadline=RETRY_DEADLINE, retryable_status=None, rng=None):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retryable_status = frozenset(retryable_status) if retryable_status is not None else self.RETRYABLE_STATUS
+        self._rng = rng or random.Random()
+
+    def is_retryable(self, error):
+        import requests
+        response = getattr(error, "response", None)
+        if response is not None:
+            return response.status_code in self.retryable_status
+        return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                                  requests.exceptions.ChunkedEncodingError))
+
+    @staticmethod
+    def retry_after(error):
+        """Yanıttaki Retry-After başlığını saniyeye çevirir; yoksa ya da okunamazsa None."""
+        response = getattr(error, "response", None)
+        value = response.headers.get("Retry-After") if response is not None else None
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        from email.utils import parsedate_to_datetime
+
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def next_delay(self, attempt, error, elapsed):
+        """
+        `attempt` (0'dan başlar) numaralı deneme `error` ile başarısız olduğunda beklenecek süreyi
+        döndürür; tekrar denenmemesi gerekiyorsa None.
+        """
+        if attempt + 1 >= self.max_attempts or not self.is_retryable(error):
+            return None
+        delay = self.retry_after(error)
+        if delay is None:
+            delay = self._rng.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        if self.deadline is not None and elapsed + delay > self.deadline:
+            return None
+        return delay
+
+    def attempt_timeout(self, timeout, elapsed):
+        """
+        Yeni denemenin (bağlantı, okuma) zaman aşımını `deadline`'dan kalan süreyle sınırlar;
+        süre dolmuşsa None (deneme yapılmaz).
+        """
+        if self.deadline is None:
+            return timeout
+        remaining = self.deadline - elapsed
+        if remaining <= 0:
+            return None
+        if isinstance(timeout, tuple):
+            return tuple(min(part, remaining) for part in timeout)
+        return min(timeout, remaining)
+
+
+class CircuitBreaker:
+    """
+    Uç nokta başına devre kesici. Art arda `failure_threshold` geçici hatadan sonra devre açılır ve
+    `reset_timeout` saniye boyunca istekler hiç denenmeden reddedilir; böylece bir kesinti sırasında
+    thread'ler geri çekilme beklemelerinde birikmez. Süre dolunca tek bir deneme isteğine izin verilir
+    (yarı açık): başarılı olursa devre kapanır, başarısız olursa yeniden açılır.
+    """
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold=CIRCUIT_FAILURE_THRESHOLD, reset_timeout=CIRCUIT_RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            if now - self._opened_at >= self.reset_timeout:
+                # Deneme isteği bu çağrıya verilir; sonuç gelene kadar (en fazla reset_timeout) diğerleri reddedilir
+                self.state = self.HALF_OPEN
+                self._opened_at = now
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
@@ -0,0 +1,383 @@
+# weatherCache.py
+"""
+Hava durumu yanıtlarının önbellekleri: /onecall yanıtları için bellek içi ya da SQLite arka uçlu
+ResponseCache, yakındaki konumların kayıtlarını bulan NearbyIndex ve her şehrin son başarılı
+sonucunu diskte tutan SnapshotStore. WeatherAPI varsayılan önbelleklerini buradan kurar.
+"""
+
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict, namedtuple
+
+from konumBazli import Location, normalize_city_key
+from config import WEATHER_CACHE_TTL, WEATHER_CACHE_STALE_TTL, WEATHER_CACHE_SIZE, WEATHER_CACHE_DB
+from config import NEARBY_RADIUS_KM
+from config import SNAPSHOT_DB, SNAPSHOT_MAX_BYTES
+import metrics
+
+
+class MemoryCacheBackend:
+    """ResponseCache için süreç içi, boyutu sınırlı LRU arka uç."""
+    def __init__(self, maxsize=WEATHER_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # anahtar -> (stored_at, payload)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, stored_at, payload):
+        with self._lock:
+            self._entries[key] = (stored_at, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+class SQLiteCacheBackend:
+    """
+    ResponseCache için SQLite arka ucu. Aynı makinedeki birden çok süreç aynı dosyayı
+    paylaşarak önbelleği ortak kullanabilir. Yanıtlar zlib ile sıkıştırılmış JSON olarak saklanır.
+    """
+    # Her set() çağrısında değil, bu kadar yazmada bir fazlalık kayıtlar silinir
+    PRUNE_EVERY = 32
+
+    def __init__(self, path, maxsize=WEATHER_CACHE_SIZE):
+        self.path = path
+        self.maxsize = maxsize
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(path, timeout=5, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS weather_cache (key TEXT PRIMARY KEY, stored_at REAL NOT NULL, payload BLOB NOT NULL)")
+
+    def get(self, key):
+        with self._lock:
+            row = self._conn.execute("SELECT stored_at, payload FROM weather_cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(zlib.decompress(row[1]))
+
+    def set(self, key, stored_at, payload):
+        blob = zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO weather_cache (key, stored_at, payload) VALUES (?, ?, ?)", (key, stored_at, blob))
+            self._writes += 1
+            if self._writes % self.PRUNE_EVERY == 0:
+                self._conn.execute(
+                    "DELETE FROM weather_cache WHERE key NOT IN (SELECT key FROM weather_cache ORDER BY stored_at DESC LIMIT ?)",
+                    (self.maxsize,))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class ResponseCache:
+    """
+    /onecall yanıtları için (yuvarlanmış enlem/boylam, birim, dil) anahtarlı önbellek.
+
+    `ttl` saniyeden genç kayıtlar doğrudan döner. `ttl` ile `ttl + stale_ttl` arasındaki
+    kayıtlar da hemen döner (stale-while-revalidate), ama arka planda yenilenir. Daha eski
+    kayıtlar yokmuş gibi davranılır. Sayaçlara stats() ile erişilir.
+    """
+    def __init__(self, backend=None, ttl=WEATHER_CACHE_TTL, stale_ttl=WEATHER_CACHE_STALE_TTL):
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._counters = {"hits": 0, "stale_hits": 0, "misses": 0, "nearby_hits": 0, "refreshes": 0, "refresh_errors": 0}
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(lat, lon, units, lang):
+        # 2 ondalık ~1 km; aynı şehir için küçük koordinat farkları aynı kayda düşer
+        return f"{lat:.2f},{lon:.2f},{units},{lang}"
+
+    def _count(self, name):
+        with self._lock:
+            self._counters[name] += 1
+        metrics.inc("response_cache_events_total", event=name)
+
+    def lookup(self, key):
+        """
+        (payload, is_stale) döndürür. Kullanılabilir kayıt yoksa payload None'dır.
+        """
+        entry = self.backend.get(key)
+        if entry is not None:
+            stored_at, payload = entry
+            age = time.time() - stored_at
+            if age <= self.ttl:
+                self._count("hits")
+                return payload, False
+            if age <= self.ttl + self.stale_ttl:
+                self._count("stale_hits")
+                return payload, True
+        self._count("misses")
+        return None, False
+
+    def lookup_nearest(self, keys):
+        """
+        `keys` (yakından uzağa sıralı, başka konumların anahtarları) içinden TTL'i dolmamış ilk kaydın
+        yanıtını döndürür; yoksa None. Komşu konumun bayat kaydı kullanılmaz.
+        """
+        for key in keys:
+            entry = self.backend.get(key)
+            if entry is not None and time.time() - entry[0] <= self.ttl:
+                self._count("nearby_hits")
+                return entry[1]
+        return None
+
+    def store(self, key, payload):
+        self.backend.set(key, time.time(), payload)
+
+    def begin_refresh(self, key):
+        """Anahtar için başka bir yenileme sürmüyorsa True döndürür ve yenilemeyi kaydeder."""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self._counters["refreshes"] += 1
+        metrics.inc("response_cache_events_total", event="refreshes")
+        return True
+
+    def end_refresh(self, key, payload):
+        """Yenilemeyi bitirir; kayıt yazılamasa da anahtar serbest kalır, sonraki bayat okumada yeniden denenir."""
+        stored = False
+        try:
+            if payload is not None:
+                self.store(key, payload)
+                stored = True
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+                if not stored:
+                    self._counters["refresh_errors"] += 1
+            if not stored:
+                metrics.inc("response_cache_events_total", event="refresh_errors")
+
+    def _refresh_in_background(self, key, refresh):
+        payload = None
+        try:
+            payload = refresh()
+        finally:
+            self.end_refresh(key, payload)
+
+    def get_or_fetch(self, key, fetch, refresh=None, allow_stale=True, nearby=None):
+        """
+        Önbellekteki yanıtı döndürür; yoksa `fetch()` ile çekip saklar.
+        Bayat kayıt arka plandaki bir thread'de `refresh()` (verilmezse `fetch()`) ile yenilenir.
+        allow_stale=False ise bayat kayıt yerine hemen `fetch()` yapılır; çekim başarısız olursa
+        bayat kayıt döner.
+        `nearby()` verilirse kullanılabilir kayıt yokken çekimden önce çağrılır ve döndürdüğü komşu
+        anahtarlardan taze olanın yanıtı, bu anahtara yazılmadan döner (bkz. lookup_nearest).
+        """
+        payload, is_stale = self.lookup(key)
+        if payload is not None and (allow_stale or not is_stale):
+            if is_stale and self.begin_refresh(key):
+                refresh = refresh or fetch
+                threading.Thread(target=self._refresh_in_background, args=(key, refresh), daemon=True).start()
+            return payload
+
+        if nearby is not None:
+            shared = self.lookup_nearest(nearby())
+            if shared is not None:
+                return shared
+
+        fresh = fetch()
+        if fresh is not None:
+            self.store(key, fresh)
+            return fresh
+        return payload
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._counters)
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+        # Komşu konumdan karşılanan istekler de kaydı olmadığı için önce ıska sayılmıştır
+        stats["hit_rate"] = (stats["hits"] + stats["stale_hits"] + stats["nearby_hits"]) / lookups if lookups else 0.0
+        return stats
+
+
+# Ortalama Dünya yarıçapı ve bir enlem derecesinin uzunluğu (km)
+EARTH_RADIUS_KM = 6371.0
+_KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """İki konum arasındaki büyük çember uzaklığı (km)."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = (math.sin((phi2 - phi1) / 2) ** 2
+         + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+class NearbyIndex:
+    """
+    Yanıtı önbelleğe yazılmış konumların ızgara dizini: anahtar -> (enlem, boylam).
+    Dünya kenarı `cell_km` olan enlem/boylam derecesi hücrelerine bölünür; nearby() yalnızca yarıçapın
+    kestiği hücrelerdeki kayıtlara bakar, böylece sorgu maliyeti toplam kayıt sayısından bağımsızdır.
+    En fazla `maxsize` konum tutulur, en eski eklenen önce düşer. Dizin yalnızca konumları bilir;
+    kaydın hâlâ taze olup olmadığına ResponseCache karar verir.
+    """
+    def __init__(self, cell_km=NEARBY_RADIUS_KM, maxsize=WEATHER_CACHE_SIZE):
+        self.cell_deg = max(cell_km, 0.1) / _KM_PER_DEGREE
+        self.maxsize = maxsize
+        self._columns = math.ceil(360 / self.cell_deg)
+        self._cells = {}  # (satır, sütun) -> {anahtar: (enlem, boylam)}
+        self._entries = OrderedDict()  # anahtar -> (satır, sütun)
+        self._lock = threading.Lock()
+
+    def _cell(self, lat, lon):
+        return math.floor((lat + 90) / self.cell_deg), math.floor(((lon + 180) % 360) / self.cell_deg)
+
+    def add(self, lat, lon, key):
+        with self._lock:
+            self._remove(key)
+            cell = self._cell(lat, lon)
+            self._cells.setdefault(cell, {})[key] = (lat, lon)
+            self._entries[key] = cell
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key):
+        cell = self._entries.pop(key, None)
+        if cell is not None:
+            bucket = self._cells[cell]
+            del bucket[key]
+            if not bucket:
+                del self._cells[cell]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def nearby(self, lat, lon, radius_km):
+        """`radius_km` içindeki kayıtları yakından uzağa [(uzaklık_km, anahtar), ...] olarak döndürür."""
+        radius_deg = radius_km / _KM_PER_DEGREE
+        first_row = math.floor((lat - radius_deg + 90) / self.cell_deg)
+        last_row = math.floor((lat + radius_deg + 90) / self.cell_deg)
+        # Boylam dereceleri kutuplara doğru kısalır; aralık, yarıçapın kestiği en yüksek enlemde hesaplanır.
+        # Daire kutbu içeriyorsa her boylam aralıktadır
+        max_lat = abs(lat) + radius_deg
+        span = radius_deg / math.cos(math.radians(max_lat)) if max_lat < 90 else 360
+        if 2 * span >= 360 - 2 * self.cell_deg:
+            columns = range(self._columns)
+        else:
+            # Sütun sayısı 360'ı tam bölmeyebilir; 180. meridyenden sarılan sütunlar için birer hücre pay bırakılır
+            first = math.floor((lon - span + 180) / self.cell_deg) - 1
+            last = math.floor((lon + span + 180) / self.cell_deg) + 1
+            columns = {column % self._columns for column in range(first, last + 1)}
+        found = []
+        with self._lock:
+            for row in range(first_row, last_row + 1):
+                for column in columns:
+                    for key, (other_lat, other_lon) in self._cells.get((row, column), {}).items():
+                        distance = haversine_km(lat, lon, other_lat, other_lon)
+                        if distance <= radius_km:
+                            found.append((distance, key))
+        found.sort()
+        return found
+
+
+class Snapshot(namedtuple("Snapshot", ["city", "location", "units", "weather", "stored_at"])):
+    """Bir şehrin son başarılı sonucu: çözümlenmiş konum, yanıtın birimi ve /onecall yanıtı."""
+    __slots__ = ()
+
+    @property
+    def age(self):
+        return time.time() - self.stored_at
+
+
+class SnapshotStore:
+    """
+    Her şehrin son başarılı sonucunu SQLite dosyasında saklar; ağ yokken ve açılışta
+    ilk veri olarak kullanılır. Yanıtlar zlib ile sıkıştırılmış JSON'dur. Sıkıştırılmış
+    yanıtların toplamı `max_bytes`'ı aşınca en eski kayıtlar silinir.
+    """
+    def __init__(self, path=SNAPSHOT_DB, max_bytes=SNAPSHOT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._saved_dt = {}  # anahtar -> son kaydedilen current.dt; aynı veri tekrar yazılmaz
+        self._conn = sqlite3.connect(path, timeout=5, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS snapshots (key TEXT PRIMARY KEY, city TEXT NOT NULL, lat REAL, lon REAL, name TEXT, "
+            "country TEXT, units TEXT NOT NULL, stored_at REAL NOT NULL, size INTEGER NOT NULL, payload BLOB NOT NULL)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS snapshots_stored_at ON snapshots (stored_at)")
+
+    def save(self, city_name, location, units, weather_data):
+        key = normalize_city_key(city_name)
+        dt = weather_data.get("current", {}).get("dt")
+        if dt is not None and self._saved_dt.get(key) == (dt, units):
+            return
+        blob = zlib.compress(json.dumps(weather_data, separators=(",", ":")).encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO snapshots (key, city, lat, lon, name, country, units, stored_at, size, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, city_name, location.lat, location.lon, location.name, location.country, units, time.time(), len(blob), blob))
+            # En yeniden eskiye biriken boyut sınırı aşan kayıtlar silinir
+            self._conn.execute(
+                "DELETE FROM snapshots WHERE key IN (SELECT key FROM (SELECT key, SUM(size) OVER "
+                "(ORDER BY stored_at DESC ROWS UNBOUNDED PRECEDING) AS total FROM snapshots) WHERE total > ?)",
+                (self.max_bytes,))
+            self._saved_dt[key] = (dt, units)
+
+    def _snapshot(self, row):
+        if row is None:
+            return None
+        city, lat, lon, name, country, units, stored_at, blob = row
+        return Snapshot(city, Location(lat, lon, name, country), units, json.loads(zlib.decompress(blob)), stored_at)
+
+    def load(self, city_name):
+        """Şehrin son anlık görüntüsü; yoksa None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT city, lat, lon, name, country, units, stored_at, payload FROM snapshots WHERE key = ?",
+                (normalize_city_key(city_name),)).fetchone()
+        return self._snapshot(row)
+
+    def latest(self):
+        """En son kaydedilen anlık görüntü (açılışta gösterilecek şehir); yoksa None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT city, lat, lon, name, country, units, stored_at, payload FROM snapshots ORDER BY stored_at DESC LIMIT 1").fetchone()
+        return self._snapshot(row)
+
+    def size(self):
+        """(kayıt sayısı, sıkıştırılmış toplam bayt)"""
+        with self._lock:
+            count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM snapshots").fetchone()
+        return count, total
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def create_snapshot_store():
+    """config'teki SNAPSHOT_DB dosyasıyla SnapshotStore oluşturur; SNAPSHOT_DB None ise anlık görüntü tutulmaz."""
+    return SnapshotStore(SNAPSHOT_DB) if SNAPSHOT_DB else None
+
+
+def create_response_cache():
+    """config'e göre bellek içi ya da (WEATHER_CACHE_DB verilmişse) SQLite tabanlı önbellek oluşturur."""
+    backend = SQLiteCacheBackend(WEATHER_CACHE_DB) if WEATHER_CACHE_DB else MemoryCacheBackend()
+    return ResponseCache(backend)